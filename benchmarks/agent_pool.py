@@ -0,0 +1,69 @@
+"""
+Benchmark — agent construction cost with and without the agent pool.
+
+Builds the full set of agents a concurrent campaign needs, N times over,
+once with fresh ``create_*_agent()`` calls and once borrowing from an
+``AgentPool`` (returning them after each "campaign"):
+
+    GROQ_API_KEY=dummy python -m benchmarks.agent_pool --campaigns 20
+
+No LLM calls are made; only setup cost is measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.agents import (
+    AgentPool,
+    create_art_director_agent,
+    create_copywriter_agent,
+    create_manager_agent,
+    create_research_agent,
+)
+
+# Agents a 4-channel concurrent campaign builds
+CAMPAIGN_FACTORIES = [
+    create_research_agent,
+    create_research_agent,
+    create_copywriter_agent,
+    *[create_copywriter_agent] * 4,
+    create_art_director_agent,
+    create_manager_agent,
+]
+
+
+def build_fresh(campaigns: int) -> float:
+    start = time.perf_counter()
+    for _ in range(campaigns):
+        [factory() for factory in CAMPAIGN_FACTORIES]
+    return time.perf_counter() - start
+
+
+def build_pooled(campaigns: int) -> float:
+    pool = AgentPool()
+    start = time.perf_counter()
+    for _ in range(campaigns):
+        agents = [pool.acquire(factory) for factory in CAMPAIGN_FACTORIES]
+        for agent in agents:
+            pool.release(agent)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--campaigns", type=int, default=20)
+    args = parser.parse_args()
+
+    fresh = build_fresh(args.campaigns)
+    pooled = build_pooled(args.campaigns)
+    per = 1000 / args.campaigns
+    print(f"campaigns:        {args.campaigns}")
+    print(f"fresh agents:     {fresh * per:8.2f} ms/campaign")
+    print(f"pooled agents:    {pooled * per:8.2f} ms/campaign")
+    print(f"speed-up:         {fresh / pooled:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark — manager prompt size with and without context compaction.
+
+Runs a concurrent campaign graph with canned, realistically sized stage
+outputs (no LLM calls), lets the copy merge and context digest steps run
+for real, and compares the manager's task prompt built from the raw
+upstream outputs with the one built from the digest:
+
+    GROQ_API_KEY=dummy python -m benchmarks.context_compaction --channels 4
+
+Tokens are estimated at ~4 characters each; the agent's system prompt is
+the same either way and is left out.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+from crewai.utilities.formatter import aggregate_raw_outputs_from_task_outputs
+
+from src.agents.rate_limiter import estimate_tokens
+from src.models import CampaignChannel, CampaignRequest, CopyTone
+from src.tasks.campaign_tasks import ContextDigestTask, CopyMergeTask
+from src.workflow.crew_workflow import CampaignCrew
+from src.workflow.scheduler import DagScheduler
+
+
+def _bullets(topic: str, count: int, sentences: int = 3) -> str:
+    return "\n".join(
+        f"- **{topic} {i}:** "
+        + " ".join(
+            f"Sentence {s} about {topic.lower()} {i} explains why it matters "
+            "for the launch, with supporting numbers and an example."
+            for s in range(1, sentences + 1)
+        )
+        for i in range(1, count + 1)
+    )
+
+
+def canned_output(task: Task) -> str:
+    """Markdown of the size each stage typically produces."""
+    name = task.name
+    if name == "market_research":
+        return (
+            "# Market Research\n\n## Trends\n" + _bullets("Trend", 6)
+            + "\n\n## Personas\n" + _bullets("Persona", 2, 6)
+            + "\n\n## Opportunities\n" + _bullets("Angle", 3)
+        )
+    if name == "competitor_analysis":
+        return "# Competitors\n\n## Profiles\n" + _bullets("Competitor", 3, 5) + (
+            "\n\n## Gaps\n" + _bullets("Gap", 4)
+        )
+    if name == "copywriting_core":
+        return (
+            "## Tagline\n\"Breathe smarter, live better.\"\n\n"
+            "**Elevator pitch:** AeroFlow Pro learns your home's air. It "
+            "cleans quietly before you notice a problem.\n\n"
+            "## Email subject lines\n" + _bullets("Subject", 5, 1)
+            + "\n\n## Hashtags\n#CleanAir #SmartHome #AeroFlow #BreatheEasy"
+        )
+    if name.startswith("copywriting_"):
+        return (
+            "Headline: Clean air that thinks ahead\n"
+            "Sub-headline: Smart purification for busy homes\n"
+            "Body: " + " ".join(
+                f"Paragraph sentence {i} describing a benefit in detail."
+                for i in range(12)
+            )
+            + "\nCTA: Pre-order now"
+        )
+    if name == "visual_direction":
+        return (
+            "## Visual identity\n" + _bullets("Palette note", 4)
+            + "\n\n## Key visual concepts\n" + _bullets("Concept", 3, 4)
+            + "\n\n## Image prompts\n" + _bullets("Prompt", 3, 5)
+        )
+    return f"{name} output"
+
+
+def run_graph(crew: CampaignCrew) -> None:
+    def runner(task: Task, context: str) -> TaskOutput:
+        if isinstance(task, (CopyMergeTask, ContextDigestTask)):
+            return task.execute_sync()
+        return TaskOutput(
+            description=task.description,
+            name=task.name,
+            raw=canned_output(task),
+            agent="canned",
+        )
+
+    DagScheduler(crew.tasks, runner=runner).run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=4)
+    args = parser.parse_args()
+
+    channels = list(CampaignChannel)[: args.channels]
+    crew = CampaignCrew(
+        CampaignRequest(
+            product_name="AeroFlow Pro",
+            product_description="A smart air purifier that learns your home.",
+            target_audience="Health-conscious urban families",
+            campaign_goals="Drive pre-orders ahead of launch",
+            channels=channels,
+            brand_voice=CopyTone.PROFESSIONAL,
+        )
+    )
+    if crew.digest_task is None:
+        raise SystemExit("Set COMPACT_CONTEXT=true to run this benchmark.")
+    run_graph(crew)
+    crew.release_agents()
+
+    raw_context = aggregate_raw_outputs_from_task_outputs(
+        [task.output for task in crew.digest_task.context]
+    )
+    before = estimate_tokens(crew.manager_task.description + raw_context)
+    after = estimate_tokens(
+        crew.manager_task.description + crew.digest_task.output.raw
+    )
+    print(f"channels:              {len(channels)}")
+    for name, stage in crew.digest_task.output.json_dict["compaction"].items():
+        print(
+            f"  {name:<22} {stage['source_tokens']:6,} → "
+            f"{stage['digest_tokens']:5,} tokens"
+        )
+    print(f"manager prompt before: {before:6,} tokens")
+    print(f"manager prompt after:  {after:6,} tokens")
+    print(f"reduction:             {1 - after / before:6.0%}")
+
+
+if __name__ == "__main__":
+    main()
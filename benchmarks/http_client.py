@@ -0,0 +1,115 @@
+"""
+Benchmark — live trend searches with a per-call vs the shared HTTP client.
+
+Serves Serper-shaped results from a local stand-in server and runs N
+searches through ``TrendResearchTool``, once the old way (module-level
+``httpx.post``: a new client and connection per call) and once over the
+shared keep-alive client from ``src.tools.http``:
+
+    GROQ_API_KEY=dummy python -m benchmarks.http_client --calls 200
+    GROQ_API_KEY=dummy python -m benchmarks.http_client --handshake-ms 30
+
+``--handshake-ms`` delays every new connection, standing in for the TCP
+and TLS round trips to google.serper.dev that a local socket does not pay.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from src.tools.http import close_http_client
+from src.tools.trend_research_tool import TrendResearchTool
+
+RESULTS = json.dumps(
+    {
+        "organic": [
+            {
+                "title": f"Result {i}",
+                "snippet": "Smart home air quality keeps growing.",
+                "link": f"https://example.com/{i}",
+            }
+            for i in range(10)
+        ]
+    }
+).encode()
+
+
+class SerperStandIn(BaseHTTPRequestHandler):
+    """Answers every POST with the same results over a kept-alive socket."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without this, Nagle
+    # and delayed ACKs add ~40 ms to every kept-alive request
+    disable_nagle_algorithm = True
+    handshake = 0.0
+
+    def setup(self) -> None:
+        time.sleep(self.handshake)  # once per connection
+        super().setup()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESULTS)))
+        self.end_headers()
+        self.wfile.write(RESULTS)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def per_call(tool: TrendResearchTool, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        resp = httpx.post(
+            tool.search_url, json={"q": "air purifiers", "num": 10}, timeout=15
+        )
+        resp.raise_for_status()
+        tool._format_serper_results(resp.json(), "air purifiers", "home")
+    return time.perf_counter() - start
+
+
+def shared(tool: TrendResearchTool, calls: int) -> float:
+    close_http_client()
+    start = time.perf_counter()
+    for _ in range(calls):
+        tool._live_search("air purifiers", "home")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--handshake-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    SerperStandIn.handshake = args.handshake_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SerperStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    tool = TrendResearchTool(
+        search_url=f"http://127.0.0.1:{server.server_port}/search"
+    )
+    try:
+        fresh = per_call(tool, args.calls)
+        pooled = shared(tool, args.calls)
+    finally:
+        close_http_client()
+        server.shutdown()
+
+    per = 1000 / args.calls
+    print(f"calls:            {args.calls}")
+    print(f"handshake:        {args.handshake_ms:8.2f} ms (simulated)")
+    print(f"per-call client:  {fresh * per:8.2f} ms/search")
+    print(f"shared client:    {pooled * per:8.2f} ms/search")
+    print(f"saved:            {(fresh - pooled) * per:8.2f} ms/search")
+
+
+if __name__ == "__main__":
+    main()
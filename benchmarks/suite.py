@@ -0,0 +1,438 @@
+"""
+Benchmark suite — tools, models, rendering and a full offline workflow.
+
+``run`` times every registered benchmark and writes the results as JSON;
+``compare`` diffs two result files and exits with status 1 when any
+benchmark got slower than the threshold:
+
+    python -m benchmarks.suite run --output base.json
+    python -m benchmarks.suite run --output new.json --filter tools.
+    python -m benchmarks.suite compare base.json new.json --threshold 0.15
+
+Workflow benchmarks run on the fake LLM (``LLM_BACKEND=fake``, zero
+latency) in a throwaway output directory, so no key or network is needed
+and only framework overhead is measured. Each benchmark is calibrated to
+at least ``--min-time`` seconds per sample; the median of ``--repeat``
+samples is what ``compare`` looks at.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from src.models import (
+    CampaignBrief,
+    CampaignChannel,
+    CampaignRequest,
+    CopyPackage,
+    CopyTone,
+    MarketResearch,
+    VisualDirection,
+)
+
+Benchmark = Callable[[], Callable[[], Any]]
+
+# Name → setup; a setup returns the zero-argument callable that is timed
+BENCHMARKS: dict[str, Benchmark] = {}
+
+DEFAULT_THRESHOLD = 0.15
+
+REQUEST = CampaignRequest(
+    product_name="AeroFlow Pro",
+    product_description="A smart air purifier that learns your home.",
+    target_audience="Health-conscious urban families",
+    campaign_goals="Drive pre-orders ahead of launch",
+    channels=list(CampaignChannel)[:4],
+    brand_voice=CopyTone.PROFESSIONAL,
+)
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register a setup function under ``name``."""
+
+    def register(setup: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def measure(
+    fn: Callable[[], Any], repeat: int = 5, min_time: float = 0.2
+) -> dict[str, Any]:
+    """Seconds per call of ``fn``: ``repeat`` samples of calibrated loops."""
+    fn()  # warm caches and lazy imports
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def run(
+    selected: list[str] | None = None, repeat: int = 5, min_time: float = 0.2
+) -> dict[str, Any]:
+    """Time every benchmark whose name starts with one of ``selected``."""
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if selected and not any(name.startswith(s) for s in selected):
+            continue
+        # Agents and CrewAI print progress; keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = measure(setup(), repeat, min_time)
+        print(f"{name:<32} {_human(results[name]['median']):>10}", flush=True)
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(
+    base: dict[str, Any],
+    new: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Per-benchmark median change from ``base`` to ``new``.
+
+    A benchmark is a regression when its median grew by more than
+    ``threshold`` (0.15 = 15 %) and an improvement when it shrank by as
+    much; benchmarks missing from either run are skipped.
+    """
+    rows = []
+    for name, after in new["benchmarks"].items():
+        before = base["benchmarks"].get(name)
+        if before is None:
+            continue
+        change = after["median"] / before["median"] - 1
+        if change > threshold:
+            verdict = "regression"
+        elif change < -threshold:
+            verdict = "improvement"
+        else:
+            verdict = "ok"
+        rows.append(
+            {
+                "name": name,
+                "base": before["median"],
+                "new": after["median"],
+                "change": change,
+                "verdict": verdict,
+            }
+        )
+    return rows
+
+
+# ── Benchmarks ───────────────────────────────────────────────────────
+
+
+@benchmark("tools.copy_evaluator")
+def _copy_evaluator() -> Callable[[], Any]:
+    from src.tools import CopyEvaluationTool
+
+    tool = CopyEvaluationTool()
+    text = " ".join(
+        ["Breathe smarter with AeroFlow Pro, the proven purifier."] * 40
+        + ["Pre-order now and save 20% — limited launch offer."]
+    )
+    return lambda: tool._run(copy_text=text, channel="email")
+
+
+@benchmark("tools.copy_evaluator_batch")
+def _copy_evaluator_batch() -> Callable[[], Any]:
+    from src.tools import CopyEvaluationTool
+
+    tool = CopyEvaluationTool()
+    texts = [
+        f"Variant {i}: breathe smarter with AeroFlow Pro. "
+        + ("Exclusive launch pricing, save now! " if i % 2 else "It is very nice. ")
+        + ("Pre-order today." if i % 3 else "")
+        for i in range(1000)
+    ]
+    return lambda: tool.evaluate_batch(texts, "social_media")
+
+
+@benchmark("tools.lexicon_match_large")
+def _lexicon_match_large() -> Callable[[], Any]:
+    from src.tools.lexicon import lexicon_matcher
+
+    lexicon = Path(tempfile.mkdtemp())
+    (lexicon / "banned.txt").write_text(
+        "\n".join(f"claim{i} phrase{i % 97}" for i in range(20000))
+    )
+    (lexicon / "power.txt").write_text("exclusive\nproven\nfree\nsave\nnow\n")
+    matcher = lexicon_matcher(lexicon)
+    text = (
+        "Breathe smarter with AeroFlow Pro. Exclusive launch pricing, "
+        "save now! Clinically proven claim4321 phrase53 results. "
+    ) * 20
+    return lambda: matcher.find(text)
+
+
+@benchmark("tools.image_prompt_generator")
+def _image_prompt() -> Callable[[], Any]:
+    from src.tools import ImagePromptGeneratorTool
+
+    tool = ImagePromptGeneratorTool()
+    return lambda: tool._run(
+        concept="A family breathing easy in a sunlit loft",
+        brand_style="luxury",
+        target_platform="story",
+    )
+
+
+@benchmark("tools.competitor_analysis")
+def _competitor_analysis() -> Callable[[], Any]:
+    from src.tools import CompetitorAnalysisTool
+
+    tool = CompetitorAnalysisTool()
+    return lambda: tool._run(query="smart air purifiers", num_competitors=5)
+
+
+@benchmark("tools.trend_research_simulated")
+def _trend_research() -> Callable[[], Any]:
+    from src.tools import TrendResearchTool
+
+    tool = TrendResearchTool()
+    return lambda: tool._simulated_search("smart air purifiers", "home tech")
+
+
+@benchmark("tools.search_cache_hit")
+def _search_cache_hit() -> Callable[[], Any]:
+    from src.tools.search_cache import SearchCache, search_key
+
+    cache = SearchCache(
+        Path(tempfile.mkdtemp()) / "search.sqlite3", ttl=3600, stale=0
+    )
+    response = {
+        "organic": [
+            {"title": f"Result {i}", "snippet": "Air quality " * 20}
+            for i in range(10)
+        ]
+    }
+    cache.put(search_key("smart air purifiers home tech trends 2025"), response)
+    return lambda: cache.fetch(
+        search_key("Smart air purifiers home tech trends 2025"), dict
+    )
+
+
+@benchmark("models.brief_dump_json")
+def _brief_dump_json() -> Callable[[], Any]:
+    brief = large_brief()
+    return lambda: brief.model_dump_json(indent=2)
+
+
+@benchmark("render.format_markdown")
+def _format_markdown() -> Callable[[], Any]:
+    from src.workflow.crew_workflow import CampaignCrew
+
+    crew = CampaignCrew(REQUEST)
+    crew.release_agents()
+    brief = large_brief()
+    return lambda: crew._format_markdown(brief, brief.final_recommendations)
+
+
+@benchmark("workflow.crew_construction")
+def _crew_construction() -> Callable[[], Any]:
+    from src.workflow.crew_workflow import CampaignCrew
+
+    def build() -> None:
+        # Pooled agents, as in batch mode: each campaign hands them back
+        CampaignCrew(REQUEST).release_agents()
+
+    return build
+
+
+@benchmark("workflow.full_run_offline")
+def _full_run() -> Callable[[], Any]:
+    from src.workflow.crew_workflow import CampaignCrew
+
+    return lambda: CampaignCrew(
+        REQUEST, reuse_stages=False, seed_research=False
+    ).run()
+
+
+def large_brief(channels: int = 8, paragraphs: int = 200) -> CampaignBrief:
+    """A brief several times the size of a typical run's."""
+    paragraph = (
+        "AeroFlow Pro learns each room's air and cleans before you notice "
+        "a problem, which matters most to busy urban families. "
+    ) * 3
+    raw = "\n\n".join(
+        f"## Section {i}\n{paragraph}" for i in range(paragraphs)
+    )
+    return CampaignBrief(
+        client_name=REQUEST.product_name,
+        campaign_name=f"{REQUEST.product_name} Campaign",
+        objective=REQUEST.campaign_goals,
+        target_audience=REQUEST.target_audience,
+        request=REQUEST,
+        key_messages=[f"Message {i}: {paragraph}" for i in range(20)],
+        research=MarketResearch(
+            market_summary=raw[:4000],
+            trends=[f"Trend {i}: {paragraph}" for i in range(50)],
+            opportunities=[f"Opportunity {i}" for i in range(50)],
+            audience_insights={f"segment_{i}": paragraph for i in range(20)},
+        ),
+        copy_package=CopyPackage(
+            campaign_tagline="Breathe smarter, live better.",
+            elevator_pitch=paragraph,
+            channel_copy={
+                channel.value: {
+                    "headline": "Clean air that thinks ahead",
+                    "sub_headline": "Smart purification for busy homes",
+                    "body": paragraph * 2,
+                    "cta": "Pre-order now",
+                }
+                for channel in list(CampaignChannel)[:channels]
+            },
+            email_subjects=[f"Subject {i}" for i in range(10)],
+            hashtags=["#CleanAir", "#SmartHome", "#AeroFlow"],
+        ),
+        visuals=VisualDirection(
+            brand_visual_identity=paragraph,
+            key_visuals=[f"Visual {i}: {paragraph}" for i in range(20)],
+            image_prompts=[f"Prompt {i}: {paragraph}" for i in range(20)],
+        ),
+        executive_summary=raw[:3000],
+        implementation_timeline=[f"Week {i}" for i in range(12)],
+        success_metrics=[f"KPI {i}" for i in range(20)],
+        final_recommendations=raw,
+    )
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _human(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _use_offline_settings() -> None:
+    """Fake LLM and a scratch output dir; must run before ``settings`` is built."""
+    os.environ.update(
+        LLM_BACKEND="fake",
+        FAKE_LLM_LATENCY="0",
+        FAKE_LLM_TPS="0",
+        LLM_CACHE="off",
+        OUTPUT_DIR=tempfile.mkdtemp(prefix="campaign-bench-"),
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_comparison(rows: list[dict[str, Any]]) -> None:
+    print(f"{'benchmark':<32} {'base':>10} {'new':>10} {'change':>8}")
+    for row in rows:
+        flag = {"regression": "  ✗ slower", "improvement": "  ✓ faster"}
+        print(
+            f"{row['name']:<32} {_human(row['base']):>10} "
+            f"{_human(row['new']):>10} {row['change']:>+8.1%}"
+            + flag.get(row["verdict"], "")
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = commands.add_parser("run", help="Time the benchmarks")
+    run_cmd.add_argument("--output", type=Path, help="Write results as JSON")
+    run_cmd.add_argument(
+        "--filter",
+        action="append",
+        metavar="PREFIX",
+        help="Only benchmarks whose name starts with PREFIX (repeatable)",
+    )
+    run_cmd.add_argument("--repeat", type=int, default=5)
+    run_cmd.add_argument("--min-time", type=float, default=0.2)
+    run_cmd.add_argument(
+        "--list", action="store_true", help="List benchmark names and exit"
+    )
+
+    compare_cmd = commands.add_parser(
+        "compare", help="Flag regressions between two result files"
+    )
+    compare_cmd.add_argument("base", type=Path)
+    compare_cmd.add_argument("new", type=Path)
+    compare_cmd.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative median slowdown that counts as a regression (default: 0.15)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        rows = compare(
+            json.loads(args.base.read_text(encoding="utf-8")),
+            json.loads(args.new.read_text(encoding="utf-8")),
+            args.threshold,
+        )
+        _print_comparison(rows)
+        regressions = [r["name"] for r in rows if r["verdict"] == "regression"]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+        return
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+    _use_offline_settings()
+    results = run(args.filter, args.repeat, args.min_time)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nSaved {len(results['benchmarks'])} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,30 @@
 """Agent definitions for the campaign creation workflow"""
 
-from src.agents.base_agent import BaseAgent
-from src.agents.research_agent import ResearchAgent, create_research_agent
-from src.agents.copywriter_agent import CopywriterAgent, create_copywriter_agent
-from src.agents.art_director_agent import ArtDirectorAgent, create_art_director_agent
-from src.agents.manager_agent import ManagerAgent, create_manager_agent
+from src.agents.base_agent import AgentSpec, BaseAgent
+from src.agents.research_agent import (
+    RESEARCH_AGENT_SPEC,
+    ResearchAgent,
+    create_research_agent,
+)
+from src.agents.copywriter_agent import (
+    COPYWRITER_AGENT_SPEC,
+    CopywriterAgent,
+    create_copywriter_agent,
+)
+from src.agents.art_director_agent import (
+    ART_DIRECTOR_AGENT_SPEC,
+    ArtDirectorAgent,
+    create_art_director_agent,
+)
+from src.agents.manager_agent import (
+    MANAGER_AGENT_SPEC,
+    ManagerAgent,
+    create_manager_agent,
+)
+from src.agents.pool import AgentPool, agent_pool
 
 __all__ = [
+    "AgentSpec",
     "BaseAgent",
     "ResearchAgent",
     "CopywriterAgent",
@@ -16,4 +34,10 @@ __all__ = [
     "create_copywriter_agent",
     "create_art_director_agent",
     "create_manager_agent",
+    "RESEARCH_AGENT_SPEC",
+    "COPYWRITER_AGENT_SPEC",
+    "ART_DIRECTOR_AGENT_SPEC",
+    "MANAGER_AGENT_SPEC",
+    "AgentPool",
+    "agent_pool",
 ]
@@ -2,7 +2,7 @@
 
 from crewai import Agent
 
-from src.agents.base_agent import BaseAgent, get_llm
+from src.agents.base_agent import AgentSpec, BaseAgent
 from src.tools import ImagePromptGeneratorTool
 
 
@@ -28,21 +28,23 @@ class ArtDirectorAgent(BaseAgent):
         return f"Visual direction created for: {task}"
 
 
-def create_art_director_agent() -> Agent:
-    return Agent(
-        role="Senior Art Director",
-        goal=(
-            "Translate strategy into visual systems and storytelling that "
-            "feel premium, modern, and memorable."
-        ),
-        backstory=(
-            "You have led global brand systems for luxury and tech brands. "
-            "You turn abstract ideas into striking visual concepts and are "
-            "obsessed with detail and composition."
-        ),
-        tools=[ImagePromptGeneratorTool()],
-        llm=get_llm(temperature=0.6),
-        verbose=True,
-        allow_delegation=False,
-        max_iter=4,
-    )
+ART_DIRECTOR_AGENT_SPEC = AgentSpec(
+    name="art_director",
+    role="Senior Art Director",
+    goal=(
+        "Translate strategy into visual systems and storytelling that "
+        "feel premium, modern, and memorable."
+    ),
+    backstory=(
+        "You have led global brand systems for luxury and tech brands. "
+        "You turn abstract ideas into striking visual concepts and are "
+        "obsessed with detail and composition."
+    ),
+    temperature=0.6,
+    max_iter=4,
+    tools=(ImagePromptGeneratorTool,),
+)
+
+
+def create_art_director_agent(model: str | None = None) -> Agent:
+    return ART_DIRECTOR_AGENT_SPEC.build(model)
@@ -2,16 +2,34 @@
 Shared helpers for building CrewAI agents.
 
 Centralises the LLM instance so every agent uses the same
-model / temperature unless explicitly overridden.
+model / temperature unless explicitly overridden. Every client goes
+through the on-disk response cache in ``src.agents.llm_cache``; on a
+cache miss, through retries / hedging (``src.agents.resilience``) and
+the process-wide limiter in ``src.agents.rate_limiter``. With
+``LLM_BACKEND=fake`` every agent gets the offline ``FakeLLM`` instead.
 """
 
 from __future__ import annotations
 
-from crewai.llm import LLM
+from dataclasses import dataclass
 
+from crewai import Agent
+from crewai.llms.base_llm import BaseLLM
+
+from src.agents.fake_llm import FAKE_PROVIDER, FakeLLM
+from src.agents.llm_cache import CachedLLM
+from src.agents.rate_limiter import RateLimitedLLM
+from src.agents.resilience import ResilientLLM
 from src.config import settings
 
 
+class CampaignLLM(CachedLLM, ResilientLLM, RateLimitedLLM):
+    """Groq client: response cache, then retries/hedging, then rate limiter.
+
+    Every retry or hedge attempt waits for rate-limiter capacity itself.
+    """
+
+
 class BaseAgent:
     """Lightweight base class for non-CrewAI agent tests."""
 
@@ -22,14 +40,57 @@ class BaseAgent:
         self.backstory = kwargs.get("backstory", "")
 
 
+def llm_model(model: str | None = None) -> str:
+    """Provider-qualified id of the model ``get_llm(model)`` talks to."""
+    provider = FAKE_PROVIDER if settings.llm_backend == "fake" else "groq"
+    return f"{provider}/{model or settings.groq_model}"
+
+
 def get_llm(
     model: str | None = None,
     temperature: float | None = None,
-) -> LLM:
-    """Return a configured Groq LLM via CrewAI's LiteLLM backend."""
-    model_name = model or settings.groq_model
-    return LLM(
-        model=f"groq/{model_name}",
-        temperature=temperature if temperature is not None else settings.temperature,
+) -> BaseLLM:
+    """Return a configured Groq LLM via CrewAI's LiteLLM backend.
+
+    Under ``LLM_BACKEND=fake`` this is a ``FakeLLM`` for the same model.
+    """
+    if temperature is None:
+        temperature = settings.temperature
+    if settings.llm_backend == "fake":
+        return FakeLLM(model=llm_model(model), temperature=temperature)
+    return CampaignLLM(
+        model=llm_model(model),
+        temperature=temperature,
         api_key=settings.groq_api_key,
     )
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    """Everything that defines one campaign agent except its LLM client.
+
+    ``build()`` creates the CrewAI agent; the dry-run estimator reads the
+    spec directly so it never has to construct an LLM client. ``name`` is
+    the agent's key in ``AGENT_MODELS`` (see ``src.workflow.routing``).
+    """
+
+    name: str
+    role: str
+    goal: str
+    backstory: str
+    temperature: float
+    max_iter: int
+    tools: tuple[type, ...] = ()
+
+    def build(self, model: str | None = None) -> Agent:
+        """The agent, on ``model`` or else ``settings.groq_model``."""
+        return Agent(
+            role=self.role,
+            goal=self.goal,
+            backstory=self.backstory,
+            tools=[tool() for tool in self.tools],
+            llm=get_llm(model, temperature=self.temperature),
+            verbose=True,
+            allow_delegation=False,
+            max_iter=self.max_iter,
+        )
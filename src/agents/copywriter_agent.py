@@ -2,7 +2,7 @@
 
 from crewai import Agent
 
-from src.agents.base_agent import BaseAgent, get_llm
+from src.agents.base_agent import AgentSpec, BaseAgent
 from src.tools import CopyEvaluationTool
 
 
@@ -28,21 +28,23 @@ class CopywriterAgent(BaseAgent):
         return f"Copy created for: {task}"
 
 
-def create_copywriter_agent() -> Agent:
-    return Agent(
-        role="Senior Creative Copywriter",
-        goal=(
-            "Craft persuasive and emotionally resonant copy that aligns "
-            "with the brand voice while maximising conversion."
-        ),
-        backstory=(
-            "You're a multi-award-winning copywriter who has crafted campaigns "
-            "for Apple, Nike, and Airbnb. You obsess over clarity, rhythm, and "
-            "calls-to-action."
-        ),
-        tools=[CopyEvaluationTool()],
-        llm=get_llm(temperature=0.7),
-        verbose=True,
-        allow_delegation=False,
-        max_iter=5,
-    )
+COPYWRITER_AGENT_SPEC = AgentSpec(
+    name="copywriter",
+    role="Senior Creative Copywriter",
+    goal=(
+        "Craft persuasive and emotionally resonant copy that aligns "
+        "with the brand voice while maximising conversion."
+    ),
+    backstory=(
+        "You're a multi-award-winning copywriter who has crafted campaigns "
+        "for Apple, Nike, and Airbnb. You obsess over clarity, rhythm, and "
+        "calls-to-action."
+    ),
+    temperature=0.7,
+    max_iter=5,
+    tools=(CopyEvaluationTool,),
+)
+
+
+def create_copywriter_agent(model: str | None = None) -> Agent:
+    return COPYWRITER_AGENT_SPEC.build(model)
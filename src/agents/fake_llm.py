@@ -0,0 +1,369 @@
+"""
+Deterministic in-process stand-in for the Groq client.
+
+With ``LLM_BACKEND=fake`` (or ``--fake-llm``) ``get_llm()`` returns a
+``FakeLLM``. It never touches the network or LiteLLM, so whole campaigns
+run, profile and benchmark offline:
+
+    LLM_BACKEND=fake FAKE_LLM_LATENCY=0.8 python -m src.main --demo
+
+A stage is answered the way a tool-calling model answers it: an agent
+with tools first calls one (``trend_research`` for market research,
+``copy_evaluator`` for copy, ...), then answers the way the real stage
+does: JSON for the structured stages, Markdown for the brief. Turns
+covered by ``FAKE_LLM_SCRIPT`` are taken from that file, the rest from
+built-in templates. Each call sleeps
+``FAKE_LLM_LATENCY`` seconds plus its completion tokens at
+``FAKE_LLM_TPS`` and reports token usage like a real call, so traces
+separate framework time from model time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from crewai.events.types.llm_events import LLMCallType
+from crewai.llms.base_llm import BaseLLM, llm_call_context
+
+from src.agents.rate_limiter import estimate_tokens
+from src.config import settings
+
+FAKE_PROVIDER = "fake"
+
+# Tool each stage's agent calls first, when it has it
+STAGE_TOOLS = {
+    "market_research": "trend_research",
+    "competitor_analysis": "competitor_analysis",
+    "visual_direction": "image_prompt_generator",
+}
+COPY_TOOL = "copy_evaluator"
+
+_CHANNEL_PREFIX = "copywriting_"
+# Task prompts name the product in bold: "... copy for **AeroFlow Pro**"
+_SUBJECT = re.compile(r"(?:for|on):?\s+\*\*(.+?)\*\*")
+_CHANNELS = re.compile(r"\*\*Channels:\*\*\s*(.+)")
+
+
+class FakeScriptError(ValueError):
+    """Raised when a scripted turn cannot be played back."""
+
+
+@lru_cache(maxsize=8)
+def load_script(path: str) -> dict[str, list[Any]]:
+    """Per-stage responses from a JSON file.
+
+    Keys are task names (``"*"`` matches any stage); values list the
+    responses for turns 0, 1, ... of that stage. A string is a final
+    answer, ``{"tool": name, "arguments": {...}}`` a tool call:
+
+        {"market_research": [
+            {"tool": "trend_research", "arguments": {"query": "air"}},
+            "## Trends\\n- Indoor air quality is a top concern"
+        ]}
+    """
+    script = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(script, dict) or not all(
+        isinstance(steps, list) for steps in script.values()
+    ):
+        raise FakeScriptError(
+            f"{path} must map stage names to lists of responses."
+        )
+    return script
+
+
+class FakeLLM(BaseLLM):
+    """Scripted/template ``BaseLLM`` with native tool calls and latency."""
+
+    llm_type: str = FAKE_PROVIDER
+    provider: str = FAKE_PROVIDER
+    # Unset values follow settings, resolved on every call
+    latency: float | None = None
+    tokens_per_second: float | None = None
+    script: dict[str, list[Any]] | None = None
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ) -> Any:
+        with llm_call_context():
+            messages = self._format_messages(messages)
+            self._emit_call_started_event(
+                messages=messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+            response, usage = self._respond(messages, tools, from_task)
+            time.sleep(self._delay(usage))
+            return self._finish(response, usage, messages, from_task, from_agent)
+
+    async def acall(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ) -> Any:
+        with llm_call_context():
+            messages = self._format_messages(messages)
+            self._emit_call_started_event(
+                messages=messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+            response, usage = self._respond(messages, tools, from_task)
+            await asyncio.sleep(self._delay(usage))
+            return self._finish(response, usage, messages, from_task, from_agent)
+
+    def supports_function_calling(self) -> bool:
+        return True
+
+    def get_context_window_size(self) -> int:
+        return 128_000
+
+    # ── Private helpers ──────────────────────────────────────────────
+
+    def _respond(
+        self, messages: list[dict[str, Any]], tools, from_task
+    ) -> tuple[Any, dict[str, int]]:
+        stage = getattr(from_task, "name", None) or "default"
+        # The executor's history is the only state: replies are a pure
+        # function of stage and turn, so parallel stages cannot interfere
+        turn = sum(1 for m in messages if m.get("role") == "assistant")
+        offered = [t["function"]["name"] for t in tools or []]
+        step = self._scripted(stage, turn)
+        if step is None:
+            step = _template_step(stage, turn, _prompt(messages), offered)
+
+        if isinstance(step, dict):
+            name = step.get("tool")
+            if name not in offered:
+                raise FakeScriptError(
+                    f"Turn {turn} of {stage} calls tool {name!r}, but the "
+                    f"agent only offers {offered or 'no tools'}."
+                )
+            response: Any = [
+                {
+                    "id": f"call_{stage}_{turn}",
+                    "type": "function",
+                    "function": {
+                        "name": name,
+                        "arguments": json.dumps(step.get("arguments", {})),
+                    },
+                }
+            ]
+            completion = estimate_tokens(json.dumps(response))
+        else:
+            response = str(step)
+            completion = estimate_tokens(response)
+        prompt = estimate_tokens(messages, tools)
+        usage = {
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "total_tokens": prompt + completion,
+        }
+        return response, usage
+
+    def _scripted(self, stage: str, turn: int) -> Any:
+        script = self.script
+        if script is None and settings.fake_llm_script:
+            script = load_script(settings.fake_llm_script)
+        steps = (script or {}).get(stage) or (script or {}).get("*") or []
+        return steps[turn] if turn < len(steps) else None
+
+    def _delay(self, usage: dict[str, int]) -> float:
+        latency = self.latency
+        if latency is None:
+            latency = settings.fake_llm_latency
+        tps = self.tokens_per_second
+        if tps is None:
+            tps = settings.fake_llm_tps
+        if tps > 0:
+            latency += usage["completion_tokens"] / tps
+        return latency
+
+    def _finish(self, response, usage, messages, from_task, from_agent) -> Any:
+        if isinstance(response, str):
+            if self.stream:
+                for chunk in response.splitlines(keepends=True):
+                    self._emit_stream_chunk_event(
+                        chunk,
+                        from_task=from_task,
+                        from_agent=from_agent,
+                        call_type=LLMCallType.LLM_CALL,
+                    )
+            call_type = LLMCallType.LLM_CALL
+        else:
+            call_type = LLMCallType.TOOL_CALL
+        self._track_token_usage_internal(usage)
+        self._emit_call_completed_event(
+            response=response,
+            call_type=call_type,
+            from_task=from_task,
+            from_agent=from_agent,
+            messages=messages,
+            usage=usage,
+        )
+        return response
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _prompt(messages: list[dict[str, Any]]) -> str:
+    """The task prompt: the first user message of the conversation."""
+    for message in messages:
+        if message.get("role") == "user":
+            return str(message.get("content") or "")
+    return ""
+
+
+def _template_step(stage: str, turn: int, prompt: str, offered: list[str]) -> Any:
+    """Tool call on an agent's first turn, a stage-shaped answer after."""
+    match = _SUBJECT.search(prompt)
+    subject = match.group(1) if match else "the product"
+    channel = ""
+    if stage.startswith(_CHANNEL_PREFIX) and stage != "copywriting_core":
+        channel = stage[len(_CHANNEL_PREFIX):]
+    if turn == 0 and offered:
+        wanted = STAGE_TOOLS.get(stage)
+        if stage.startswith("copywriting"):
+            wanted = COPY_TOOL
+        tool = wanted if wanted in offered else offered[0]
+        return {
+            "tool": tool,
+            "arguments": _tool_arguments(tool, subject, channel or "general"),
+        }
+    return _answer(stage, subject, channel, prompt)
+
+
+def _tool_arguments(tool: str, subject: str, channel: str) -> dict[str, Any]:
+    if tool == "trend_research":
+        return {
+            "query": f"{subject} market trends",
+            "industry": "consumer",
+            "queries": [f"{subject} buyer needs"],
+        }
+    if tool == "competitor_analysis":
+        return {"query": subject, "num_competitors": 3}
+    if tool == COPY_TOOL:
+        return {"copy_text": _channel_copy(subject, channel), "channel": channel}
+    if tool == "image_prompt_generator":
+        return {"concept": f"{subject} hero shot", "brand_style": "modern"}
+    return {"query": subject}
+
+
+def _bullets(topic: str, subject: str, count: int) -> str:
+    return "\n".join(f"- **{item}" for item in _items(topic, subject, count))
+
+
+def _items(topic: str, subject: str, count: int) -> list[str]:
+    return [
+        f"{topic} {i}:** {subject} benefits from {topic.lower()} {i}; "
+        "it shapes how the audience discovers, compares and buys."
+        for i in range(1, count + 1)
+    ]
+
+
+def _points(topic: str, subject: str, count: int) -> list[str]:
+    return [item.replace("**", "") for item in _items(topic, subject, count)]
+
+
+def _channel_fields(subject: str, channel: str) -> dict[str, str]:
+    return {
+        "headline": f"{subject}, made for your {channel.replace('_', ' ')}",
+        "sub_headline": "The smarter choice, proven in everyday use",
+        "body": f"Meet {subject}. It saves time from day one and keeps "
+        "getting better. Exclusive launch pricing for early supporters.",
+        "cta": "Pre-order now",
+    }
+
+
+def _channel_copy(subject: str, channel: str) -> str:
+    fields = _channel_fields(subject, channel)
+    return (
+        f"Headline: {fields['headline']}\n"
+        f"Sub-headline: {fields['sub_headline']}\n"
+        f"Body: {fields['body']}\n"
+        f"CTA: {fields['cta']}"
+    )
+
+
+def _core_copy(subject: str) -> dict[str, Any]:
+    return {
+        "campaign_tagline": f"{subject}: less effort, more results.",
+        "elevator_pitch": f"{subject} does the work for you. "
+        "It learns what you need and delivers it quietly.",
+        "email_subjects": _points("Subject", subject, 3),
+        "hashtags": ["#Launch", "#Smarter", "#EverydayUpgrade"],
+    }
+
+
+def _answer(stage: str, subject: str, channel: str, prompt: str) -> str:
+    if stage == "market_research":
+        return json.dumps({
+            "market_summary": f"{subject} enters a growing market that "
+            "rewards products which save time without extra effort.",
+            "trends": _points("Trend", subject, 4),
+            "audience_insights": dict(
+                item.split(": ", 1) for item in _points("Persona", subject, 2)
+            ),
+            "opportunities": _points("Angle", subject, 3),
+        })
+    if stage == "competitor_analysis":
+        return json.dumps({
+            "competitive_landscape": dict(
+                item.split(": ", 1) for item in _points("Competitor", subject, 3)
+            ),
+            "opportunities": _points("Gap", subject, 2),
+        })
+    if stage == "copywriting_core":
+        return json.dumps(_core_copy(subject))
+    if channel:
+        return json.dumps(_channel_fields(subject, channel))
+    if stage == "copywriting":
+        listed = _CHANNELS.search(prompt)
+        names = listed.group(1).split(", ") if listed else ["general"]
+        return json.dumps({
+            **_core_copy(subject),
+            "channel_copy": {
+                name: _channel_fields(subject, name) for name in names
+            },
+        })
+    if stage == "visual_direction":
+        return json.dumps({
+            "brand_visual_identity": f"{subject} looks calm and precise: "
+            "soft whites, one accent colour, generous space.",
+            "key_visuals": _points("Concept", subject, 3),
+            "image_prompts": _points("Prompt", subject, 3),
+        })
+    if stage == "campaign_strategy":
+        return (
+            f"# Campaign Brief: {subject}\n\n## Executive summary\n"
+            f"{subject} launches with a research-led, multi-channel plan.\n\n"
+            "## Strategy\n" + _bullets("Pillar", subject, 3)
+            + "\n\n## Timeline\n" + _bullets("Phase", subject, 3)
+            + "\n\n## KPIs\n" + _bullets("KPI", subject, 3)
+            + "\n\n## Risks\n" + _bullets("Risk", subject, 2)
+        )
+    return f"## {stage.replace('_', ' ').title()}\n\n{subject}: done."
@@ -0,0 +1,240 @@
+"""
+Content-addressed on-disk cache of LLM responses.
+
+Every client returned by ``get_llm()`` is a ``CachedLLM``. Depending on
+``LLM_CACHE`` (or ``--llm-cache``) each call is:
+
+* ``off``    — sent to the provider as usual (default),
+* ``on``     — answered from disk when an identical call was made before,
+* ``replay`` — answered from disk only; a miss raises ``LLMCacheMiss``.
+
+The key covers the model, temperature, stop words, messages and the
+tool / response schemas, so any prompt change is a miss. Entries live in
+``{output_dir}/llm_cache/`` and the least recently used ones are evicted
+once the directory grows past ``LLM_CACHE_MAX_MB``:
+
+    response_cache.mode = "replay"
+    brief = CampaignCrew(request).run()   # zero tokens, or LLMCacheMiss
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from crewai.llm import LLM
+
+from src.config import settings
+
+CACHE_MODES = ("off", "on", "replay")
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay mode when a call has no recorded response."""
+
+
+def cache_key(
+    model: str,
+    temperature: float | None,
+    messages: Any,
+    tools: Any = None,
+    stop: Any = None,
+    response_schema: Any = None,
+) -> str:
+    """Hash of everything that determines an LLM response."""
+
+    def digest(value: Any) -> str:
+        blob = json.dumps(value, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    parts = [
+        model,
+        repr(temperature),
+        digest(stop),
+        digest(messages),
+        digest(tools),
+        digest(response_schema),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Size-bounded LRU store of responses, one JSON file per key."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int | None = None,
+        mode: str | None = None,
+    ) -> None:
+        # Unset values follow settings, resolved on first use
+        self._root = root
+        self._max_bytes = max_bytes
+        self._mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._index: OrderedDict[str, int] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._root or settings.llm_cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return settings.llm_cache_max_mb * 1024 * 1024
+
+    @property
+    def mode(self) -> str:
+        return self._mode or settings.llm_cache_mode
+
+    @mode.setter
+    def mode(self, value: str) -> None:
+        if value not in CACHE_MODES:
+            raise ValueError(f"LLM cache mode must be one of {CACHE_MODES}")
+        self._mode = value
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored payload for ``key`` and mark it recently used."""
+        with self._lock:
+            index = self._load_index()
+            path = self.root / f"{key}.json"
+            if key not in index or not path.is_file():
+                index.pop(key, None)
+                self.misses += 1
+                return None
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            index.move_to_end(key)
+            os.utime(path)  # recency survives restarts via mtime
+            self.hits += 1
+            return payload
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        """Store ``payload`` and evict least recently used entries."""
+        content = json.dumps(payload)
+        with self._lock:
+            index = self._load_index()
+            self.root.mkdir(parents=True, exist_ok=True)
+            path = self.root / f"{key}.json"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(content, encoding="utf-8")
+            tmp.replace(path)
+            index[key] = path.stat().st_size
+            index.move_to_end(key)
+            self._evict(index)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            index = self._load_index()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(index),
+                "bytes": sum(index.values()),
+            }
+
+    # ── Private helpers ──────────────────────────────────────────────
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            files = sorted(
+                self.root.glob("*.json") if self.root.is_dir() else [],
+                key=lambda p: p.stat().st_mtime,
+            )
+            self._index = OrderedDict(
+                (p.stem, p.stat().st_size) for p in files
+            )
+        return self._index
+
+    def _evict(self, index: OrderedDict[str, int]) -> None:
+        total = sum(index.values())
+        while total > self.max_bytes and len(index) > 1:
+            key, size = index.popitem(last=False)
+            (self.root / f"{key}.json").unlink(missing_ok=True)
+            total -= size
+
+
+# Module-level singleton shared by every CachedLLM in the process
+response_cache = LLMResponseCache()
+
+
+class CachedLLM(LLM):
+    """``LLM`` that consults ``response_cache`` before calling the provider."""
+
+    def call(self, messages, tools=None, *args: Any, **kwargs: Any) -> Any:
+        key = self._cache_key(messages, tools, kwargs.get("response_model"))
+        if key is None:
+            return super().call(messages, tools, *args, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return _decode(cached)
+        response = super().call(messages, tools, *args, **kwargs)
+        self._store(key, response)
+        return response
+
+    async def acall(self, messages, tools=None, *args: Any, **kwargs: Any) -> Any:
+        key = self._cache_key(messages, tools, kwargs.get("response_model"))
+        if key is None:
+            return await super().acall(messages, tools, *args, **kwargs)
+        cached = self._lookup(key)
+        if cached is not None:
+            return _decode(cached)
+        response = await super().acall(messages, tools, *args, **kwargs)
+        self._store(key, response)
+        return response
+
+    def _cache_key(self, messages, tools, response_model) -> str | None:
+        if response_cache.mode == "off":
+            return None
+        schema = (
+            response_model.model_json_schema() if response_model else None
+        )
+        return cache_key(
+            self.model, self.temperature, messages, tools, self.stop, schema
+        )
+
+    def _lookup(self, key: str) -> dict[str, Any] | None:
+        cached = response_cache.get(key)
+        if cached is None and response_cache.mode == "replay":
+            raise LLMCacheMiss(
+                f"No recorded response for this {self.model} call "
+                f"(key {key[:12]}) and the LLM cache is in replay mode."
+            )
+        return cached
+
+    def _store(self, key: str, response: Any) -> None:
+        payload = _encode(response)
+        if payload is not None:
+            response_cache.put(key, payload)
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _encode(response: Any) -> dict[str, Any] | None:
+    """JSON form of a response, or ``None`` if it cannot be replayed."""
+    if isinstance(response, str):
+        return {"text": response}
+    if isinstance(response, list) and response:
+        calls = []
+        for call in response:
+            if hasattr(call, "model_dump"):
+                call = call.model_dump()
+            if not isinstance(call, dict) or "function" not in call:
+                return None
+            calls.append(call)
+        return {"tool_calls": calls}
+    return None
+
+
+def _decode(payload: dict[str, Any]) -> Any:
+    if "tool_calls" in payload:
+        return payload["tool_calls"]
+    return payload["text"]
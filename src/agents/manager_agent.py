@@ -2,7 +2,7 @@
 
 from crewai import Agent
 
-from src.agents.base_agent import BaseAgent, get_llm
+from src.agents.base_agent import AgentSpec, BaseAgent
 
 
 class ManagerAgent(BaseAgent):
@@ -27,20 +27,22 @@ class ManagerAgent(BaseAgent):
         return f"Campaign managed: {task}"
 
 
-def create_manager_agent() -> Agent:
-    return Agent(
-        role="Campaign Strategy Director",
-        goal=(
-            "Synthesize research, copy, and visuals into a cohesive "
-            "campaign plan with clear next steps and KPIs."
-        ),
-        backstory=(
-            "You're a seasoned strategy director who connects the dots "
-            "between insights, creative, and execution. You obsess over "
-            "clarity, prioritization, and measurable outcomes."
-        ),
-        llm=get_llm(temperature=0.4),
-        verbose=True,
-        allow_delegation=False,
-        max_iter=4,
-    )
+MANAGER_AGENT_SPEC = AgentSpec(
+    name="manager",
+    role="Campaign Strategy Director",
+    goal=(
+        "Synthesize research, copy, and visuals into a cohesive "
+        "campaign plan with clear next steps and KPIs."
+    ),
+    backstory=(
+        "You're a seasoned strategy director who connects the dots "
+        "between insights, creative, and execution. You obsess over "
+        "clarity, prioritization, and measurable outcomes."
+    ),
+    temperature=0.4,
+    max_iter=4,
+)
+
+
+def create_manager_agent(model: str | None = None) -> Agent:
+    return MANAGER_AGENT_SPEC.build(model)
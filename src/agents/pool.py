@@ -0,0 +1,106 @@
+"""
+Process-wide pool of pre-built CrewAI agents.
+
+Building an ``Agent`` validates its config, instantiates its tools and
+creates a fresh ``LLM`` client. Batch and server use would repeat that
+for every campaign, so ``CampaignCrew`` borrows agents from here and
+hands them back when its run ends:
+
+    agent = agent_pool.acquire(create_research_agent)
+    fast = agent_pool.acquire(create_research_agent, "llama-3.1-8b-instant")
+    ...
+    agent_pool.release(agent)
+
+Idle agents are keyed by ``(role, provider/model, temperature)``. A borrowed
+agent is never shared, and its per-run state (crew, executor, retry
+count, tool results, streaming flag) is cleared on release.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Callable
+
+from crewai import Agent
+
+from src.agents.base_agent import llm_model
+
+# Called with the model to build on, or with no argument for the default
+AgentFactory = Callable[..., Agent]
+PoolKey = tuple[str, str, float]
+
+
+def pool_key(agent: Agent) -> PoolKey:
+    """Identity of an agent's configuration for pooling purposes."""
+    llm = agent.llm
+    model = str(getattr(llm, "model", ""))
+    return agent.role, model, float(getattr(llm, "temperature", 0.0) or 0.0)
+
+
+class AgentPool:
+    """Thread-safe free-list of agents, one list per ``PoolKey``."""
+
+    def __init__(self, max_idle: int = 16) -> None:
+        self.max_idle = max_idle
+        self.hits = 0
+        self.misses = 0
+        self._idle: dict[PoolKey, list[Agent]] = defaultdict(list)
+        # Role and temperature a factory builds; the model is the caller's
+        # (and the backend's, so fake and Groq agents never mix)
+        self._factory_keys: dict[AgentFactory, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, factory: AgentFactory, model: str | None = None) -> Agent:
+        """Borrow an idle agent ``factory`` built on ``model``, or build one.
+
+        ``model`` defaults to ``settings.groq_model``.
+        """
+        with self._lock:
+            known = self._factory_keys.get(factory)
+            if known is not None:
+                role, temperature = known
+                idle = self._idle.get((role, llm_model(model), temperature))
+                if idle:
+                    self.hits += 1
+                    return idle.pop()
+            self.misses += 1
+
+        agent = factory(model) if model else factory()
+        role, _, temperature = pool_key(agent)
+        with self._lock:
+            self._factory_keys[factory] = (role, temperature)
+        return agent
+
+    def release(self, agent: Agent) -> None:
+        """Return a borrowed agent, scrubbed of the last run's state."""
+        _reset(agent)
+        with self._lock:
+            idle = self._idle[pool_key(agent)]
+            if len(idle) < self.max_idle and all(a is not agent for a in idle):
+                idle.append(agent)
+
+    def clear(self) -> None:
+        """Drop every idle agent and reset the hit/miss counters."""
+        with self._lock:
+            self._idle.clear()
+            self._factory_keys.clear()
+            self.hits = self.misses = 0
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(agents) for agents in self._idle.values())
+
+
+def _reset(agent: Agent) -> None:
+    agent.crew = None
+    agent.agent_executor = None
+    agent.tools_results = []
+    agent._times_executed = 0
+    agent._last_messages = []
+    if getattr(agent.llm, "stream", False):
+        agent.llm.stream = False
+
+
+# Module-level singleton shared by every CampaignCrew in the process
+agent_pool = AgentPool()
@@ -0,0 +1,248 @@
+"""
+Client-side Groq rate limiting shared by every LLM in the process.
+
+Groq enforces requests-per-minute and tokens-per-minute limits per API
+key. ``rate_limiter`` keeps one token bucket for each and makes every
+``get_llm()`` client wait for capacity before a call goes out, instead
+of letting concurrent campaigns collide on 429s:
+
+    wait = rate_limiter.acquire(tokens=1800, owner=run_id)
+
+Calls are granted round-robin between owners (one owner per campaign),
+so a campaign fanning out six stages cannot starve another one.
+``RateLimitedLLM`` takes the owner from ``rate_limit_owner``, which
+``CampaignCrew`` enters for its run:
+
+    with rate_limit_owner(run_id):
+        scheduler.run()   # stage threads inherit the owner
+
+Token use is estimated up front and settled against the reported usage
+once the response arrives. Limits come from ``GROQ_RPM`` / ``GROQ_TPM``;
+``0`` disables a bucket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import itertools
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from typing import Any, Iterator
+
+from crewai.llm import LLM
+
+from src.config import settings
+
+# Completion budget assumed when a client sets no ``max_tokens``
+COMPLETION_TOKEN_ESTIMATE = 512
+CHARS_PER_TOKEN = 4
+
+
+# Campaign the current call belongs to; stage threads copy the context
+_owner: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "rate_limit_owner", default="default"
+)
+
+
+@contextlib.contextmanager
+def rate_limit_owner(owner: str) -> Iterator[None]:
+    """Queue LLM calls made in this context under ``owner``."""
+    token = _owner.set(owner)
+    try:
+        yield
+    finally:
+        _owner.reset(token)
+
+
+def estimate_tokens(messages: Any, tools: Any = None) -> int:
+    """Rough prompt size: ~4 characters per token, like Groq's tokenizers."""
+    if isinstance(messages, str):
+        chars = len(messages)
+    else:
+        chars = sum(len(str(m.get("content") or "")) for m in messages or [])
+    chars += len(str(tools)) if tools else 0
+    return max(1, chars // CHARS_PER_TOKEN)
+
+
+class _Bucket:
+    """Token bucket holding up to ``limit`` units, refilled over ``window``."""
+
+    def __init__(self, limit: float, window: float) -> None:
+        self.capacity = float(limit)
+        self.rate = limit / window
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(
+            self.capacity, self.level + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` units are available."""
+        return max(0.0, (amount - self.level) / self.rate)
+
+
+class RateLimiter:
+    """Fair, blocking RPM + TPM limiter."""
+
+    def __init__(
+        self,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        window: float = 60.0,
+    ) -> None:
+        # Unset limits follow settings, resolved on first use
+        self._rpm = rpm
+        self._tpm = tpm
+        self.window = window
+        self._buckets: dict[str, _Bucket] | None = None
+        self._cond = threading.Condition()
+        self._tickets = itertools.count()
+        # owner -> FIFO of waiting tickets; dict order is the rotation
+        self._queues: OrderedDict[str, deque[int]] = OrderedDict()
+        self.calls = 0
+        self.throttled_calls = 0
+        self.total_wait = 0.0
+        self._waits: dict[str, float] = defaultdict(float)
+
+    def acquire(
+        self, tokens: int = 0, owner: str = "default", key: str | None = None
+    ) -> float:
+        """Block until one request and ``tokens`` fit; return seconds waited.
+
+        ``key`` (e.g. a task id) accumulates wait time for :meth:`wait_for`.
+        """
+        start = time.monotonic()
+        with self._cond:
+            buckets = self._load_buckets()
+            if not buckets:
+                return 0.0
+            needs = {"requests": 1.0, "tokens": float(tokens)}
+            # A call bigger than the whole budget still has to go out
+            if "tokens" in buckets:
+                needs["tokens"] = min(needs["tokens"], buckets["tokens"].capacity)
+
+            ticket = next(self._tickets)
+            self._queues.setdefault(owner, deque()).append(ticket)
+            while True:
+                if self._head() == ticket:
+                    now = time.monotonic()
+                    delay = 0.0
+                    for name, bucket in buckets.items():
+                        bucket.refill(now)
+                        delay = max(delay, bucket.delay(needs[name]))
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                else:
+                    self._cond.wait()
+
+            for name, bucket in buckets.items():
+                bucket.level -= needs[name]
+            queue = self._queues[owner]
+            queue.popleft()
+            if queue:
+                self._queues.move_to_end(owner)  # next owner's turn
+            else:
+                del self._queues[owner]
+
+            waited = time.monotonic() - start
+            self.calls += 1
+            if waited > 0.001:
+                self.throttled_calls += 1
+            self.total_wait += waited
+            if key is not None:
+                self._waits[key] += waited
+            self._cond.notify_all()
+        return waited
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once a call's real usage is known."""
+        with self._cond:
+            bucket = self._load_buckets().get("tokens")
+            if bucket is None:
+                return
+            if actual <= 0:
+                return  # usage unknown: the estimate stays charged
+            bucket.level = min(bucket.capacity, bucket.level + estimated - actual)
+            self._cond.notify_all()
+
+    def wait_for(self, key: str) -> float:
+        """Total seconds calls tagged with ``key`` spent waiting."""
+        with self._cond:
+            return self._waits.get(key, 0.0)
+
+    def forget(self, keys) -> None:
+        """Drop the wait totals of ``keys`` once they have been reported."""
+        with self._cond:
+            for key in keys:
+                self._waits.pop(key, None)
+
+    def stats(self) -> dict[str, float]:
+        with self._cond:
+            return {
+                "calls": self.calls,
+                "throttled_calls": self.throttled_calls,
+                "total_wait_seconds": round(self.total_wait, 3),
+            }
+
+    # ── Private helpers ──────────────────────────────────────────────
+
+    def _load_buckets(self) -> dict[str, _Bucket]:
+        if self._buckets is None:
+            rpm = settings.groq_rpm if self._rpm is None else self._rpm
+            tpm = settings.groq_tpm if self._tpm is None else self._tpm
+            self._buckets = {}
+            if rpm > 0:
+                self._buckets["requests"] = _Bucket(rpm, self.window)
+            if tpm > 0:
+                self._buckets["tokens"] = _Bucket(tpm, self.window)
+        return self._buckets
+
+    def _head(self) -> int | None:
+        for queue in self._queues.values():
+            return queue[0]
+        return None
+
+
+# Module-level singleton shared by every RateLimitedLLM in the process
+rate_limiter = RateLimiter()
+
+
+class RateLimitedLLM(LLM):
+    """``LLM`` whose calls wait for ``rate_limiter`` capacity first."""
+
+    def call(self, messages, tools=None, *args: Any, **kwargs: Any) -> Any:
+        estimate, owner, key = self._budget(messages, tools, kwargs)
+        rate_limiter.acquire(estimate, owner, key)
+        before = self._used_tokens()
+        try:
+            return super().call(messages, tools, *args, **kwargs)
+        finally:
+            rate_limiter.settle(estimate, self._used_tokens() - before)
+
+    async def acall(self, messages, tools=None, *args: Any, **kwargs: Any) -> Any:
+        estimate, owner, key = self._budget(messages, tools, kwargs)
+        await asyncio.to_thread(rate_limiter.acquire, estimate, owner, key)
+        before = self._used_tokens()
+        try:
+            return await super().acall(messages, tools, *args, **kwargs)
+        finally:
+            rate_limiter.settle(estimate, self._used_tokens() - before)
+
+    def _budget(
+        self, messages, tools, kwargs: dict[str, Any]
+    ) -> tuple[int, str, str | None]:
+        estimate = estimate_tokens(messages, tools) + (
+            self.max_tokens or COMPLETION_TOKEN_ESTIMATE
+        )
+        task = kwargs.get("from_task")
+        return estimate, _owner.get(), str(task.id) if task is not None else None
+
+    def _used_tokens(self) -> int:
+        return self.get_token_usage_summary().total_tokens
@@ -2,7 +2,7 @@
 
 from crewai import Agent
 
-from src.agents.base_agent import BaseAgent, get_llm
+from src.agents.base_agent import AgentSpec, BaseAgent
 from src.tools import CompetitorAnalysisTool, TrendResearchTool
 
 
@@ -29,23 +29,25 @@ class ResearchAgent(BaseAgent):
         return f"Research completed for: {task}"
 
 
-def create_research_agent() -> Agent:
-    return Agent(
-        role="Senior Market Research Analyst",
-        goal=(
-            "Conduct comprehensive market research including trend analysis, "
-            "competitor profiling and audience persona synthesis. Deliver "
-            "actionable insights the creative team can build on."
-        ),
-        backstory=(
-            "You have 15 years of experience in market intelligence at top "
-            "agencies (Ogilvy, McKinsey). You combine quantitative rigour "
-            "with qualitative intuition. You always cite data points and "
-            "surface non-obvious opportunities that give campaigns an edge."
-        ),
-        tools=[TrendResearchTool(), CompetitorAnalysisTool()],
-        llm=get_llm(temperature=0.3),
-        verbose=True,
-        allow_delegation=False,
-        max_iter=5,
-    )
+RESEARCH_AGENT_SPEC = AgentSpec(
+    name="researcher",
+    role="Senior Market Research Analyst",
+    goal=(
+        "Conduct comprehensive market research including trend analysis, "
+        "competitor profiling and audience persona synthesis. Deliver "
+        "actionable insights the creative team can build on."
+    ),
+    backstory=(
+        "You have 15 years of experience in market intelligence at top "
+        "agencies (Ogilvy, McKinsey). You combine quantitative rigour "
+        "with qualitative intuition. You always cite data points and "
+        "surface non-obvious opportunities that give campaigns an edge."
+    ),
+    temperature=0.3,
+    max_iter=5,
+    tools=(TrendResearchTool, CompetitorAnalysisTool),
+)
+
+
+def create_research_agent(model: str | None = None) -> Agent:
+    return RESEARCH_AGENT_SPEC.build(model)
@@ -0,0 +1,229 @@
+"""
+Retries and hedged requests for Groq calls.
+
+``ResilientLLM`` sits between the response cache and the rate limiter in
+every ``get_llm()`` client:
+
+* transient failures (429, timeouts, 5xx, dropped connections) are
+  retried up to ``LLM_MAX_RETRIES`` times with full-jitter exponential
+  backoff (``LLM_BACKOFF_BASE`` doubling per attempt, capped at
+  ``LLM_BACKOFF_MAX``);
+* with ``LLM_HEDGE_PERCENTILE`` set (e.g. ``95``), a call still running
+  after that percentile of the model's recent latencies gets a second,
+  identical request; whichever answers first wins.
+
+Hedging only starts once a model has enough latency samples, and never
+applies to streaming clients (two streams would interleave on screen) or
+to calls given ``available_functions``: ``LLM.call`` runs those tools
+itself, so a duplicate request would run their side effects twice.
+Retrying such calls is safe because ``LLM.call`` catches and logs tool
+errors -- an exception that reaches the retry loop came from the
+completion request, before any tool ran.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import itertools
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+from crewai.llm import LLM
+
+from src.config import settings
+
+TRANSIENT_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+_TRANSIENT_NAMES = (
+    "RateLimit",
+    "Timeout",
+    "APIConnection",
+    "ServiceUnavailable",
+    "InternalServer",
+    "BadGateway",
+)
+
+# Latency samples a model needs before its percentile is trusted
+MIN_HEDGE_SAMPLES = 20
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether retrying the same call could plausibly succeed."""
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    if getattr(exc, "status_code", None) in TRANSIENT_STATUS_CODES:
+        return True
+    return any(name in type(exc).__name__ for name in _TRANSIENT_NAMES)
+
+
+def backoff_delay(
+    attempt: int,
+    base: float,
+    cap: float,
+    rng: Callable[[float, float], float] = random.uniform,
+) -> float:
+    """Full-jitter backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return rng(0.0, min(cap, base * 2**attempt))
+
+
+class LatencyTracker:
+    """Rolling per-model latencies used to decide when to hedge."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._samples: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[model].append(seconds)
+
+    def percentile(self, model: str, pct: float) -> float | None:
+        """Latency below which ``pct`` % of calls finished, once known."""
+        with self._lock:
+            samples = list(self._samples[model])
+        if len(samples) < MIN_HEDGE_SAMPLES:
+            return None
+        cuts = statistics.quantiles(samples, n=100)  # the 1st..99th percentiles
+        return cuts[min(max(int(pct), 1), len(cuts)) - 1]
+
+
+# Process-wide state shared by every ResilientLLM
+latency_tracker = LatencyTracker()
+stats = {"retries": 0, "hedges": 0, "hedge_wins": 0}
+_stats_lock = threading.Lock()
+_hedge_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-hedge")
+
+
+def _runs_tools(args: tuple, kwargs: dict) -> bool:
+    """Whether ``LLM.call`` was given tools to execute itself."""
+    # call(messages, tools, callbacks, available_functions, ...)
+    functions = kwargs.get("available_functions") or (
+        args[1] if len(args) > 1 else None
+    )
+    return bool(functions)
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        stats[name] += 1
+
+
+class ResilientLLM(LLM):
+    """``LLM`` that retries transient failures and hedges slow calls."""
+
+    def call(self, messages, tools=None, *args: Any, **kwargs: Any) -> Any:
+        for attempt in itertools.count():
+            try:
+                return self._hedged(messages, tools, args, kwargs)
+            except Exception as exc:
+                delay = self._retry_delay(attempt, exc)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+    async def acall(self, messages, tools=None, *args: Any, **kwargs: Any) -> Any:
+        for attempt in itertools.count():
+            try:
+                return await self._ahedged(messages, tools, args, kwargs)
+            except Exception as exc:
+                delay = self._retry_delay(attempt, exc)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+    # ── Private helpers ──────────────────────────────────────────────
+
+    def _retry_delay(self, attempt: int, exc: Exception) -> float | None:
+        if attempt >= settings.llm_max_retries or not is_transient(exc):
+            return None
+        _count("retries")
+        return backoff_delay(
+            attempt, settings.llm_backoff_base, settings.llm_backoff_max
+        )
+
+    def _hedge_after(self, args, kwargs) -> float | None:
+        pct = settings.llm_hedge_percentile
+        if pct <= 0 or self.stream or _runs_tools(args, kwargs):
+            return None
+        return latency_tracker.percentile(self.model, pct)
+
+    def _attempt(self, messages, tools, args, kwargs) -> Any:
+        start = time.perf_counter()
+        result = super().call(messages, tools, *args, **kwargs)
+        latency_tracker.record(self.model, time.perf_counter() - start)
+        return result
+
+    async def _aattempt(self, messages, tools, args, kwargs) -> Any:
+        start = time.perf_counter()
+        result = await super().acall(messages, tools, *args, **kwargs)
+        latency_tracker.record(self.model, time.perf_counter() - start)
+        return result
+
+    def _submit(self, *call_args) -> Future:
+        # Each attempt gets its own copy of the caller's context (event scope)
+        ctx = contextvars.copy_context()
+        return _hedge_pool.submit(ctx.run, self._attempt, *call_args)
+
+    def _hedged(self, messages, tools, args, kwargs) -> Any:
+        threshold = self._hedge_after(args, kwargs)
+        if threshold is None:
+            return self._attempt(messages, tools, args, kwargs)
+
+        primary = self._submit(messages, tools, args, kwargs)
+        if wait([primary], timeout=threshold).done:
+            return primary.result()
+
+        _count("hedges")
+        backup = self._submit(messages, tools, args, kwargs)
+        pending = {primary, backup}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        _count("hedge_wins")
+                    return future.result()  # the loser's answer is dropped
+                error = future.exception()
+        raise error
+
+    async def _ahedged(self, messages, tools, args, kwargs) -> Any:
+        threshold = self._hedge_after(args, kwargs)
+        if threshold is None:
+            return await self._aattempt(messages, tools, args, kwargs)
+
+        primary = asyncio.ensure_future(
+            self._aattempt(messages, tools, args, kwargs)
+        )
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+        if done:
+            return primary.result()
+
+        _count("hedges")
+        backup = asyncio.ensure_future(
+            self._aattempt(messages, tools, args, kwargs)
+        )
+        pending = {primary, backup}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    if future.exception() is None:
+                        if future is backup:
+                            _count("hedge_wins")
+                        return future.result()
+                    error = future.exception()
+            raise error
+        finally:
+            for future in pending:
+                future.cancel()
@@ -2,17 +2,60 @@
 
 Loads environment variables and provides validated settings
 used across all agents, tools, and workflows.
+
+Nothing happens at import time: ``.env`` is read, ``GROQ_API_KEY`` is
+validated (unless ``LLM_BACKEND=fake``) and ``output_dir`` is created
+the first time an attribute of ``settings`` is accessed, so ``--help``
+and argument validation work without credentials.
 """
 
 from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-load_dotenv()
+# Tokens each upstream stage may take up in the manager's context digest
+DEFAULT_CONTEXT_BUDGETS = {
+	"market_research": 450,
+	"competitor_analysis": 350,
+	"copywriting": 700,
+	"visual_direction": 350,
+}
+
+
+def _context_budgets() -> dict[str, int]:
+	"""Defaults, overridden by ``CONTEXT_BUDGETS=copywriting=900,...``."""
+	budgets = dict(DEFAULT_CONTEXT_BUDGETS)
+	for item in filter(None, os.getenv("CONTEXT_BUDGETS", "").split(",")):
+		name, _, tokens = item.partition("=")
+		try:
+			budgets[name.strip()] = int(tokens)
+		except ValueError:
+			raise EnvironmentError(
+				f"CONTEXT_BUDGETS entry {item!r} must look like stage=tokens."
+			) from None
+	return budgets
+
+
+# Agents whose model can be set through ``AGENT_MODELS``
+AGENT_NAMES = ("researcher", "copywriter", "art_director", "manager")
+
+
+def _model_map(variable: str) -> dict[str, str]:
+	"""``name=model`` pairs from a comma-separated environment variable."""
+	models: dict[str, str] = {}
+	for item in filter(None, os.getenv(variable, "").split(",")):
+		name, _, model = item.partition("=")
+		if not name.strip() or not model.strip():
+			raise EnvironmentError(
+				f"{variable} entry {item!r} must look like name=model."
+			)
+		models[name.strip()] = model.strip()
+	return models
 
 
 @dataclass(frozen=True)
@@ -27,21 +70,138 @@ class Settings:
 			"GROQ_MODEL", "llama-3.3-70b-versatile"
 		)
 	)
+	# Per-agent / per-task models; unlisted ones use ``groq_model``
+	agent_models: dict[str, str] = field(
+		default_factory=lambda: _model_map("AGENT_MODELS")
+	)
+	task_models: dict[str, str] = field(
+		default_factory=lambda: _model_map("TASK_MODELS")
+	)
+	# Model a stage is re-run on after a failed or weak answer from a
+	# smaller one; empty means ``groq_model``, "off" disables
+	fallback_model: str = field(
+		default_factory=lambda: os.getenv("FALLBACK_MODEL", "")
+	)
+	fallback_min_chars: int = field(
+		default_factory=lambda: int(os.getenv("FALLBACK_MIN_CHARS", "80"))
+	)
 	temperature: float = field(
 		default_factory=lambda: float(os.getenv("GROQ_TEMPERATURE", "0.7"))
 	)
+	# Client-side limits shared by all agents; 0 disables (Groq free tier)
+	groq_rpm: int = field(
+		default_factory=lambda: int(os.getenv("GROQ_RPM", "30"))
+	)
+	groq_tpm: int = field(
+		default_factory=lambda: int(os.getenv("GROQ_TPM", "12000"))
+	)
+	# Retry / hedging policy for LLM calls (see src.agents.resilience)
+	llm_max_retries: int = field(
+		default_factory=lambda: int(os.getenv("LLM_MAX_RETRIES", "3"))
+	)
+	llm_backoff_base: float = field(
+		default_factory=lambda: float(os.getenv("LLM_BACKOFF_BASE", "1.0"))
+	)
+	llm_backoff_max: float = field(
+		default_factory=lambda: float(os.getenv("LLM_BACKOFF_MAX", "30"))
+	)
+	llm_hedge_percentile: float = field(
+		default_factory=lambda: float(os.getenv("LLM_HEDGE_PERCENTILE", "0"))
+	)
+	# Seconds a single stage may run before the run fails; 0 disables
+	stage_timeout: float = field(
+		default_factory=lambda: float(os.getenv("STAGE_TIMEOUT", "600"))
+	)
+	# Hand the manager per-stage digests instead of every raw output
+	compact_context: bool = field(
+		default_factory=lambda: os.getenv("COMPACT_CONTEXT", "true").lower()
+		not in ("0", "false", "no", "off")
+	)
+	context_budgets: dict[str, int] = field(default_factory=_context_budgets)
+	# "groq", or "fake" for the offline stand-in in src.agents.fake_llm
+	llm_backend: str = field(
+		default_factory=lambda: os.getenv("LLM_BACKEND", "groq").lower()
+	)
+	fake_llm_latency: float = field(
+		default_factory=lambda: float(os.getenv("FAKE_LLM_LATENCY", "0"))
+	)
+	fake_llm_tps: float = field(
+		default_factory=lambda: float(os.getenv("FAKE_LLM_TPS", "0"))
+	)
+	fake_llm_script: str = field(
+		default_factory=lambda: os.getenv("FAKE_LLM_SCRIPT", "")
+	)
 	serper_api_key: str = field(
 		default_factory=lambda: os.getenv("SERPER_API_KEY", "")
 	)
+	# Serper response cache (see src.tools.search_cache); a TTL of 0 disables
+	search_cache_ttl: float = field(
+		default_factory=lambda: float(os.getenv("SEARCH_CACHE_TTL", "24"))
+	)
+	search_cache_stale: float = field(
+		default_factory=lambda: float(os.getenv("SEARCH_CACHE_STALE", "168"))
+	)
+	search_cache_max_entries: int = field(
+		default_factory=lambda: int(
+			os.getenv("SEARCH_CACHE_MAX_ENTRIES", "10000")
+		)
+	)
+	# Word lists of the copy evaluator (see src.tools.lexicon); empty = bundled
+	copy_lexicon: str = field(
+		default_factory=lambda: os.getenv("COPY_LEXICON", "")
+	)
+	# Shared keep-alive HTTP client of the tools (see src.tools.http)
+	http_timeout: float = field(
+		default_factory=lambda: float(os.getenv("HTTP_TIMEOUT", "15"))
+	)
+	http_max_connections: int = field(
+		default_factory=lambda: int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+	)
+	http2: bool = field(
+		default_factory=lambda: os.getenv("HTTP2", "false").lower()
+		in ("1", "true", "yes", "on")
+	)
 	output_dir: Path = field(
 		default_factory=lambda: Path(os.getenv("OUTPUT_DIR", "src/output"))
 	)
+	llm_cache_mode: str = field(
+		default_factory=lambda: os.getenv("LLM_CACHE", "off").lower()
+	)
+	llm_cache_max_mb: int = field(
+		default_factory=lambda: int(os.getenv("LLM_CACHE_MAX_MB", "256"))
+	)
+	research_max_age_days: float = field(
+		default_factory=lambda: float(os.getenv("RESEARCH_MAX_AGE_DAYS", "7"))
+	)
+	# Reused stage outputs (see src.workflow.stage_cache)
+	stage_cache_max_age_days: float = field(
+		default_factory=lambda: float(os.getenv("STAGE_CACHE_MAX_AGE_DAYS", "1"))
+	)
+	stage_cache_max_entries: int = field(
+		default_factory=lambda: int(os.getenv("STAGE_CACHE_MAX_ENTRIES", "500"))
+	)
 
 	def __post_init__(self) -> None:
-		if not self.groq_api_key:
+		if self.llm_backend not in ("groq", "fake"):
+			raise EnvironmentError("LLM_BACKEND must be one of: groq, fake.")
+		if self.llm_backend == "groq" and not self.groq_api_key:
 			raise EnvironmentError(
 				"GROQ_API_KEY is required. Set it in your .env file."
 			)
+		unknown = set(self.agent_models) - set(AGENT_NAMES)
+		if unknown:
+			raise EnvironmentError(
+				f"AGENT_MODELS names unknown agents: {', '.join(sorted(unknown))}. "
+				f"Use {', '.join(AGENT_NAMES)}."
+			)
+		if self.llm_cache_mode not in ("off", "on", "replay"):
+			raise EnvironmentError(
+				"LLM_CACHE must be one of: off, on, replay."
+			)
+		if not 0 <= self.llm_hedge_percentile < 100:
+			raise EnvironmentError(
+				"LLM_HEDGE_PERCENTILE must be at least 0 and below 100."
+			)
 		# Ensure output directory exists
 		self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -50,6 +210,48 @@ class Settings:
 		"""Check whether real web-search is available."""
 		return bool(self.serper_api_key)
 
+	@property
+	def checkpoint_dir(self) -> Path:
+		"""Where per-stage checkpoints of each campaign run are kept."""
+		return self.output_dir / "checkpoints"
+
+	@property
+	def stage_cache_dir(self) -> Path:
+		"""Where fingerprinted stage outputs are shared across runs."""
+		return self.output_dir / "stage_cache"
+
+	@property
+	def llm_cache_dir(self) -> Path:
+		"""Where recorded LLM responses are kept, keyed by request hash."""
+		return self.output_dir / "llm_cache"
+
+	@property
+	def search_cache_path(self) -> Path:
+		"""SQLite file of cached web-search responses."""
+		return self.output_dir / "search_cache.sqlite3"
+
+	@property
+	def research_store_dir(self) -> Path:
+		"""Where category-level research is shared between campaigns."""
+		return self.output_dir / "research"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+	"""Build the settings singleton on first use."""
+	load_dotenv()
+	return Settings()
+
+
+class _LazySettings:
+	"""Stand-in for ``Settings`` that defers building it until first use."""
+
+	def __getattr__(self, name: str):
+		return getattr(get_settings(), name)
+
+	def __repr__(self) -> str:
+		return repr(get_settings())
+
 
 # Module-level singleton — import this everywhere
-settings = Settings()
+settings: Settings = _LazySettings()  # type: ignore[assignment]
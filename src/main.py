@@ -5,25 +5,40 @@ CLI entry-point for the Multi-Agent Campaign Creator.
 Usage:
     python -m src.main --demo        # Run with sample product
     python -m src.main               # Interactive mode
+    python -m src.main --sequential  # Disable concurrent stages
+    python -m src.main --batch requests.jsonl --workers 4
+    python -m src.main --resume <run_id>  # Retry a failed run
+    python -m src.main --demo --llm-cache replay  # Zero-token rerun
+    python -m src.main --demo --estimate          # Cost/time, no LLM calls
+    python -m src.main --demo --fake-llm          # Offline, deterministic
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
 from src.models.campaign_models import (
     CampaignChannel,
     CampaignRequest,
     CopyTone,
 )
-from src.workflow.crew_workflow import CampaignCrew
+
+# CrewAI and LiteLLM take seconds to import; workflow modules are pulled in
+# only once a campaign actually runs so --help and validation stay instant.
+if TYPE_CHECKING:
+    from src.workflow.crew_workflow import CampaignCrew
+    from src.workflow.estimate import CampaignEstimate
 
 console = Console()
 
@@ -61,6 +76,7 @@ DEMO_REQUEST = CampaignRequest(
         "Coway Airmega. Our differentiator is the AI-learning feature "
         "that adapts to individual preferences over time."
     ),
+    category="air purifiers",
 )
 
 
@@ -120,6 +136,12 @@ def gather_request_interactive() -> CampaignRequest:
     )
     tone = TONE_MAP.get(tone_str.strip().lower(), CopyTone.PROFESSIONAL)
 
+    category = Prompt.ask(
+        "[bold]Product category[/bold] (optional, shares research with "
+        "earlier campaigns in the same market)",
+        default="",
+    )
+
     extra = Prompt.ask(
         "[bold]Additional context[/bold] (optional, press Enter to skip)",
         default="",
@@ -134,6 +156,7 @@ def gather_request_interactive() -> CampaignRequest:
         channels=channels,
         brand_voice=tone,
         additional_context=extra if extra else None,
+        category=category.strip() or None,
     )
 
 
@@ -158,8 +181,16 @@ def display_request_summary(request: CampaignRequest) -> None:
     )
 
 
-def run_campaign(request: CampaignRequest) -> None:
+def run_campaign(
+    request: CampaignRequest,
+    concurrent: bool = True,
+    run_id: str | None = None,
+    reuse_stages: bool = True,
+    stream: bool = False,
+) -> None:
     """Execute the full multi-agent campaign workflow."""
+    from src.tasks.digest import fit_to_budget
+    from src.workflow.crew_workflow import CampaignCrew
 
     display_request_summary(request)
 
@@ -167,7 +198,14 @@ def run_campaign(request: CampaignRequest) -> None:
 
     # Build the crew
     try:
-        crew = CampaignCrew(request)
+        crew = CampaignCrew(
+            request,
+            concurrent=concurrent,
+            run_id=run_id,
+            reuse_stages=reuse_stages,
+            stream=stream,
+            seed_research=reuse_stages,
+        )
     except Exception as exc:
         console.print(f"[bold red]Failed to initialize crew:[/bold red] {exc}")
         console.print(
@@ -184,10 +222,16 @@ def run_campaign(request: CampaignRequest) -> None:
     console.print()
 
     # Execute
+    mode = (
+        "Independent stages run in parallel; each agent builds on the "
+        "results it depends on."
+        if concurrent
+        else "Each agent will work sequentially, building on previous results."
+    )
     console.print(
         Panel(
             "[bold]Running campaign workflow...[/bold]\n"
-            "Each agent will work sequentially, building on previous results.\n"
+            f"{mode}\n"
             "This typically takes 2-5 minutes depending on your LLM provider.",
             title="⏳ Execution Started",
             border_style="yellow",
@@ -197,26 +241,30 @@ def run_campaign(request: CampaignRequest) -> None:
 
     try:
         brief = crew.run()
+        display_trace(crew)
+        display_llm_cache_stats()
+        display_search_cache_stats()
+        display_resilience_stats()
         console.print(
             Panel(
                 f"[bold green]Campaign '{brief.campaign_name}' "
                 f"completed successfully![/bold green]\n\n"
                 f"[bold]Executive Summary:[/bold]\n"
-                f"{brief.executive_summary[:800]}...\n\n"
+                f"{fit_to_budget(brief.executive_summary, 200)}\n\n"
                 f"[dim]Full brief saved to src/output/[/dim]",
                 title="✅ Campaign Complete",
                 border_style="green",
             )
         )
     except Exception as exc:
+        display_trace(crew)
+        display_resilience_stats()
         console.print(
             Panel(
                 f"[bold red]Campaign execution failed:[/bold red]\n\n{exc}\n\n"
-                "[yellow]Common fixes:[/yellow]\n"
-                "1. Check your API key is valid and has credits\n"
-                "2. Check your internet connection\n"
-                "3. Try a different model in .env\n"
-                "4. Check the full traceback below",
+                f"{_failure_hint(exc)}\n\n"
+                "[cyan]Completed stages were checkpointed. Resume with:[/cyan]\n"
+                f"  python -m src.main --resume {crew.run_id}",
                 title="❌ Error",
                 border_style="red",
             )
@@ -225,6 +273,316 @@ def run_campaign(request: CampaignRequest) -> None:
         sys.exit(1)
 
 
+def display_trace(crew: CampaignCrew) -> None:
+    """Print the per-stage time / token / cost breakdown of a run."""
+    if crew.trace is None:
+        return
+
+    table = Table(title="⏱️  Stage Breakdown", border_style="bright_blue")
+    table.add_column("Stage", style="bold")
+    table.add_column("Status")
+    table.add_column("Model")
+    table.add_column("Time", justify="right")
+    table.add_column("Queued", justify="right")
+    table.add_column("LLM calls", justify="right")
+    table.add_column("Tools", justify="right")
+    table.add_column("Tokens in/out", justify="right")
+    table.add_column("Cost", justify="right")
+    for stage in crew.trace.stages:
+        calls = str(stage.llm_calls)
+        if stage.max_iter:
+            calls += f"/{stage.max_iter}"
+        model = stage.model.rpartition("/")[2] if stage.llm_calls else "—"
+        if stage.fallback:
+            model += f" ↻ ({stage.fallback})"
+        table.add_row(
+            stage.name,
+            stage.status,
+            model,
+            f"{stage.seconds:.1f}s",
+            f"{stage.rate_limit_wait:.1f}s",
+            calls,
+            str(stage.tool_calls),
+            f"{stage.prompt_tokens:,}/{stage.completion_tokens:,}",
+            "—" if stage.cost_usd is None else f"${stage.cost_usd:.4f}",
+        )
+
+    totals = crew.trace.to_dict()["totals"]
+    cost = totals["cost_usd"]
+    table.add_row(
+        "Total",
+        "",
+        "",
+        f"{crew.trace.wall_seconds:.1f}s",
+        f"{totals['rate_limit_wait']:.1f}s",
+        str(totals["llm_calls"]),
+        str(totals["tool_calls"]),
+        f"{totals['prompt_tokens']:,}/{totals['completion_tokens']:,}",
+        "—" if cost is None else f"${cost:.4f}",
+        style="bold",
+    )
+    console.print()
+    console.print(table)
+
+
+def display_llm_cache_stats() -> None:
+    """Summarise LLM cache use when the cache is enabled."""
+    from src.agents.llm_cache import response_cache
+
+    if response_cache.mode == "off":
+        return
+    stats = response_cache.stats()
+    console.print(
+        f"[dim]LLM cache ({response_cache.mode}): {stats['hits']} hits, "
+        f"{stats['misses']} misses, {stats['entries']} entries "
+        f"({stats['bytes'] / 1024:.0f} KiB)[/dim]"
+    )
+
+
+def display_search_cache_stats() -> None:
+    """Summarise web-search cache use, if any live search was made."""
+    from src.tools.search_cache import search_cache
+
+    if not search_cache.hits + search_cache.stale_hits + search_cache.misses:
+        return
+    stats = search_cache.stats()
+    console.print(
+        f"[dim]Search cache: {stats['hits']} hits, {stats['stale_hits']} "
+        f"stale (refreshed in background), {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%} served locally), {stats['entries']} "
+        f"entries[/dim]"
+    )
+
+
+def display_resilience_stats() -> None:
+    """Mention retried and hedged LLM calls, if there were any."""
+    from src.agents.resilience import stats
+
+    if not stats["retries"] and not stats["hedges"]:
+        return
+    console.print(
+        f"[dim]LLM resilience: {stats['retries']} retries, {stats['hedges']} "
+        f"hedged calls ({stats['hedge_wins']} won by the hedge)[/dim]"
+    )
+
+
+def _failure_hint(exc: BaseException) -> str:
+    """What to try next, based on why the run failed."""
+    from src.agents.resilience import is_transient
+    from src.config import settings
+    from src.workflow.scheduler import StageTimeoutError
+
+    if isinstance(exc, StageTimeoutError):
+        return (
+            "[yellow]A stage hit its deadline:[/yellow]\n"
+            f"1. Raise STAGE_TIMEOUT (currently {settings.stage_timeout:g}s) "
+            "or set it to 0\n"
+            "2. Lower GROQ_RPM / GROQ_TPM if calls were queued for long\n"
+            "3. Check the stage breakdown above for the slow stage"
+        )
+    if is_transient(exc):
+        return (
+            f"[yellow]Groq kept failing after {settings.llm_max_retries} "
+            "retries:[/yellow]\n"
+            "1. Check https://groqstatus.com or wait a minute and resume\n"
+            "2. Raise LLM_MAX_RETRIES / LLM_BACKOFF_MAX\n"
+            "3. Check your internet connection"
+        )
+    return (
+        "[yellow]Common fixes:[/yellow]\n"
+        "1. Check your API key is valid and has credits\n"
+        "2. Check your internet connection\n"
+        "3. Try a different model in .env\n"
+        "4. Check the full traceback below"
+    )
+
+
+def display_estimate(estimate: CampaignEstimate) -> None:
+    """Print the projected per-stage calls, tokens, cost and time."""
+    table = Table(
+        title=f"🧮 Estimate — {estimate.product_name}", border_style="bright_blue"
+    )
+    table.add_column("Stage", style="bold")
+    table.add_column("LLM calls", justify="right")
+    table.add_column("Tokens in/out", justify="right")
+    table.add_column("Cost", justify="right")
+    table.add_column("Worst case", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Based on")
+    for stage in estimate.stages:
+        table.add_row(
+            stage.name,
+            f"{stage.llm_calls:g}/{stage.max_iter}",
+            f"{stage.prompt_tokens:,}/{stage.completion_tokens:,}",
+            _usd(stage.cost_usd),
+            _usd(stage.max_cost_usd),
+            f"{stage.seconds:.1f}s",
+            stage.source,
+        )
+    table.add_row(
+        "Total",
+        f"{estimate.llm_calls:g}/{estimate.max_llm_calls}",
+        f"{estimate.prompt_tokens:,}/{estimate.completion_tokens:,}",
+        _usd_total(estimate.cost_usd, estimate.partial_cost_usd),
+        _usd(estimate.max_cost_usd),
+        f"{estimate.critical_path_seconds:.1f}s",
+        "",
+        style="bold",
+    )
+    console.print()
+    console.print(table)
+    if estimate.unpriced_stages:
+        console.print(
+            "[yellow]No price is known for the model of: "
+            f"{', '.join(estimate.unpriced_stages)}.[/yellow]"
+        )
+    if estimate.wall_seconds > estimate.critical_path_seconds:
+        console.print(
+            f"[yellow]Rate limits (GROQ_RPM / GROQ_TPM) stretch the run to "
+            f"~{estimate.wall_seconds:.0f}s.[/yellow]"
+        )
+
+
+def estimate_request(
+    request: CampaignRequest, concurrent: bool, max_cost: float | None
+) -> None:
+    """Dry run: project a campaign's cost and time without calling the LLM."""
+    from src.workflow.estimate import estimate_campaign
+
+    estimate = estimate_campaign(request, concurrent=concurrent)
+    display_estimate(estimate)
+    _check_budget(estimate.cost_usd, max_cost)
+
+
+def _check_budget(cost: float | None, max_cost: float | None) -> None:
+    """Exit non-zero when the projected cost exceeds ``--max-cost``.
+
+    A cost that cannot be priced (a model missing from the price table)
+    fails the check too: the budget cannot be shown to hold.
+    """
+    if max_cost is None:
+        return
+    if cost is None:
+        console.print(
+            f"[bold red]Cannot check --max-cost {_usd(max_cost)}: no price "
+            "is known for at least one routed model.[/bold red]"
+        )
+        sys.exit(2)
+    if cost <= max_cost:
+        return
+    console.print(
+        f"[bold red]Estimated cost {_usd(cost)} exceeds --max-cost "
+        f"{_usd(max_cost)}.[/bold red]"
+    )
+    sys.exit(2)
+
+
+def _usd(cost: float | None) -> str:
+    return "—" if cost is None else f"${cost:.4f}"
+
+
+def _usd_total(cost: float | None, partial: float | None) -> str:
+    """A total, or the priced part of it marked as partial."""
+    if cost is None and partial is not None:
+        return f"{_usd(partial)} (partial)"
+    return _usd(cost)
+
+
+def run_batch_file(
+    path: Path,
+    workers: int,
+    concurrent: bool = True,
+    reuse_stages: bool = True,
+    estimate_only: bool = False,
+    max_cost: float | None = None,
+) -> None:
+    """Run every request in a JSONL file and print a throughput summary.
+
+    With ``estimate_only`` the batch is only projected; with ``max_cost``
+    it does not start when the projection is over budget.
+    """
+    from src.workflow.batch import BatchResult, load_requests, run_batch
+
+    if not path.is_file():
+        console.print(f"[bold red]Batch file not found:[/bold red] {path}")
+        sys.exit(1)
+
+    items, errors = load_requests(path)
+    for error in errors:
+        console.print(f"[yellow]Skipping invalid request — {error}[/yellow]")
+    if not items:
+        console.print("[bold red]No valid campaign requests to run.[/bold red]")
+        sys.exit(1)
+
+    if estimate_only or max_cost is not None:
+        from src.workflow.estimate import estimate_batch
+
+        projection = estimate_batch(
+            [item.request for item in items], workers, concurrent=concurrent
+        )
+        table = Table(title="🧮 Batch Estimate", border_style="bright_blue")
+        table.add_column("Metric", style="bold")
+        table.add_column("Value", justify="right")
+        table.add_row("Campaigns", str(len(projection.campaigns)))
+        table.add_row("Tokens", f"{projection.total_tokens:,}")
+        table.add_row(
+            "Cost", _usd_total(projection.cost_usd, projection.partial_cost_usd)
+        )
+        table.add_row("Worst case", _usd(projection.max_cost_usd))
+        table.add_row(
+            "Wall time",
+            f"~{projection.wall_seconds / 60:.1f} min "
+            f"({projection.workers} workers)",
+        )
+        console.print()
+        console.print(table)
+        _check_budget(projection.cost_usd, max_cost)
+        if estimate_only:
+            return
+
+    console.print(
+        f"\n[cyan]Running {len(items)} campaigns with "
+        f"{workers} workers...[/cyan]\n"
+    )
+
+    def report_progress(result: BatchResult) -> None:
+        if result.ok:
+            console.print(
+                f"[green]✓[/green] line {result.line}: {result.product_name} "
+                f"[dim]({result.seconds:.1f}s)[/dim]"
+            )
+        else:
+            console.print(
+                f"[red]✗[/red] line {result.line}: {result.product_name} "
+                f"— {result.error}"
+            )
+
+    report = run_batch(
+        items,
+        workers=workers,
+        concurrent=concurrent,
+        reuse_stages=reuse_stages,
+        on_result=report_progress,
+    )
+
+    table = Table(title="📊 Batch Summary", border_style="bright_blue")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", justify="right")
+    table.add_row("Succeeded", str(len(report.succeeded)))
+    table.add_row("Failed", str(len(report.failed) + len(errors)))
+    table.add_row("Wall time", f"{report.wall_seconds:.1f}s")
+    table.add_row("Throughput", f"{report.campaigns_per_minute:.2f} campaigns/min")
+    table.add_row("p50 per campaign", f"{report.p50_seconds:.1f}s")
+    table.add_row("p95 per campaign", f"{report.p95_seconds:.1f}s")
+    console.print()
+    console.print(table)
+    display_llm_cache_stats()
+    display_search_cache_stats()
+
+    if report.failed or errors:
+        sys.exit(1)
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -234,6 +592,8 @@ def main() -> None:
             "Examples:\n"
             "  python -m src.main --demo    Run with sample product\n"
             "  python -m src.main           Interactive mode\n"
+            "  python -m src.main --batch requests.jsonl --workers 4\n"
+            "  python -m src.main --batch requests.jsonl --estimate\n"
         ),
     )
     parser.add_argument(
@@ -241,6 +601,71 @@ def main() -> None:
         action="store_true",
         help="Run with the built-in demo product (AeroFlow Pro)",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run agents one after another instead of in parallel stages",
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="FILE",
+        help="Run every CampaignRequest in a JSONL file (one per line)",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help=(
+            "Regenerate every stage instead of reusing unchanged ones or "
+            "stored category research"
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print agent output token by token and save it live to Markdown",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        choices=["off", "on", "replay"],
+        help=(
+            "Reuse recorded LLM responses: 'on' records and reuses, "
+            "'replay' fails on any unrecorded call (default: $LLM_CACHE or off)"
+        ),
+    )
+    parser.add_argument(
+        "--fake-llm",
+        action="store_true",
+        help=(
+            "Answer with the offline, deterministic fake model instead of "
+            "Groq (same as LLM_BACKEND=fake)"
+        ),
+    )
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help=(
+            "Project tokens, cost and wall time from the rendered prompts "
+            "and past runs, without calling the LLM"
+        ),
+    )
+    parser.add_argument(
+        "--max-cost",
+        type=float,
+        metavar="USD",
+        help="Exit with status 2 instead of running when the estimated cost is higher",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Resume a failed run from its first incomplete stage",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent campaigns in batch mode (default: 4)",
+    )
     args = parser.parse_args()
 
     console.print(
@@ -251,14 +676,67 @@ def main() -> None:
         )
     )
 
+    if args.fake_llm:
+        # Settings are built on first use, so every get_llm() sees this
+        os.environ["LLM_BACKEND"] = "fake"
+
+    if args.llm_cache:
+        from src.agents.llm_cache import response_cache
+
+        response_cache.mode = args.llm_cache
+
     try:
+        if args.batch:
+            run_batch_file(
+                args.batch,
+                args.workers,
+                concurrent=not args.sequential,
+                reuse_stages=not args.fresh,
+                estimate_only=args.estimate,
+                max_cost=args.max_cost,
+            )
+            return
+
+        if args.resume:
+            from src.workflow.checkpoint import CheckpointError, CheckpointStore
+
+            try:
+                request, concurrent = CheckpointStore.open(
+                    args.resume
+                ).load_run()
+            except CheckpointError as exc:
+                console.print(f"[bold red]{exc}[/bold red]")
+                sys.exit(1)
+            console.print(f"\n[cyan]Resuming run {args.resume}...[/cyan]\n")
+            run_campaign(
+                request,
+                concurrent=concurrent,
+                run_id=args.resume,
+                reuse_stages=not args.fresh,
+                stream=args.stream,
+            )
+            return
+
         if args.demo:
-            console.print("\n[cyan]Running demo campaign for AeroFlow Pro...[/cyan]\n")
+            action = "Estimating" if args.estimate else "Running"
+            console.print(
+                f"\n[cyan]{action} demo campaign for AeroFlow Pro...[/cyan]\n"
+            )
             request = DEMO_REQUEST
         else:
             request = gather_request_interactive()
 
-        run_campaign(request)
+        if args.estimate or args.max_cost is not None:
+            estimate_request(request, not args.sequential, args.max_cost)
+            if args.estimate:
+                return
+
+        run_campaign(
+            request,
+            concurrent=not args.sequential,
+            reuse_stages=not args.fresh,
+            stream=args.stream,
+        )
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Cancelled by user.[/yellow]")
@@ -3,6 +3,7 @@
 from src.models.campaign_models import (
 	CampaignBrief,
 	CampaignRequest,
+	ChannelCopy,
 	CopyPackage,
 	MarketResearch,
 	VisualDirection,
@@ -13,6 +14,7 @@ from src.models.campaign_models import (
 __all__ = [
 	"CampaignBrief",
 	"CampaignRequest",
+	"ChannelCopy",
 	"CopyPackage",
 	"MarketResearch",
 	"VisualDirection",
@@ -41,6 +41,9 @@ class CampaignRequest(BaseModel):
     channels: List[CampaignChannel] = Field(default_factory=list)
     brand_voice: CopyTone = CopyTone.PROFESSIONAL
     additional_context: Optional[str] = None
+    # Market the product competes in, e.g. "air purifiers"; campaigns in
+    # the same category share their trend and competitor research
+    category: Optional[str] = None
 
 
 class CampaignBrief(BaseModel):
@@ -74,29 +77,65 @@ class CampaignBrief(BaseModel):
 class MarketResearch(BaseModel):
     """Market research output"""
     
-    market_summary: str = ""
-    trends: List[str] = Field(default_factory=list)
-    opportunities: List[str] = Field(default_factory=list)
-    audience_insights: Dict = Field(default_factory=dict)
-    competitive_landscape: Dict = Field(default_factory=dict)
+    market_summary: str = Field(
+        "", description="Two or three sentences on the market and where the product fits"
+    )
+    trends: List[str] = Field(
+        default_factory=list, description="Current market trends, one per item"
+    )
+    opportunities: List[str] = Field(
+        default_factory=list,
+        description="Market gaps and recommended campaign angles, one per item",
+    )
+    audience_insights: Dict = Field(
+        default_factory=dict,
+        description="Persona name -> who they are, what they need, how to reach them",
+    )
+    competitive_landscape: Dict = Field(
+        default_factory=dict,
+        description="Competitor name -> positioning, strengths and weaknesses",
+    )
+
+
+class ChannelCopy(BaseModel):
+    """Copy for a single channel."""
+
+    headline: str = Field("", description="Headline")
+    sub_headline: str = Field("", description="Sub-headline")
+    body: str = Field("", description="Body copy within the channel's length limits")
+    cta: str = Field("", description="Call to action")
 
 
 class CopyPackage(BaseModel):
     """Structured copy package for campaign execution."""
 
-    campaign_tagline: str = ""
-    elevator_pitch: str = ""
-    channel_copy: Dict[str, Dict[str, str]] = Field(default_factory=dict)
-    email_subjects: List[str] = Field(default_factory=list)
-    hashtags: List[str] = Field(default_factory=list)
+    campaign_tagline: str = Field("", description="One overarching campaign tagline")
+    elevator_pitch: str = Field("", description="A 2-sentence elevator pitch")
+    channel_copy: Dict[str, Dict[str, str]] = Field(
+        default_factory=dict,
+        description="Channel -> {headline, sub_headline, body, cta}",
+    )
+    email_subjects: List[str] = Field(
+        default_factory=list, description="Email subject-line options"
+    )
+    hashtags: List[str] = Field(
+        default_factory=list, description="Hashtag suggestions, with the #"
+    )
 
 
 class VisualDirection(BaseModel):
     """Structured visual direction for creative assets."""
 
-    brand_visual_identity: str = ""
-    key_visuals: List[str] = Field(default_factory=list)
-    image_prompts: List[str] = Field(default_factory=list)
+    brand_visual_identity: str = Field(
+        "", description="Palette, typography, mood and composition notes"
+    )
+    key_visuals: List[str] = Field(
+        default_factory=list, description="Key visual concepts, one per item"
+    )
+    image_prompts: List[str] = Field(
+        default_factory=list,
+        description="An image generation prompt for each key visual",
+    )
 
 
 class CreativeOutput(BaseModel):
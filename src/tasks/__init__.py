@@ -1,5 +1,9 @@
 """Task definitions for the campaign creation workflow"""
 
-from src.tasks.campaign_tasks import CampaignTasks, CampaignTaskFactory
+from src.tasks.campaign_tasks import (
+    CampaignTaskFactory,
+    CampaignTaskGraph,
+    CampaignTasks,
+)
 
-__all__ = ["CampaignTasks", "CampaignTaskFactory"]
+__all__ = ["CampaignTasks", "CampaignTaskFactory", "CampaignTaskGraph"]
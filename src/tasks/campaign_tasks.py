@@ -1,10 +1,36 @@
 """Campaign-specific task definitions"""
 
+import json
+import re
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 from pydantic import BaseModel, Field
 from crewai import Task
+from crewai.tasks.task_output import TaskOutput
 
-from src.models import CampaignRequest
+from src.agents.rate_limiter import estimate_tokens
+from src.models import (
+    CampaignChannel,
+    CampaignRequest,
+    ChannelCopy,
+    CopyPackage,
+    MarketResearch,
+    VisualDirection,
+)
+from src.tasks.digest import (
+    clean,
+    first_sentence,
+    fit_to_budget,
+    key_points,
+    labelled_value,
+    render_points,
+    select_points,
+)
+from src.tasks.structured import StructuredTask, answer_format, stage_model
+
+if TYPE_CHECKING:
+    from src.workflow.research_store import CategoryResearch
 
 
 class TaskType(str, Enum):
@@ -14,6 +40,7 @@ class TaskType(str, Enum):
     COPYWRITING = "copywriting"
     VISUAL_DIRECTION = "visual_direction"
     CAMPAIGN_STRATEGY = "campaign_strategy"
+    CONTEXT_DIGEST = "context_digest"
 
 
 class CampaignTask(BaseModel):
@@ -69,14 +96,146 @@ class CampaignTasks:
         )
 
 
+@dataclass
+class CampaignTaskGraph:
+    """Every task of one campaign, wired together through ``context``."""
+
+    research_task: Task
+    competitor_task: Task | None
+    copy_core_task: Task | None
+    channel_copy_tasks: list[Task] = field(default_factory=list)
+    copy_task: Task | None = None
+    art_task: Task | None = None
+    digest_task: Task | None = None
+    manager_task: Task | None = None
+
+    @property
+    def research(self) -> list[Task]:
+        return [t for t in (self.research_task, self.competitor_task) if t]
+
+    @property
+    def tasks(self) -> list[Task]:
+        """All tasks in schedule order."""
+        copy_stage = [
+            *([self.copy_core_task] if self.copy_core_task else []),
+            *self.channel_copy_tasks,
+            self.copy_task,
+        ]
+        return [
+            *self.research,
+            *copy_stage,
+            self.art_task,
+            *([self.digest_task] if self.digest_task else []),
+            self.manager_task,
+        ]
+
+
+# Model fields the split research and core copy stages each fill in
+_TREND_FIELDS = ("market_summary", "trends", "audience_insights", "opportunities")
+_COMPETITOR_FIELDS = ("competitive_landscape", "opportunities")
+_CORE_COPY_FIELDS = ("campaign_tagline", "elevator_pitch", "email_subjects", "hashtags")
+
+# Research tool whose stored results each seeded stage is handed
+_SEED_TOOLS = {
+    TaskType.MARKET_RESEARCH: "trend_research",
+    TaskType.COMPETITOR_ANALYSIS: "competitor_analysis",
+}
+# Token budget of each stored tool result in a seeded prompt
+SEED_TOOL_BUDGET = 400
+
+
 class CampaignTaskFactory:
-    """Factory for CrewAI Task objects wired with dependencies."""
+    """Factory for CrewAI Task objects wired with dependencies.
+
+    Each task's ``context`` list is its set of upstream dependencies;
+    ``DagScheduler`` reads it to decide which tasks can run concurrently.
+
+    Research, copy and art direction answer in JSON for the campaign
+    models (see ``StructuredTask``), so later stages read compact fields
+    rather than prose.
+
+    The manager reads the other stages through ``context_digest_task``
+    when one is given, instead of their full raw outputs.
 
-    def __init__(self, request: CampaignRequest):
+    With ``category_research``, the research prompts carry the findings
+    already on file for the product's category and ask only for the
+    product-specific delta.
+    """
+
+    def __init__(
+        self,
+        request: CampaignRequest,
+        category_research: "CategoryResearch | None" = None,
+    ):
         self.request = request
+        self.category_research = category_research
+
+    def build_graph(
+        self,
+        concurrent: bool = True,
+        agents: Mapping[str, Any] | None = None,
+        context_budgets: Mapping[str, int] | None = None,
+    ) -> CampaignTaskGraph:
+        """Wire up every task of the campaign.
+
+        ``agents`` maps ``researcher``, ``competitor_analyst``,
+        ``copywriter``, ``channel_copywriters`` (one per channel),
+        ``art_director`` and ``manager`` to agents; missing ones are left
+        unassigned, which is enough to render prompts. With
+        ``context_budgets`` the manager reads a ``context_digest`` stage.
+        """
+        agents = agents or {}
+        if concurrent:
+            research = [
+                self.trend_research_task(agents.get("researcher")),
+                self.competitor_research_task(agents.get("competitor_analyst")),
+            ]
+        else:
+            research = [self.research_task(agents.get("researcher"))]
+        graph = CampaignTaskGraph(
+            research_task=research[0],
+            competitor_task=research[1] if concurrent else None,
+            copy_core_task=None,
+        )
+
+        copywriter = agents.get("copywriter")
+        if concurrent:
+            # Fan copy out per channel; a local merge step reassembles it
+            graph.copy_core_task = self.copy_core_task(copywriter, research)
+            channel_agents = agents.get("channel_copywriters") or [None] * len(
+                self.request.channels
+            )
+            graph.channel_copy_tasks = [
+                self.channel_copy_task(agent, channel, research)
+                for agent, channel in zip(channel_agents, self.request.channels)
+            ]
+            graph.copy_task = self.copy_merge_task(
+                copywriter, graph.copy_core_task, graph.channel_copy_tasks
+            )
+        else:
+            graph.copy_task = self.copywriting_task(copywriter, research)
+
+        graph.art_task = self.art_direction_task(
+            agents.get("art_director"), research, graph.copy_task
+        )
+        manager = agents.get("manager")
+        if context_budgets is not None:
+            # Compact everything upstream before it reaches the manager
+            graph.digest_task = self.context_digest_task(
+                manager, research, graph.copy_task, graph.art_task, context_budgets
+            )
+        graph.manager_task = self.manager_task(
+            manager,
+            research,
+            graph.copy_task,
+            graph.art_task,
+            digest_task=graph.digest_task,
+        )
+        return graph
 
     def research_task(self, agent) -> Task:
-        return Task(
+        return StructuredTask(
+            name=TaskType.MARKET_RESEARCH.value,
             description=(
                 f"Conduct thorough market research for: **{self.request.product_name}**\n\n"
                 f"**Product:** {self.request.product_name}\n"
@@ -88,13 +247,62 @@ class CampaignTaskFactory:
                 "2. Analyse 3 key competitors — positioning, strengths, weaknesses.\n"
                 "3. Build 2 detailed audience personas.\n"
                 "4. Summarise market opportunities and recommend 3 campaign angles.\n"
+                + self._research_seed(
+                    TaskType.MARKET_RESEARCH, TaskType.COMPETITOR_ANALYSIS
+                )
+                + answer_format(MarketResearch)
             ),
-            expected_output="Markdown report with trends, competitors, personas, angles",
+            expected_output="JSON with trends, competitors, personas, angles",
             agent=agent,
+            output_schema=MarketResearch,
         )
 
-    def copywriting_task(self, agent, research_task: Task) -> Task:
-        return Task(
+    def trend_research_task(self, agent) -> Task:
+        """Trend, persona and opportunity half of the research stage."""
+        return StructuredTask(
+            name=TaskType.MARKET_RESEARCH.value,
+            description=(
+                f"Research the market for: **{self.request.product_name}**\n\n"
+                f"**Product:** {self.request.product_name}\n"
+                f"**Target audience:** {self.request.target_audience}\n"
+                f"**Campaign goals:** {self.request.campaign_goals}\n"
+                f"**Channels:** {', '.join(c.value for c in self.request.channels)}\n\n"
+                "Your deliverables:\n"
+                "1. Identify 4-6 current market trends relevant to this product.\n"
+                "2. Build 2 detailed audience personas.\n"
+                "3. Summarise market opportunities and recommend 3 campaign angles.\n"
+                + self._research_seed(TaskType.MARKET_RESEARCH)
+                + answer_format(MarketResearch, _TREND_FIELDS)
+            ),
+            expected_output="JSON with trends, personas, angles",
+            agent=agent,
+            output_schema=MarketResearch,
+        )
+
+    def competitor_research_task(self, agent) -> Task:
+        """Competitor half of the research stage — independent of trends."""
+        return StructuredTask(
+            name=TaskType.COMPETITOR_ANALYSIS.value,
+            description=(
+                f"Analyse the competitive landscape for: **{self.request.product_name}**\n\n"
+                f"**Product:** {self.request.product_description}\n"
+                f"**Target audience:** {self.request.target_audience}\n\n"
+                "Your deliverables:\n"
+                "1. Analyse 3 key competitors — positioning, strengths, weaknesses.\n"
+                "2. Identify market gaps and differentiation opportunities.\n"
+                + self._research_seed(TaskType.COMPETITOR_ANALYSIS)
+                + answer_format(MarketResearch, _COMPETITOR_FIELDS)
+            ),
+            expected_output="JSON with competitor profiles and gaps",
+            agent=agent,
+            output_schema=MarketResearch,
+        )
+
+    def copywriting_task(
+        self, agent, research_task: Task | Sequence[Task]
+    ) -> Task:
+        return StructuredTask(
+            name=TaskType.COPYWRITING.value,
             description=(
                 f"Write compelling ad copy for **{self.request.product_name}**.\n\n"
                 f"**Brand voice:** {self.request.brand_voice.value}\n"
@@ -104,17 +312,85 @@ class CampaignTaskFactory:
                 "Deliverables:\n"
                 "1. One overarching campaign tagline.\n"
                 "2. A 2-sentence elevator pitch.\n"
-                "3. For EACH channel — headline, sub-headline, body copy, CTA.\n"
+                "3. For EACH channel — headline, sub-headline, body copy, CTA, "
+                "keyed by the channel names above.\n"
                 "4. 5 email subject-line options.\n"
                 "5. 5-8 hashtag suggestions.\n"
+                + answer_format(CopyPackage)
             ),
-            expected_output="Copy package with taglines, channel copy, hashtags",
+            expected_output="JSON copy package with tagline, channel copy, hashtags",
             agent=agent,
-            context=[research_task],
+            context=_as_context(research_task),
+            output_schema=CopyPackage,
         )
 
-    def art_direction_task(self, agent, research_task: Task, copy_task: Task) -> Task:
-        return Task(
+    def copy_core_task(
+        self, agent, research_task: Task | Sequence[Task]
+    ) -> Task:
+        """Channel-independent copy: tagline, pitch, subjects, hashtags."""
+        return StructuredTask(
+            name=f"{TaskType.COPYWRITING.value}_core",
+            description=(
+                f"Write the core campaign messaging for **{self.request.product_name}**.\n\n"
+                f"**Brand voice:** {self.request.brand_voice.value}\n"
+                f"**Target audience:** {self.request.target_audience}\n"
+                f"**Campaign goals:** {self.request.campaign_goals}\n\n"
+                "Deliverables:\n"
+                "1. One overarching campaign tagline.\n"
+                "2. A 2-sentence elevator pitch.\n"
+                "3. 5 email subject-line options.\n"
+                "4. 5-8 hashtag suggestions.\n"
+                + answer_format(CopyPackage, _CORE_COPY_FIELDS)
+            ),
+            expected_output="JSON with tagline, elevator pitch, email subjects, hashtags",
+            agent=agent,
+            context=_as_context(research_task),
+            output_schema=CopyPackage,
+        )
+
+    def channel_copy_task(
+        self,
+        agent,
+        channel: CampaignChannel,
+        research_task: Task | Sequence[Task],
+    ) -> Task:
+        """Copy for a single channel — one of several run side by side."""
+        return StructuredTask(
+            name=channel_copy_task_name(channel),
+            description=(
+                f"Write **{channel.value}** ad copy for **{self.request.product_name}**.\n\n"
+                f"**Brand voice:** {self.request.brand_voice.value}\n"
+                f"**Target audience:** {self.request.target_audience}\n"
+                f"**Campaign goals:** {self.request.campaign_goals}\n\n"
+                "Respect this channel's format and length limits.\n"
+                + answer_format(ChannelCopy)
+            ),
+            expected_output=f"JSON with headline, sub-headline, body and CTA for {channel.value}",
+            agent=agent,
+            context=_as_context(research_task),
+            output_schema=ChannelCopy,
+        )
+
+    def copy_merge_task(
+        self, agent, core_task: Task, channel_tasks: Sequence[Task]
+    ) -> Task:
+        """Assemble core and per-channel copy into one copy package."""
+        return CopyMergeTask(
+            name=TaskType.COPYWRITING.value,
+            description=(
+                f"Merge the copy package for **{self.request.product_name}** "
+                f"across: {', '.join(c.value for c in self.request.channels)}"
+            ),
+            expected_output="JSON copy package with tagline, channel copy, hashtags",
+            agent=agent,
+            context=[core_task, *channel_tasks],
+        )
+
+    def art_direction_task(
+        self, agent, research_task: Task | Sequence[Task], copy_task: Task
+    ) -> Task:
+        return StructuredTask(
+            name=TaskType.VISUAL_DIRECTION.value,
             description=(
                 f"Create the visual direction for **{self.request.product_name}**.\n\n"
                 f"**Target audience:** {self.request.target_audience}\n"
@@ -123,25 +399,369 @@ class CampaignTaskFactory:
                 "1. Visual identity and moodboard notes.\n"
                 "2. 3 key visual concepts.\n"
                 "3. Image generation prompts for each concept.\n"
+                + answer_format(VisualDirection)
+            ),
+            expected_output="JSON with visual identity, key visuals and prompts",
+            agent=agent,
+            context=[*_as_context(research_task), copy_task],
+            output_schema=VisualDirection,
+        )
+
+    def context_digest_task(
+        self,
+        agent,
+        research_task: Task | Sequence[Task],
+        copy_task: Task,
+        art_task: Task,
+        budgets: Mapping[str, int],
+    ) -> Task:
+        """Compact research, copy and art direction for the manager."""
+        upstream = [*_as_context(research_task), copy_task, art_task]
+        # Budgets are part of the description so the stage cache sees them
+        limits = ", ".join(
+            f"{task.name}={budgets.get(task.name, DEFAULT_DIGEST_BUDGET)}"
+            for task in upstream
+        )
+        return ContextDigestTask(
+            name=TaskType.CONTEXT_DIGEST.value,
+            description=(
+                f"Digest the campaign work on **{self.request.product_name}** "
+                f"for the manager (token budgets: {limits})"
             ),
-            expected_output="Visual direction and prompts",
+            expected_output="Key findings, tagline, channel copy, visual concepts",
             agent=agent,
-            context=[research_task, copy_task],
+            context=upstream,
+            budgets=dict(budgets),
+            channels=[c.value for c in self.request.channels],
         )
 
     def manager_task(
-        self, agent, research_task: Task, copy_task: Task, art_task: Task
+        self,
+        agent,
+        research_task: Task | Sequence[Task],
+        copy_task: Task,
+        art_task: Task,
+        digest_task: Task | None = None,
     ) -> Task:
+        if digest_task is not None:
+            context = [digest_task]
+            source = (
+                "Work from the digest of the research, copy and visual "
+                "direction in your context; it holds the key findings, the "
+                "chosen tagline, each channel's copy and the visual concepts.\n\n"
+            )
+        else:
+            context = [*_as_context(research_task), copy_task, art_task]
+            source = ""
         return Task(
+            name=TaskType.CAMPAIGN_STRATEGY.value,
             description=(
                 f"Assemble the final campaign brief for **{self.request.product_name}**.\n\n"
-                "Deliverables:\n"
+                + source
+                + "Deliverables, each under its own `##` heading:\n"
                 "1. Executive summary.\n"
                 "2. Integrated strategy across channels.\n"
-                "3. 30-day implementation timeline.\n"
-                "4. Success metrics and KPIs.\n"
+                "3. 30-day implementation timeline, as a list of phases.\n"
+                "4. Success metrics and KPIs, as a list.\n"
+                "5. Risks, as a list, each with its mitigation.\n"
             ),
             expected_output="Final campaign brief in markdown",
             agent=agent,
-            context=[research_task, copy_task, art_task],
+            context=context,
+        )
+
+    def _research_seed(self, *stages: TaskType) -> str:
+        """Prompt section handing over stored category research, if any."""
+        seed = self.category_research
+        if seed is None:
+            return ""
+        findings = [
+            f"### {stage.value}\n{seed.stages[stage.value]}"
+            for stage in stages
+            if seed.stages.get(stage.value)
+        ]
+        tools = {_SEED_TOOLS[stage] for stage in stages}
+        results = [
+            f"- `{result['tool']}` {json.dumps(result['args'], sort_keys=True)}:\n"
+            + fit_to_budget(result["output"], SEED_TOOL_BUDGET)
+            for result in seed.tool_results
+            if result["tool"] in tools
+        ]
+        if results:
+            findings.append("### Tool results\n" + "\n\n".join(results))
+        if not findings:
+            return ""
+        return (
+            f"\n**Category research on file** ({seed.category}, gathered "
+            f"{seed.saved_at[:10]} while researching {seed.product_name}):\n\n"
+            + "\n\n".join(findings)
+            + "\n\nDo not repeat this category research or re-run research "
+            "tools for the general market. Reuse what still applies and add "
+            f"only what is specific to {self.request.product_name}: how its "
+            "features, audience and goals change the trends, competitors and "
+            "opportunities above.\n"
         )
+
+
+def _as_context(tasks: Task | Sequence[Task]) -> list[Task]:
+    """Normalise one upstream task or several into a context list."""
+    return [tasks] if isinstance(tasks, Task) else list(tasks)
+
+
+_CHANNEL_PREFIX = f"{TaskType.COPYWRITING.value}_"
+
+_COPY_LABELS = {
+    "headline": "headline",
+    "sub-headline": "sub_headline",
+    "subheadline": "sub_headline",
+    "sub headline": "sub_headline",
+    "body": "body",
+    "body copy": "body",
+    "cta": "cta",
+    "call to action": "cta",
+    "call-to-action": "cta",
+}
+_COPY_LINE = re.compile(
+    r"^[\s*#>-]*(" + "|".join(re.escape(k) for k in _COPY_LABELS) + r")[\s*]*:[\s*]*(.*)$",
+    re.IGNORECASE,
+)
+
+
+def channel_copy_task_name(channel: CampaignChannel) -> str:
+    return f"{_CHANNEL_PREFIX}{channel.value}"
+
+
+def parse_channel_copy(raw: str) -> dict[str, str]:
+    """Split ``Headline: / Sub-headline: / Body: / CTA:`` copy into fields.
+
+    Lines without a label continue the previous field, so multi-line body
+    copy survives. Unlabelled output is kept whole as ``body``.
+    """
+    fields: dict[str, list[str]] = {}
+    current: str | None = None
+    for line in raw.splitlines():
+        match = _COPY_LINE.match(line)
+        if match:
+            current = _COPY_LABELS[match.group(1).lower()]
+            fields[current] = [match.group(2).strip()]
+        elif current:
+            fields[current].append(line.strip())
+    if not fields:
+        return {"body": raw.strip()}
+    return {key: "\n".join(lines).strip() for key, lines in fields.items()}
+
+
+class CopyMergeTask(Task):
+    """Copy stage merge step — runs in-process without an LLM call.
+
+    Reads the outputs of its context (core copy first, then one task per
+    channel) and emits one ``CopyPackage`` as compact JSON, with its fields
+    in ``json_dict``. Channel copy that did not validate as JSON is
+    parsed from its ``Headline: / Body: ...`` lines instead.
+    """
+
+    def execute_sync(self, agent=None, context=None, tools=None) -> TaskOutput:
+        return self._merge()
+
+    async def aexecute_sync(
+        self, agent=None, context=None, tools=None
+    ) -> TaskOutput:
+        return self._merge()
+
+    def _merge(self) -> TaskOutput:
+        core, *channels = self.context
+        package = stage_model(core.output, CopyPackage) or CopyPackage(
+            campaign_tagline=labelled_value(core.output.raw, "tagline"),
+            elevator_pitch=labelled_value(core.output.raw, "elevator pitch", "pitch"),
+        )
+        for task in channels:
+            channel = task.name.removeprefix(_CHANNEL_PREFIX)
+            copy = stage_model(task.output, ChannelCopy)
+            package.channel_copy[channel] = (
+                copy.model_dump(exclude_defaults=True)
+                if copy
+                else parse_channel_copy(task.output.raw)
+            )
+
+        self.output = TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=package.model_dump_json(exclude_defaults=True),
+            json_dict=package.model_dump(),
+            agent=self.agent.role if self.agent else "merge",
+        )
+        return self.output
+
+
+# Digest budget for an upstream stage with no configured one
+DEFAULT_DIGEST_BUDGET = 400
+
+_DIGEST_TITLES = {
+    TaskType.COPYWRITING.value: "Copy",
+    TaskType.VISUAL_DIRECTION.value: "Visual concepts",
+}
+
+
+class ContextDigestTask(Task):
+    """Compaction step in front of the manager — runs without an LLM call.
+
+    Distils each upstream output into a digest of at most its stage's
+    token budget: key findings for research, tagline, pitch and
+    per-channel copy for copywriting, concepts for visual direction.
+    Structured outputs are read field by field; Markdown ones (stages
+    whose JSON did not validate) by heading. Token counts before and
+    after land in ``json_dict["compaction"]``.
+    """
+
+    budgets: dict[str, int] = Field(default_factory=dict)
+    channels: list[str] = Field(default_factory=list)
+
+    def execute_sync(self, agent=None, context=None, tools=None) -> TaskOutput:
+        return self._digest()
+
+    async def aexecute_sync(
+        self, agent=None, context=None, tools=None
+    ) -> TaskOutput:
+        return self._digest()
+
+    def _digest(self) -> TaskOutput:
+        sections = []
+        compaction: dict[str, dict[str, int]] = {}
+        for task in self.context:
+            raw = task.output.raw
+            budget = self.budgets.get(task.name, DEFAULT_DIGEST_BUDGET)
+            if task.name == TaskType.COPYWRITING.value:
+                body = self._copy_digest(task.output, budget)
+            elif task.name == TaskType.VISUAL_DIRECTION.value:
+                visuals = stage_model(task.output, VisualDirection)
+                if visuals:
+                    fields = ("key_visuals",) if visuals.key_visuals else None
+                    body = _fit_points(_model_points(visuals, fields), budget)
+                else:
+                    body = _points_digest(raw, budget, prefer="concept")
+            else:
+                research = stage_model(task.output, MarketResearch)
+                if research:
+                    body = _fit_points(_model_points(research), budget)
+                else:
+                    body = _points_digest(raw, budget)
+            title = _DIGEST_TITLES.get(task.name, "Key findings")
+            sections.append(f"## {title} — {task.name}\n\n{body}")
+            compaction[task.name] = {
+                "source_tokens": estimate_tokens(raw),
+                "digest_tokens": estimate_tokens(body),
+            }
+
+        self.output = TaskOutput(
+            name=self.name,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw="\n\n".join(sections),
+            json_dict={"compaction": compaction},
+            agent=self.agent.role if self.agent else "digest",
+        )
+        return self.output
+
+    def _copy_digest(self, output: TaskOutput, budget: int) -> str:
+        raw = output.raw
+        package = stage_model(output, CopyPackage) or CopyPackage()
+        lines = []
+        tagline = package.campaign_tagline or labelled_value(raw, "tagline")
+        pitch = package.elevator_pitch or labelled_value(
+            raw, "elevator pitch", "pitch"
+        )
+        if tagline:
+            lines.append(f"Tagline: {first_sentence(tagline)}")
+        if pitch:
+            lines.append(f"Elevator pitch: {fit_to_budget(clean(pitch), budget // 6)}")
+
+        channel_copy = (output.json_dict or {}).get("channel_copy") or (
+            _channel_sections(raw, self.channels)
+        )
+        if channel_copy:
+            remaining = budget - estimate_tokens("\n".join(lines))
+            share = max(remaining // len(channel_copy), 20)
+            for channel, fields in channel_copy.items():
+                parts = [
+                    f"{label}: {first_sentence(fields[key])}"
+                    for key, label in _DIGEST_COPY_FIELDS
+                    if fields.get(key)
+                ]
+                lines.append(
+                    f"- {channel} — " + fit_to_budget(" | ".join(parts), share)
+                )
+        elif not lines:
+            return _points_digest(raw, budget)
+        return fit_to_budget("\n".join(lines), budget)
+
+
+_DIGEST_COPY_FIELDS = (
+    ("headline", "Headline"),
+    ("sub_headline", "Sub-headline"),
+    ("cta", "CTA"),
+    ("body", "Body"),
+)
+
+
+def _points_digest(raw: str, budget: int, prefer: str | None = None) -> str:
+    """Key points of a report within ``budget``, favouring ``prefer`` sections."""
+    points = key_points(raw)
+    if prefer:
+        preferred = {h: p for h, p in points.items() if prefer in h.lower()}
+        points = preferred or points
+    return _fit_points(points, budget)
+
+
+def _fit_points(points: dict[str, list[str]], budget: int) -> str:
+    return fit_to_budget(
+        "\n".join(render_points(select_points(points, budget))), budget
+    )
+
+
+def _model_points(
+    model: BaseModel, fields: Sequence[str] | None = None
+) -> dict[str, list[str]]:
+    """A structured output's fields as digest points, one heading per field."""
+    points: dict[str, list[str]] = {}
+    for name, value in model.model_dump(exclude_defaults=True).items():
+        if fields is not None and name not in fields:
+            continue
+        if isinstance(value, dict):
+            items = [f"{key}: {_inline(item)}" for key, item in value.items()]
+        elif isinstance(value, list):
+            items = [_inline(item) for item in value]
+        else:
+            items = [value]
+        heading = name.replace("_", " ").capitalize()
+        points[heading] = [p for p in map(first_sentence, items) if p]
+    return points
+
+
+def _inline(value: Any) -> str:
+    """One line of text for a JSON value of any shape."""
+    if isinstance(value, dict):
+        return "; ".join(f"{key}: {_inline(item)}" for key, item in value.items())
+    if isinstance(value, list):
+        return "; ".join(_inline(item) for item in value)
+    return str(value)
+
+
+def _channel_sections(raw: str, channels: Sequence[str]) -> dict[str, dict[str, str]]:
+    """Per-channel fields of single-task copy, found under channel headings."""
+    found: dict[str, dict[str, str]] = {}
+    current: str | None = None
+    body: list[str] = []
+    for line in [*raw.splitlines(), "# end"]:
+        heading = re.match(r"^\s*#{1,6}\s+(.*)$", line)
+        if heading:
+            if current is not None:
+                fields = parse_channel_copy("\n".join(body))
+                if set(fields) != {"body"} or fields["body"]:
+                    found[current] = fields
+            title = heading.group(1).lower().replace(" ", "_")
+            current = next((c for c in channels if c in title), None)
+            body = []
+        elif current is not None:
+            body.append(line)
+    return found
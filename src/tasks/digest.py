@@ -0,0 +1,171 @@
+"""
+Bounded-size digests of stage outputs for downstream prompts.
+
+The manager does not need every paragraph of the research, copy and art
+direction it summarises — only the findings, the chosen tagline, each
+channel's copy and the visual concepts. These helpers pull those out of
+an agent's Markdown and trim them to a token budget:
+
+    points = select_points(key_points(research_raw), budget=500)
+    digest = "\n".join(render_points(points))
+
+Everything here is plain text processing; no LLM is involved.
+"""
+
+from __future__ import annotations
+
+import re
+
+from src.agents.rate_limiter import CHARS_PER_TOKEN, estimate_tokens
+
+_HEADING = re.compile(r"^\s*#{1,6}\s+(.*)$")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+(.*)$")
+_EMPHASIS = re.compile(r"(\*\*|__|`)")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Longest single point kept before it is cut at a word boundary
+MAX_POINT_CHARS = 240
+
+
+def clean(text: str) -> str:
+    """Drop Markdown emphasis and collapse whitespace."""
+    return " ".join(_EMPHASIS.sub("", text).split()).strip(" *_")
+
+
+def first_sentence(text: str, limit: int = MAX_POINT_CHARS) -> str:
+    """Leading sentence of ``text``, cut to ``limit`` characters."""
+    sentence = _SENTENCE_END.split(clean(text), maxsplit=1)[0]
+    if len(sentence) <= limit:
+        return sentence
+    return sentence[:limit].rsplit(" ", 1)[0] + "…"
+
+
+def key_points(raw: str) -> dict[str, list[str]]:
+    """List items of a Markdown report, grouped by their heading.
+
+    A report without lists falls back to the first sentence of each
+    paragraph, so prose answers still produce a digest.
+    """
+    points: dict[str, list[str]] = {}
+    heading = ""
+    for line in raw.splitlines():
+        if match := _HEADING.match(line):
+            heading = clean(match.group(1))
+        elif match := _LIST_ITEM.match(line):
+            item = first_sentence(match.group(1))
+            if item:
+                points.setdefault(heading, []).append(item)
+    if points:
+        return points
+
+    paragraphs = [p for p in re.split(r"\n\s*\n", raw) if p.strip()]
+    sentences = [
+        first_sentence(p) for p in paragraphs if not _HEADING.match(p.strip())
+    ]
+    return {"": [s for s in sentences if s]}
+
+
+def labelled_value(raw: str, *labels: str) -> str:
+    """Text after the first ``Label:`` line or ``## Label`` heading."""
+    names = "|".join(re.escape(label) for label in labels)
+    pattern = re.compile(
+        rf"^[\s*#>\-\d.]*(?:campaign\s+|overarching\s+)?(?:{names})[\s*]*:?[\s*]*(.*)$",
+        re.IGNORECASE,
+    )
+    lines = raw.splitlines()
+    for index, line in enumerate(lines):
+        match = pattern.match(line)
+        if not match:
+            continue
+        value = clean(match.group(1)).strip("\"'“”")
+        if value:
+            return value
+        for following in lines[index + 1 :]:  # value on the next line
+            if following.strip():
+                return clean(following).strip("\"'“”")
+    return ""
+
+
+def section(raw: str, *titles: str) -> str:
+    """Body of the first heading that mentions one of ``titles``.
+
+    The section runs to the next heading of the same or a higher level;
+    ``""`` when no heading matches.
+    """
+    wanted = [title.lower() for title in titles]
+    lines = raw.splitlines()
+    for index, line in enumerate(lines):
+        match = _HEADING.match(line)
+        if not match or not any(t in clean(match.group(1)).lower() for t in wanted):
+            continue
+        level = _level(line)
+        body = []
+        for following in lines[index + 1 :]:
+            if _HEADING.match(following) and _level(following) <= level:
+                break
+            body.append(following)
+        return "\n".join(body).strip()
+    return ""
+
+
+def list_items(raw: str) -> list[str]:
+    """Every Markdown list item in ``raw``, emphasis removed."""
+    items = []
+    for line in raw.splitlines():
+        if match := _LIST_ITEM.match(line):
+            if item := clean(match.group(1)):
+                items.append(item)
+    return items
+
+
+def select_points(
+    points: dict[str, list[str]], budget: int
+) -> dict[str, list[str]]:
+    """Pick points round-robin across headings until ``budget`` is spent.
+
+    Every section gets its most important (first) point before any
+    section gets a second one; the original order is kept.
+    """
+    chosen: dict[str, list[str]] = {heading: [] for heading in points}
+    spent = 0
+    depth = 0
+    while True:
+        progressed = False
+        for heading, items in points.items():
+            if depth >= len(items):
+                continue
+            cost = estimate_tokens(items[depth]) + 2
+            if spent + cost > budget:
+                return {h: kept for h, kept in chosen.items() if kept}
+            chosen[heading].append(items[depth])
+            spent += cost
+            progressed = True
+        if not progressed:
+            return {h: kept for h, kept in chosen.items() if kept}
+        depth += 1
+
+
+def render_points(points: dict[str, list[str]]) -> list[str]:
+    """Markdown bullets, nested under their heading when there is one."""
+    lines = []
+    for heading, items in points.items():
+        indent = "  " if heading else ""
+        if heading:
+            lines.append(f"- {heading}")
+        lines.extend(f"{indent}- {item}" for item in items)
+    return lines
+
+
+def fit_to_budget(text: str, budget: int) -> str:
+    """``text`` cut at a word boundary so it stays within ``budget`` tokens."""
+    limit = budget * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0] + "…"
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _level(heading: str) -> int:
+    return len(heading.strip()) - len(heading.strip().lstrip("#"))
@@ -0,0 +1,133 @@
+"""
+JSON stage answers validated against the campaign models.
+
+Research, copy and visual-direction tasks are ``StructuredTask``s: their
+prompt ends with the keys of a ``MarketResearch``, ``CopyPackage``,
+``ChannelCopy`` or ``VisualDirection`` (``answer_format``), and the final
+answer is validated once, locally:
+
+    task = StructuredTask(..., output_schema=VisualDirection)
+    output = task.execute_sync(agent)
+    visuals = VisualDirection.model_validate(output.json_dict)
+
+A valid answer replaces ``raw`` with compact JSON — what downstream
+stages read as context — and its fields land in ``json_dict``. An answer
+that does not validate is kept as it is, without ``json_dict``. There is
+no converter LLM call and no retry loop; ``weak_output`` flags such an
+answer so the fallback model can take the stage instead.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Sequence, TypeVar, get_origin
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+from pydantic import BaseModel, Field, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+_FENCE = re.compile(r"^```[a-z]*\s*|\s*```$", re.IGNORECASE)
+
+
+def answer_format(
+    model: type[BaseModel], fields: Sequence[str] | None = None
+) -> str:
+    """Prompt section asking for ``model``'s ``fields`` (default: all) as JSON."""
+    lines = [
+        "",
+        "Reply with one JSON object and nothing else (no Markdown, no code "
+        "fences), with these keys:",
+    ]
+    for name, info in model.model_fields.items():
+        if fields is None or name in fields:
+            lines.append(f'- "{name}" ({_kind(info.annotation)}): {info.description}')
+    return "\n".join(lines) + "\n"
+
+
+def parse_answer(raw: str, model: type[M]) -> M | None:
+    """``raw`` validated as ``model``, or ``None`` if it is not such JSON.
+
+    Code fences and text around the outermost ``{...}`` are ignored; an
+    object that sets none of the model's fields does not count.
+    """
+    text = _FENCE.sub("", raw.strip())
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        # strict=False: models put raw newlines inside long strings
+        data = json.loads(text[start : end + 1], strict=False)
+        parsed = model.model_validate(data)
+    except (ValueError, ValidationError):
+        return None
+    if not parsed.model_dump(exclude_defaults=True):
+        return None
+    return parsed
+
+
+def stage_model(output: TaskOutput | None, model: type[M]) -> M | None:
+    """The model a structured stage's output holds, if it validated."""
+    if output is None or not output.json_dict:
+        return None
+    if not set(output.json_dict) <= set(model.model_fields):
+        return None  # another kind of json_dict, e.g. a digest's stats
+    try:
+        return model.model_validate(output.json_dict)
+    except ValidationError:
+        return None
+
+
+def merge_models(model: type[M], parts: Sequence[M | None]) -> M:
+    """One ``model`` from several partial answers, e.g. split research.
+
+    Strings keep the first non-empty value, lists are concatenated and
+    dicts merged, in ``parts`` order; missing parts are skipped.
+    """
+    merged: dict[str, Any] = {}
+    for part in parts:
+        if part is None:
+            continue
+        for name, value in part.model_dump(exclude_defaults=True).items():
+            if isinstance(value, list):
+                merged[name] = merged.get(name, []) + value
+            elif isinstance(value, dict):
+                merged[name] = {**merged.get(name, {}), **value}
+            else:
+                merged.setdefault(name, value)
+    return model.model_validate(merged)
+
+
+class StructuredTask(Task):
+    """LLM task whose final answer is JSON for ``output_schema``."""
+
+    output_schema: type[BaseModel] = Field(exclude=True)
+
+    def execute_sync(self, agent=None, context=None, tools=None) -> TaskOutput:
+        return self._structure(super().execute_sync(agent, context, tools))
+
+    async def aexecute_sync(
+        self, agent=None, context=None, tools=None
+    ) -> TaskOutput:
+        return self._structure(await super().aexecute_sync(agent, context, tools))
+
+    def _structure(self, output: TaskOutput) -> TaskOutput:
+        parsed = parse_answer(output.raw, self.output_schema)
+        if parsed is not None:
+            output.raw = parsed.model_dump_json(exclude_defaults=True)
+            output.json_dict = parsed.model_dump()
+        return output
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _kind(annotation: Any) -> str:
+    origin = get_origin(annotation) or annotation
+    if origin is list:
+        return "list of strings"
+    if origin is dict:
+        return "object"
+    return "string"
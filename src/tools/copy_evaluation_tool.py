@@ -1,16 +1,40 @@
 """Copy Evaluation Tool.
 
 Uses heuristic scoring so tests run deterministically without LLM calls.
+Weak words, power words and CTA phrases come from a lexicon directory
+(``COPY_LEXICON``, default the bundled one; see ``src.tools.lexicon``)
+and match on word boundaries ("very" does not match "every"). Terms of
+any other list in the lexicon (banned claims, competitor trademarks, ...)
+are reported with the scores. With NumPy installed, ``evaluate_batch``
+scores many variants in one pass — a single lexicon scan over all of
+them, then array arithmetic — and returns exactly what ``_run`` reports
+for each text:
+
+    results = CopyEvaluationTool().evaluate_batch(headlines, "search_ads")
 """
 
 from __future__ import annotations
 
+import importlib.util
 import json
-from typing import Type
+from typing import Any, Sequence, Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from src.config import settings
+from src.tools.lexicon import LexiconMatcher, lexicon_matcher
+
+# Lexicon lists that feed the scores; others are only reported
+WEAK, POWER, CTA = "weak", "power", "cta"
+
+CHANNEL_LIMITS = {
+    "social_media": 280,
+    "search_ads": 90,
+    "email": 1200,
+}
+DEFAULT_CHAR_LIMIT = 1000
+
 
 class CopyEvaluationInput(BaseModel):
     copy_text: str = Field(..., description="Marketing copy to evaluate")
@@ -23,64 +47,191 @@ class CopyEvaluationTool(BaseTool):
         "Evaluate marketing copy for clarity, persuasion and fit for channel."
     )
     args_schema: Type[BaseModel] = CopyEvaluationInput
+    # Lexicon directory; unset follows ``COPY_LEXICON``
+    lexicon: str | None = None
 
     def _run(self, copy_text: str, channel: str = "general") -> str:
         text = copy_text.strip()
+        matcher = self._matcher()
+        hits = matcher.find(text)
         word_count = len(text.split())
         char_count = len(text)
         sentence_count = max(1, text.count(".") + text.count("!") + text.count("?"))
         avg_sentence_length = word_count / sentence_count
 
-        weak_words = ["maybe", "possibly", "somewhat", "very", "nice", "quite"]
-        power_words = ["exclusive", "proven", "free", "limited", "save", "now"]
-
-        weak_hits = sum(1 for w in weak_words if w in text.lower())
-        power_hits = sum(1 for w in power_words if w in text.lower())
+        weak_hits = len(hits.get(WEAK, ()))
+        power_hits = len(hits.get(POWER, ()))
 
         clarity = max(0.0, 1.0 - (weak_hits * 0.1))
         emotional = min(1.0, power_hits * 0.2)
-        cta_strength = 1.0 if any(k in text.lower() for k in ["buy", "sign up", "get", "pre-order", "try"]) else 0.5
-
-        channel_limits = {
-            "social_media": 280,
-            "search_ads": 90,
-            "email": 1200,
-        }
-        limit = channel_limits.get(channel, 1000)
+        cta_strength = 1.0 if hits.get(CTA) else 0.5
+
+        limit = CHANNEL_LIMITS.get(channel, DEFAULT_CHAR_LIMIT)
         length_score = 1.0 if char_count <= limit else max(0.0, 1.0 - ((char_count - limit) / max(limit, 1)))
 
         readability = 1.0 if avg_sentence_length <= 20 else 0.7
 
-        overall = round((clarity + emotional + cta_strength + length_score + readability) / 5, 2)
-
-        suggestions = []
-        if power_hits == 0:
-            suggestions.append("Add power words (e.g., 'exclusive', 'proven', 'free').")
-        if length_score < 0.7:
-            suggestions.append(f"Copy is too long for {channel}. Trim to fit limits.")
-        if cta_strength < 0.8:
-            suggestions.append("Strengthen the CTA — use a clear action verb.")
-        if not suggestions:
-            suggestions.append("Copy looks solid — minor tweaks at most.")
-
-        payload = {
-            "overall_score": overall,
-            "scores": {
-                "readability": round(readability, 2),
-                "emotional_impact": round(emotional, 2),
-                "clarity": round(clarity, 2),
-                "cta_strength": round(cta_strength, 2),
-                "length_appropriateness": round(length_score, 2),
-            },
-            "metrics": {
-                "word_count": word_count,
-                "character_count": char_count,
-                "sentence_count": sentence_count,
-                "avg_sentence_length": round(avg_sentence_length, 1),
-                "power_words_found": power_hits,
-                "weak_words_found": weak_hits,
-                "channel_char_limit": limit,
-            },
-            "suggestions": suggestions,
-        }
+        payload = _payload(
+            channel,
+            matcher.version,
+            hits,
+            clarity=clarity,
+            emotional=emotional,
+            cta_strength=cta_strength,
+            length_score=length_score,
+            readability=readability,
+            word_count=word_count,
+            char_count=char_count,
+            sentence_count=sentence_count,
+            avg_sentence_length=avg_sentence_length,
+            power_hits=power_hits,
+            weak_hits=weak_hits,
+            limit=limit,
+        )
         return json.dumps(payload, indent=2)
+
+    def evaluate_batch(
+        self, texts: Sequence[str], channels: str | Sequence[str] = "general"
+    ) -> list[dict[str, Any]]:
+        """Score every text in one pass; ``channels`` is one per text or shared.
+
+        Each result equals ``json.loads(self._run(text, channel))``.
+        """
+        if isinstance(channels, str):
+            channels = [channels] * len(texts)
+        if len(channels) != len(texts):
+            raise ValueError(
+                f"Got {len(texts)} texts but {len(channels)} channels."
+            )
+        if importlib.util.find_spec("numpy") is None:
+            return [
+                json.loads(self._run(text, channel))
+                for text, channel in zip(texts, channels)
+            ]
+        return _score_batch(
+            self._matcher(), [text.strip() for text in texts], list(channels)
+        )
+
+    def _matcher(self) -> LexiconMatcher:
+        return lexicon_matcher(self.lexicon or settings.copy_lexicon or None)
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _score_batch(
+    matcher: LexiconMatcher, texts: list[str], channels: list[str]
+) -> list[dict[str, Any]]:
+    """``_run``'s arithmetic over NumPy arrays, one row per text."""
+    import numpy as np
+
+    n = len(texts)
+    # Terms found per text and category, counted as an n × categories array
+    columns = {category: column for column, category in enumerate(matcher.categories)}
+    hits = matcher.find_all(texts)
+    rows, cols = [], []
+    for row, found in enumerate(hits):
+        for category, terms in found.items():
+            rows.extend([row] * len(terms))
+            cols.extend([columns[category]] * len(terms))
+    counts = np.zeros((n, len(columns) + 1), dtype=np.int64)  # + an empty column
+    np.add.at(counts, (rows, cols), 1)
+    weak_hits = counts[:, columns.get(WEAK, -1)]
+    power_hits = counts[:, columns.get(POWER, -1)]
+    has_cta = counts[:, columns.get(CTA, -1)] > 0
+
+    word_count = np.fromiter((len(t.split()) for t in texts), np.int64, n)
+    char_count = np.fromiter(map(len, texts), np.int64, n)
+    marks = np.fromiter(
+        (t.count(".") + t.count("!") + t.count("?") for t in texts), np.int64, n
+    )
+    sentence_count = np.maximum(1, marks)
+    avg_sentence_length = word_count / sentence_count
+    limit = np.fromiter(
+        (CHANNEL_LIMITS.get(c, DEFAULT_CHAR_LIMIT) for c in channels), np.int64, n
+    )
+
+    clarity = np.maximum(0.0, 1.0 - (weak_hits * 0.1))
+    emotional = np.minimum(1.0, power_hits * 0.2)
+    cta_strength = np.where(has_cta, 1.0, 0.5)
+    overflow = np.maximum(0.0, 1.0 - ((char_count - limit) / np.maximum(limit, 1)))
+    length_score = np.where(char_count <= limit, 1.0, overflow)
+    readability = np.where(avg_sentence_length <= 20, 1.0, 0.7)
+
+    return [
+        _payload(
+            channels[i],
+            matcher.version,
+            hits[i],
+            clarity=float(clarity[i]),
+            emotional=float(emotional[i]),
+            cta_strength=float(cta_strength[i]),
+            length_score=float(length_score[i]),
+            readability=float(readability[i]),
+            word_count=int(word_count[i]),
+            char_count=int(char_count[i]),
+            sentence_count=int(sentence_count[i]),
+            avg_sentence_length=float(avg_sentence_length[i]),
+            power_hits=int(power_hits[i]),
+            weak_hits=int(weak_hits[i]),
+            limit=int(limit[i]),
+        )
+        for i in range(n)
+    ]
+
+
+def _payload(
+    channel: str,
+    lexicon_version: str,
+    hits: dict[str, list[str]],
+    *,
+    clarity: float,
+    emotional: float,
+    cta_strength: float,
+    length_score: float,
+    readability: float,
+    word_count: int,
+    char_count: int,
+    sentence_count: int,
+    avg_sentence_length: float,
+    power_hits: int,
+    weak_hits: int,
+    limit: int,
+) -> dict[str, Any]:
+    overall = round((clarity + emotional + cta_strength + length_score + readability) / 5, 2)
+
+    suggestions = []
+    if power_hits == 0:
+        suggestions.append("Add power words (e.g., 'exclusive', 'proven', 'free').")
+    if length_score < 0.7:
+        suggestions.append(f"Copy is too long for {channel}. Trim to fit limits.")
+    if cta_strength < 0.8:
+        suggestions.append("Strengthen the CTA — use a clear action verb.")
+    for category, terms in hits.items():
+        if category not in (WEAK, POWER, CTA):
+            label = category.replace("_", " ")
+            suggestions.append(f"Review {label} terms: {', '.join(terms)}.")
+    if not suggestions:
+        suggestions.append("Copy looks solid — minor tweaks at most.")
+
+    return {
+        "overall_score": overall,
+        "scores": {
+            "readability": round(readability, 2),
+            "emotional_impact": round(emotional, 2),
+            "clarity": round(clarity, 2),
+            "cta_strength": round(cta_strength, 2),
+            "length_appropriateness": round(length_score, 2),
+        },
+        "metrics": {
+            "word_count": word_count,
+            "character_count": char_count,
+            "sentence_count": sentence_count,
+            "avg_sentence_length": round(avg_sentence_length, 1),
+            "power_words_found": power_hits,
+            "weak_words_found": weak_hits,
+            "channel_char_limit": limit,
+        },
+        "lexicon": {"version": lexicon_version, "hits": hits},
+        "suggestions": suggestions,
+    }
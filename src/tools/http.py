@@ -0,0 +1,79 @@
+"""
+Process-wide HTTP client for the tools' web APIs.
+
+A module-level ``httpx.post`` builds a new client for every request: an
+SSL context, then DNS, TCP and TLS handshakes before each Serper search.
+Tools share one pooled, keep-alive client instead, so concurrent stages
+and back-to-back campaigns reuse warm connections:
+
+    resp = http_client().post(SERPER_SEARCH_URL, json=payload, headers=headers)
+
+The client is created on first use and closed at interpreter exit (or by
+``close_http_client``). ``httpx.Client`` is thread-safe, which covers
+async runs too: CrewAI runs sync tools in a worker thread. ``HTTP2=true``
+multiplexes requests over one connection when the optional ``h2``
+package is installed (``pip install "httpx[http2]"``).
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import threading
+
+import httpx
+from rich.console import Console
+
+from src.config import settings
+
+console = Console()
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+_exit_hook = False
+
+
+def http_client() -> httpx.Client:
+    """The shared client, created with the current settings on first use."""
+    global _client, _exit_hook
+    with _lock:
+        if _client is None or _client.is_closed:
+            _client = _build_client()
+            if not _exit_hook:
+                atexit.register(close_http_client)
+                _exit_hook = True
+        return _client
+
+
+def close_http_client() -> None:
+    """Close the shared client's connections; the next call makes a new one."""
+    global _client
+    with _lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _build_client() -> httpx.Client:
+    http2 = settings.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        console.print(
+            "  [dim]HTTP2=true needs the h2 package "
+            '(pip install "httpx[http2]"); using HTTP/1.1[/dim]'
+        )
+        http2 = False
+    connections = settings.http_max_connections
+    return httpx.Client(
+        http2=http2,
+        timeout=httpx.Timeout(
+            settings.http_timeout, connect=min(settings.http_timeout, 5.0)
+        ),
+        limits=httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=connections,
+            keepalive_expiry=60.0,
+        ),
+    )
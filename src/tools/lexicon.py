@@ -0,0 +1,208 @@
+"""
+Word lists for copy scoring, loaded from files and compiled once.
+
+A lexicon is a directory with one ``<category>.txt`` per word list — one
+term per line, ``#`` starts a comment. ``weak``, ``power`` and ``cta``
+drive ``CopyEvaluationTool``'s scores; any other file (``banned``,
+``trademarks``, ...) is matched and reported too:
+
+    matcher = lexicon_matcher("lexicons/de")
+    matcher.find("Jetzt kostenlos testen")   # {"power": ["kostenlos"]}
+    matcher.find_all(headlines)              # one dict per headline
+
+Each category's terms compile into one regex shaped like a trie of
+their characters, so a scan is one pass over the copy in C per category,
+whatever the size of the lists. Categories are matched independently:
+a term may hit in several of them. Terms match whole words, case-
+insensitively; the words of a phrase may be separated by any whitespace.
+Compiled matchers are cached by lexicon version — a hash of the files'
+contents. The files are checked for changes at most every
+``RECHECK_SECONDS``, so an edited lexicon is picked up within a second.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import Sequence
+
+# Bundled word lists, used unless ``COPY_LEXICON`` names another directory
+DEFAULT_LEXICON = Path(__file__).parent / "lexicons" / "default"
+# Seconds a directory's files are trusted unchanged before being re-stat'ed
+RECHECK_SECONDS = 1.0
+
+
+class LexiconError(ValueError):
+    """Raised when a lexicon directory cannot be loaded."""
+
+
+@dataclass(frozen=True)
+class Lexicon:
+    """Terms per category, and the version their contents hash to."""
+
+    version: str
+    categories: dict[str, tuple[str, ...]]
+
+
+class LexiconMatcher:
+    """Compiled matchers over the terms of each category of a ``Lexicon``."""
+
+    def __init__(self, lexicon: Lexicon) -> None:
+        self.version = lexicon.version
+        self.categories = lexicon.categories
+        # One regex per category, so a longer term of one category (banned
+        # "free trial") never hides a shorter one of another (power "free")
+        self._regexes = {
+            category: re.compile(_category_pattern(terms))
+            for category, terms in lexicon.categories.items()
+            if terms
+        }
+        self._order = {
+            category: {term: index for index, term in enumerate(terms)}
+            for category, terms in lexicon.categories.items()
+        }
+
+    def terms_in(self, text: str) -> set[str]:
+        """Distinct terms of any category found in ``text``, normalised."""
+        return {term for terms in self.find(text).values() for term in terms}
+
+    def find(self, text: str) -> dict[str, list[str]]:
+        """Terms found in ``text`` per category that has any, in lexicon order.
+
+        Within a category the longest term wins ("free trial" over "free").
+        """
+        text = text.lower()
+        found: dict[str, list[str]] = {}
+        for category, regex in self._regexes.items():
+            terms = {" ".join(m.split()) for m in regex.findall(text)}
+            if terms:
+                found[category] = sorted(terms, key=self._order[category].__getitem__)
+        return found
+
+    def find_all(self, texts: Sequence[str]) -> list[dict[str, list[str]]]:
+        """``find`` of each text, scanning all of them in one pass per category.
+
+        The texts are joined with NUL, which is neither a word character
+        nor whitespace, so no term matches across two of them.
+        """
+        lowered = [text.lower() for text in texts]
+        starts = list(accumulate((len(t) + 1 for t in lowered), initial=0))
+        joined = "\0".join(lowered)
+        found: list[dict[str, list[str]]] = [{} for _ in lowered]
+        for category, regex in self._regexes.items():
+            per_text: dict[int, set[str]] = {}
+            for match in regex.finditer(joined):
+                row = bisect_right(starts, match.start()) - 1
+                per_text.setdefault(row, set()).add(" ".join(match[0].split()))
+            order = self._order[category].__getitem__
+            for row, terms in per_text.items():
+                found[row][category] = sorted(terms, key=order)
+        return found
+
+
+def load_lexicon(directory: Path) -> Lexicon:
+    """Read every ``*.txt`` word list in ``directory``."""
+    files = sorted(directory.glob("*.txt")) if directory.is_dir() else []
+    if not files:
+        raise LexiconError(f"{directory} has no *.txt word lists.")
+    digest = hashlib.sha256()
+    categories = {}
+    for path in files:
+        content = path.read_bytes()
+        digest.update(path.name.encode() + b"\0" + content + b"\0")
+        lines = content.decode("utf-8").splitlines()
+        terms = (_normalize(line.split("#", 1)[0]) for line in lines)
+        categories[path.stem] = tuple(dict.fromkeys(t for t in terms if t))
+    return Lexicon(version=digest.hexdigest()[:16], categories=categories)
+
+
+def lexicon_matcher(directory: Path | str | None = None) -> LexiconMatcher:
+    """Matcher for ``directory`` (default: bundled), compiled once per version.
+
+    Files are only re-read when one of them changed on disk.
+    """
+    directory = Path(directory) if directory else DEFAULT_LEXICON
+    now = time.monotonic()
+    with _lock:
+        loaded = _loaded.get(directory)
+        if loaded is not None and now - loaded[2] < RECHECK_SECONDS:
+            return loaded[1]
+    stamp = _stamp(directory)
+    if loaded is not None and loaded[0] == stamp:
+        with _lock:
+            _loaded[directory] = (stamp, loaded[1], now)
+        return loaded[1]
+    lexicon = load_lexicon(directory)
+    with _lock:
+        matcher = _matchers.get(lexicon.version)
+        if matcher is None:
+            matcher = _matchers[lexicon.version] = LexiconMatcher(lexicon)
+        _loaded[directory] = (stamp, matcher, now)
+        return matcher
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+_matchers: dict[str, LexiconMatcher] = {}
+# Directory → (file stamps, matcher, when checked), to skip unchanged files
+_loaded: dict[Path, tuple[tuple, LexiconMatcher, float]] = {}
+_lock = threading.Lock()
+
+
+def _stamp(directory: Path) -> tuple:
+    """Name, mtime and size of each word list."""
+    try:
+        with os.scandir(directory) as entries:
+            return tuple(sorted(
+                (entry.name, stat.st_mtime_ns, stat.st_size)
+                for entry in entries
+                if entry.name.endswith(".txt")
+                for stat in (entry.stat(),)
+            ))
+    except OSError:
+        return ()
+
+
+def _normalize(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+def _category_pattern(terms) -> str:
+    """Whole-word match of any of ``terms``, longest first."""
+    # Checking the first character first skips most positions cheaply
+    first = "".join(sorted({re.escape(term[0]) for term in terms}))
+    return rf"(?=[{first}])(?<!\w)(?:{_trie_pattern(terms)})(?!\w)"
+
+
+def _trie_pattern(terms) -> str:
+    """One alternation per shared prefix: ``save|saver`` → ``save(?:r)?``."""
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of a term
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: dict) -> str:
+    branches = [
+        (r"\s+" if char == " " else re.escape(char)) + _node_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if "" in node:
+        # A term may end here; the greedy ``?`` tries longer ones first
+        return "(?:" + "|".join(branches) + ")?"
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
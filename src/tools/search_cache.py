@@ -0,0 +1,223 @@
+"""
+Persistent TTL cache of raw Serper search responses.
+
+Research agents repeat the same ``(query, industry)`` searches within a
+run (each agent loops up to ``max_iter`` times) and across campaigns in
+the same market. Every live search is a paid, slow Serper call, so
+responses are kept in ``{output_dir}/search_cache.sqlite3``, keyed by the
+normalised query:
+
+    data = search_cache.fetch(search_key(query), lambda: serper(query))
+
+* younger than ``SEARCH_CACHE_TTL`` hours — served from disk;
+* older, but within ``SEARCH_CACHE_STALE`` more hours — served from disk
+  while one background refresh replaces it (stale-while-revalidate);
+* older still, or missing — fetched, stored and returned.
+
+Once the table holds more than ``SEARCH_CACHE_MAX_ENTRIES`` responses the
+least recently used are evicted. ``SEARCH_CACHE_TTL=0`` turns the cache
+off. ``stats()`` reports hits, stale hits, misses and the hit rate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from src.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    used_at REAL NOT NULL
+)
+"""
+
+
+def search_key(query: str, **params: Any) -> str:
+    """Hash of a search: case- and whitespace-insensitive query, params."""
+    normalized = " ".join(query.lower().split())
+    blob = json.dumps([normalized, params], sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """SQLite store of search responses with TTL, stale window and LRU cap."""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl: float | None = None,
+        stale: float | None = None,
+        max_entries: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        # Unset values follow settings (hours for ttl/stale), resolved on use
+        self._path = path
+        self._ttl = ttl
+        self._stale = stale
+        self._max_entries = max_entries
+        self._clock = clock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._db: sqlite3.Connection | None = None
+        self._db_path: Path | None = None
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path or settings.search_cache_path
+
+    @property
+    def ttl(self) -> float:
+        """Seconds a response is served as fresh."""
+        if self._ttl is not None:
+            return self._ttl
+        return settings.search_cache_ttl * 3600
+
+    @property
+    def stale(self) -> float:
+        """Seconds past ``ttl`` a response is still served while refreshed."""
+        if self._stale is not None:
+            return self._stale
+        return settings.search_cache_stale * 3600
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return settings.search_cache_max_entries
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def fetch(self, key: str, load: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """The response stored under ``key``, or ``load()``'s, stored.
+
+        Errors from ``load`` propagate on a miss; a failed background
+        refresh keeps the stale response.
+        """
+        if not self.enabled:
+            return load()
+        entry = self.get(key)
+        if entry is not None:
+            payload, age = entry
+            if age < self.ttl:
+                self._count("hits")
+                return payload
+            if age < self.ttl + self.stale:
+                self._count("stale_hits")
+                self._revalidate(key, load)
+                return payload
+        self._count("misses")
+        payload = load()
+        self.put(key, payload)
+        return payload
+
+    def get(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """Stored response for ``key`` and its age in seconds, if any."""
+        now = self._clock()
+        with self._lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT payload, fetched_at FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE searches SET used_at = ? WHERE key = ?", (now, key))
+            db.commit()
+        return json.loads(row[0]), now - row[1]
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        """Store a freshly fetched response and evict past ``max_entries``."""
+        now = self._clock()
+        content = json.dumps(payload)
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?)",
+                (key, content, now, now),
+            )
+            db.execute(
+                "DELETE FROM searches WHERE key IN (SELECT key FROM searches "
+                "ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (max(self.max_entries, 1),),
+            )
+            db.commit()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries = self._connect().execute(
+                "SELECT COUNT(*) FROM searches"
+            ).fetchone()[0]
+            served = self.hits + self.stale_hits
+            lookups = served + self.misses
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_rate": served / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ── Private helpers ──────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        """The connection for the current ``path``; caller holds the lock."""
+        path = self.path
+        if self._db is None or self._db_path != path:
+            if self._db is not None:
+                self._db.close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Shared by tool threads; every use is under ``_lock``
+            self._db = sqlite3.connect(path, check_same_thread=False, timeout=10)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # A lost last write costs one repeat search, not worth an fsync
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(_SCHEMA)
+            self._db_path = path
+        return self._db
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _revalidate(self, key: str, load: Callable[[], dict[str, Any]]) -> None:
+        """Refresh ``key`` in the background, once at a time per key."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self.put(key, load())
+            except Exception:
+                pass  # keep serving the stale response
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(
+            target=refresh, name=f"search-refresh-{key[:8]}", daemon=True
+        ).start()
+
+
+# Module-level singleton shared by every TrendResearchTool in the process
+search_cache = SearchCache()
@@ -1,13 +1,17 @@
 """Trend Research Tool.
 
-If a Serper API key is configured the tool performs a real web search;
-otherwise it falls back to an LLM-free simulated analysis so the
-project works out of the box without extra API keys.
+If a Serper API key is configured the tool performs a real web search
+over the shared keep-alive client in ``src.tools.http``, answered from
+``src.tools.search_cache`` when the same query ran recently; otherwise it
+falls back to an LLM-free simulated analysis so the project works out of
+the box without extra API keys.
 """
 
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
 from typing import Any, Type
 
 import httpx
@@ -15,6 +19,16 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from src.config import settings
+from src.tools.http import http_client
+from src.tools.search_cache import search_cache, search_key
+
+SERPER_SEARCH_URL = "https://google.serper.dev/search"
+
+
+# Searches one call fans out to at most; further combinations are dropped
+MAX_SEARCHES = 6
+# Organic results a merged multi-search report lists
+MAX_MERGED_RESULTS = 15
 
 
 class TrendResearchInput(BaseModel):
@@ -24,26 +38,86 @@ class TrendResearchInput(BaseModel):
     industry: str = Field(
         default="general", description="Industry vertical to focus on"
     )
+    queries: list[str] = Field(
+        default_factory=list,
+        description=(
+            "More queries to research in the same call; they run "
+            "concurrently and their results are merged"
+        ),
+    )
+    industries: list[str] = Field(
+        default_factory=list,
+        description="More industry verticals to search every query in",
+    )
 
 
 class TrendResearchTool(BaseTool):
     name: str = "trend_research"
     description: str = (
         "Research current market trends, consumer behaviour and industry "
-        "developments for a given topic. Returns structured trend data."
+        "developments for a given topic. Returns structured trend data. "
+        "Pass every query you need at once (query plus queries) rather "
+        "than calling the tool repeatedly; they are searched in parallel."
     )
     args_schema: Type[BaseModel] = TrendResearchInput
+    search_url: str = SERPER_SEARCH_URL
 
-    def _run(self, query: str, industry: str = "general") -> str:
+    def _run(
+        self,
+        query: str,
+        industry: str = "general",
+        queries: list[str] | None = None,
+        industries: list[str] | None = None,
+    ) -> str:
         """Execute the tool — live search or simulated."""
+        searches = _searches(
+            [query, *(queries or [])], [industry, *(industries or [])]
+        ) or [(query, industry)]
         if settings.has_serper:
-            return self._live_search(query, industry)
-        return self._simulated_search(query, industry)
+            return self._live_searches(searches)
+        return self._simulated_search(*_labels(searches))
 
     # ── Private helpers ──────────────────────────────────────────────
 
     def _live_search(self, query: str, industry: str) -> str:
         """Perform a real Serper.dev Google search."""
+        return self._live_searches([(query, industry)])
+
+    def _live_searches(self, searches: list[tuple[str, str]]) -> str:
+        """Run ``searches`` concurrently and report their merged results."""
+        if len(searches) == 1:
+            outcomes = [self._search(*searches[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=len(searches), thread_name_prefix="trend-search"
+            ) as pool:
+                outcomes = list(pool.map(lambda s: self._search(*s), searches))
+
+        found = [data for data in outcomes if isinstance(data, dict)]
+        failed = [
+            (search, exc)
+            for search, exc in zip(searches, outcomes)
+            if isinstance(exc, httpx.HTTPError)
+        ]
+        query, industry = _labels(searches)
+        if not found:
+            return (
+                f"Live search failed ({failed[0][1]}); falling back to analysis.\n"
+                + self._simulated_search(query, industry)
+            )
+        if len(found) == 1:
+            report = self._format_serper_results(found[0], query, industry)
+        else:
+            report = self._format_serper_results(
+                _merge_results(found), query, industry, limit=MAX_MERGED_RESULTS
+            )
+        notes = [
+            f"_Search for {q!r} ({i}) failed: {exc}_\n" for (q, i), exc in failed
+        ]
+        return "\n".join([report, *notes]) if notes else report
+
+    def _search(self, query: str, industry: str) -> dict[str, Any] | httpx.HTTPError:
+        """One Serper search, from the cache when it ran recently."""
         search_query = f"{query} {industry} trends 2025"
         headers = {
             "X-API-KEY": settings.serper_api_key,
@@ -51,30 +125,26 @@ class TrendResearchTool(BaseTool):
         }
         payload = {"q": search_query, "num": 10}
 
-        try:
-            resp = httpx.post(
-                "https://google.serper.dev/search",
-                headers=headers,
-                json=payload,
-                timeout=15,
+        def serper() -> dict[str, Any]:
+            resp = http_client().post(
+                self.search_url, headers=headers, json=payload
             )
             resp.raise_for_status()
-            data = resp.json()
-            return self._format_serper_results(data, query, industry)
+            return resp.json()
+
+        try:
+            return search_cache.fetch(search_key(search_query, num=10), serper)
         except httpx.HTTPError as exc:
-            return (
-                f"Live search failed ({exc}); falling back to analysis.\n"
-                + self._simulated_search(query, industry)
-            )
+            return exc
 
     def _format_serper_results(
-        self, data: dict[str, Any], query: str, industry: str
+        self, data: dict[str, Any], query: str, industry: str, limit: int = 7
     ) -> str:
         lines = [
             f"## Trend Research Results: {query} ({industry})\n",
             "### Top Search Results\n",
         ]
-        for item in data.get("organic", [])[:7]:
+        for item in data.get("organic", [])[:limit]:
             lines.append(
                 f"- **{item.get('title', 'N/A')}**\n"
                 f"  {item.get('snippet', 'No snippet')}\n"
@@ -138,3 +208,49 @@ class TrendResearchTool(BaseTool):
             ),
         }
         return json.dumps(analysis, indent=2)
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _searches(queries: list[str], industries: list[str]) -> list[tuple[str, str]]:
+    """Every distinct (query, industry) pair, at most ``MAX_SEARCHES``."""
+    queries = list(dict.fromkeys(q.strip() for q in queries if q.strip()))
+    industries = list(dict.fromkeys(i.strip() for i in industries if i.strip()))
+    pairs = [(q, i) for q in queries for i in industries or ["general"]]
+    return pairs[:MAX_SEARCHES]
+
+
+def _labels(searches: list[tuple[str, str]]) -> tuple[str, str]:
+    """Query and industry headings covering all of ``searches``."""
+    queries = dict.fromkeys(q for q, _ in searches)
+    industries = dict.fromkeys(i for _, i in searches)
+    return "; ".join(queries), ", ".join(industries)
+
+
+def _merge_results(responses: list[dict[str, Any]]) -> dict[str, Any]:
+    """Several responses as one, duplicate links dropped.
+
+    Organic results are interleaved rank by rank, so every search's top
+    hits come before any search's lower ones.
+    """
+    organic = []
+    seen = set()
+    for item in (
+        item
+        for rank in zip_longest(*(r.get("organic", []) for r in responses))
+        for item in rank
+        if item is not None
+    ):
+        link = str(item.get("link", "")).strip().lower().rstrip("/")
+        if link and link in seen:
+            continue
+        seen.add(link)
+        organic.append(item)
+    merged: dict[str, Any] = {"organic": organic}
+    knowledge = next(
+        (r["knowledgeGraph"] for r in responses if r.get("knowledgeGraph")), None
+    )
+    if knowledge:
+        merged["knowledgeGraph"] = knowledge
+    return merged
@@ -1,5 +1,46 @@
 """Workflow orchestration for the campaign creation process"""
 
-from src.workflow.crew_workflow import CampaignCrew
+from __future__ import annotations
 
-__all__ = ["CampaignCrew"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.workflow.batch import BatchReport, BatchResult, load_requests, run_batch
+    from src.workflow.crew_workflow import CampaignCrew
+    from src.workflow.estimate import (
+        BatchEstimate,
+        CampaignEstimate,
+        estimate_batch,
+        estimate_campaign,
+    )
+    from src.workflow.scheduler import (
+        DagScheduler,
+        StageTimeoutError,
+        TaskGraphError,
+    )
+
+# Re-exports resolve on first access so ``load_requests`` and friends do
+# not drag CrewAI in until a crew is actually built.
+_EXPORTS = {
+    "BatchReport": "src.workflow.batch",
+    "BatchEstimate": "src.workflow.estimate",
+    "BatchResult": "src.workflow.batch",
+    "CampaignCrew": "src.workflow.crew_workflow",
+    "CampaignEstimate": "src.workflow.estimate",
+    "DagScheduler": "src.workflow.scheduler",
+    "StageTimeoutError": "src.workflow.scheduler",
+    "TaskGraphError": "src.workflow.scheduler",
+    "estimate_batch": "src.workflow.estimate",
+    "estimate_campaign": "src.workflow.estimate",
+    "load_requests": "src.workflow.batch",
+    "run_batch": "src.workflow.batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name]), name)
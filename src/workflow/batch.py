@@ -0,0 +1,157 @@
+"""
+Batch mode — run many CampaignRequests through a bounded worker pool.
+
+    requests, errors = load_requests(Path("requests.jsonl"))
+    report = run_batch(requests, workers=4)
+    print(report.campaigns_per_minute, report.p95_seconds)
+
+Each JSONL line is validated into a ``CampaignRequest``; each campaign
+saves its own outputs as soon as it finishes.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Sequence
+
+from pydantic import ValidationError
+
+from src.models.campaign_models import CampaignBrief, CampaignRequest
+
+CampaignRunner = Callable[[CampaignRequest], CampaignBrief]
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One validated request and the JSONL line it came from."""
+
+    line: int
+    request: CampaignRequest
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of a single campaign in the batch."""
+
+    line: int
+    product_name: str
+    seconds: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    """Throughput and latency summary for a finished batch."""
+
+    results: list[BatchResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> list[BatchResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> list[BatchResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def campaigns_per_minute(self) -> float:
+        if self.wall_seconds <= 0:
+            return 0.0
+        return len(self.succeeded) / (self.wall_seconds / 60)
+
+    @property
+    def p50_seconds(self) -> float:
+        return percentile([r.seconds for r in self.succeeded], 50)
+
+    @property
+    def p95_seconds(self) -> float:
+        return percentile([r.seconds for r in self.succeeded], 95)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def load_requests(path: Path) -> tuple[list[BatchItem], list[str]]:
+    """Parse a JSONL file into requests, collecting per-line errors."""
+    items: list[BatchItem] = []
+    errors: list[str] = []
+    with path.open(encoding="utf-8") as fh:
+        for line_no, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                request = CampaignRequest.model_validate_json(line)
+            except ValidationError as exc:
+                errors.append(f"line {line_no}: {exc.errors()[0]['msg']}")
+                continue
+            items.append(BatchItem(line=line_no, request=request))
+    return items, errors
+
+
+def run_batch(
+    items: Sequence[BatchItem],
+    workers: int = 4,
+    concurrent: bool = True,
+    reuse_stages: bool = True,
+    runner: CampaignRunner | None = None,
+    on_result: Callable[[BatchResult], None] | None = None,
+) -> BatchReport:
+    """Run every item with at most ``workers`` campaigns in flight."""
+
+    def run_with_crew(request: CampaignRequest) -> CampaignBrief:
+        from src.workflow.crew_workflow import CampaignCrew
+
+        return CampaignCrew(
+            request,
+            concurrent=concurrent,
+            reuse_stages=reuse_stages,
+            seed_research=reuse_stages,
+        ).run()
+
+    run = runner or run_with_crew
+    report = BatchReport()
+
+    def timed(item: BatchItem) -> BatchResult:
+        start = time.perf_counter()
+        try:
+            run(item.request)
+        except Exception as exc:  # one bad campaign must not sink the batch
+            return BatchResult(
+                line=item.line,
+                product_name=item.request.product_name,
+                seconds=time.perf_counter() - start,
+                error=str(exc) or type(exc).__name__,
+            )
+        return BatchResult(
+            line=item.line,
+            product_name=item.request.product_name,
+            seconds=time.perf_counter() - start,
+        )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=max(1, workers), thread_name_prefix="campaign"
+    ) as pool:
+        futures = [pool.submit(timed, item) for item in items]
+        for future in as_completed(futures):
+            result = future.result()
+            report.results.append(result)
+            if on_result:
+                on_result(result)
+    report.wall_seconds = time.perf_counter() - start
+    return report
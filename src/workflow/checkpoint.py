@@ -0,0 +1,118 @@
+"""
+Stage-level checkpoints for campaign runs.
+
+Every finished task output is written to
+``{output_dir}/checkpoints/{run_id}/{task_name}.json`` the moment it
+completes, next to a ``run.json`` holding the original request. A failed
+run can then be resumed without paying for the stages that already
+succeeded:
+
+    store = CheckpointStore.open(run_id)
+    crew = CampaignCrew.resume(run_id)
+
+Only failed runs are resumable, so a run's directory is deleted once it
+succeeds.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from crewai.tasks.task_output import TaskOutput
+
+from src.config import settings
+from src.models.campaign_models import CampaignRequest
+
+# TaskOutput fields worth persisting; prompt messages are not needed to resume
+PERSISTED_OUTPUT_FIELDS = {
+    "name",
+    "description",
+    "expected_output",
+    "raw",
+    "json_dict",
+    "agent",
+}
+
+
+class CheckpointError(LookupError):
+    """Raised when a run id has no usable checkpoint on disk."""
+
+
+def new_run_id(request: CampaignRequest) -> str:
+    """Build a readable, collision-free id for a campaign run."""
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    slug = request.product_name.lower().replace(" ", "_")[:30]
+    return f"{slug}_{ts}_{uuid.uuid4().hex[:6]}"
+
+
+class CheckpointStore:
+    """Directory of per-stage outputs for a single campaign run."""
+
+    def __init__(self, run_id: str, root: Path | None = None) -> None:
+        self.run_id = run_id
+        self.path = (root or settings.checkpoint_dir) / run_id
+
+    @classmethod
+    def create(
+        cls,
+        request: CampaignRequest,
+        concurrent: bool,
+        run_id: str | None = None,
+        root: Path | None = None,
+    ) -> "CheckpointStore":
+        """Start a new run directory and record how it was launched."""
+        store = cls(run_id or new_run_id(request), root)
+        store.path.mkdir(parents=True, exist_ok=True)
+        store._write(
+            "run.json",
+            json.dumps(
+                {
+                    "run_id": store.run_id,
+                    "concurrent": concurrent,
+                    "request": request.model_dump(mode="json"),
+                },
+                indent=2,
+            ),
+        )
+        return store
+
+    @classmethod
+    def open(cls, run_id: str, root: Path | None = None) -> "CheckpointStore":
+        """Re-open an existing run directory."""
+        store = cls(run_id, root)
+        if not (store.path / "run.json").is_file():
+            raise CheckpointError(f"No checkpoint found for run '{run_id}'.")
+        return store
+
+    def load_run(self) -> tuple[CampaignRequest, bool]:
+        """Return the original request and whether it ran concurrently."""
+        data = json.loads((self.path / "run.json").read_text(encoding="utf-8"))
+        return CampaignRequest.model_validate(data["request"]), data["concurrent"]
+
+    def save(self, stage: str, output: TaskOutput) -> None:
+        """Persist one finished stage."""
+        self._write(
+            f"{stage}.json",
+            output.model_dump_json(include=PERSISTED_OUTPUT_FIELDS, indent=2),
+        )
+
+    def load(self, stage: str) -> TaskOutput | None:
+        """Return a previously saved stage output, if any."""
+        path = self.path / f"{stage}.json"
+        if not path.is_file():
+            return None
+        return TaskOutput.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def delete(self) -> None:
+        """Remove the run directory once the run no longer needs resuming."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _write(self, name: str, content: str) -> None:
+        # Write-then-rename so a crash never leaves a half-written stage
+        tmp = self.path / f".{name}.tmp"
+        tmp.write_text(content, encoding="utf-8")
+        tmp.replace(self.path / name)
@@ -2,23 +2,69 @@
 CampaignCrew — orchestrates agents + tasks via CrewAI.
 
     crew = CampaignCrew(request)
-    brief = crew.run()
+    brief = crew.run()              # blocking
+    brief = await crew.run_async()  # from an event loop
+
+By default independent stages (trend and competitor research, and one
+copywriting sub-task per channel) run concurrently through
+``DagScheduler``; pass ``concurrent=False`` for the
+classic one-after-another pipeline.
+
+Every finished stage is checkpointed under its ``run_id``, so a failed
+run can pick up where it stopped:
+
+    brief = CampaignCrew.resume(run_id).run()
+
+The checkpoints of a run that succeeds are deleted.
+
+Stages whose inputs have not changed since any earlier run (same prompt,
+model and upstream outputs) are reused from the stage cache, so editing
+one request field only regenerates the stages that actually read it.
+
+Campaigns that name a ``category`` share research: the first one in a
+category stores its research, later ones are seeded with it and only
+research the product-specific delta (see ``research_store``). Campaigns
+of a category that start together wait for the first one's research.
+
+Before the manager assembles the brief, a local ``context_digest`` stage
+trims each upstream output to its ``CONTEXT_BUDGETS`` share, so the
+largest prompt of the run no longer grows with every channel.
+
+Agents are borrowed from the process-wide ``agent_pool`` and returned
+when the run ends, so back-to-back campaigns skip agent construction.
+Each is built on the model ``AGENT_MODELS`` / ``TASK_MODELS`` route its
+stage to; a stage that fails or answers poorly on a smaller model is
+re-run on ``FALLBACK_MODEL`` (see ``routing``).
+
+Each run also writes ``{base}_trace.json`` with per-stage wall time, LLM
+calls, tool calls, tokens and estimated cost (``crew.trace``).
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
 from datetime import datetime
+from pathlib import Path
+from typing import Sequence
 
-from crewai import Crew, Process
+from crewai import Crew, Process, Task
 from rich.console import Console
 from rich.panel import Panel
 
 from src.agents import (
+    ART_DIRECTOR_AGENT_SPEC,
+    COPYWRITER_AGENT_SPEC,
+    MANAGER_AGENT_SPEC,
+    RESEARCH_AGENT_SPEC,
     create_art_director_agent,
     create_copywriter_agent,
     create_manager_agent,
     create_research_agent,
 )
+from src.agents.pool import agent_pool
+from src.agents.rate_limiter import rate_limit_owner
 from src.config import settings
 from src.models.campaign_models import (
     CampaignBrief,
@@ -27,72 +73,203 @@ from src.models.campaign_models import (
     MarketResearch,
     VisualDirection,
 )
-from src.tasks.campaign_tasks import CampaignTaskFactory
+from src.tasks.campaign_tasks import (
+    CampaignTaskFactory,
+    TaskType,
+    channel_copy_task_name,
+)
+from src.tasks.digest import list_items, section
+from src.tasks.structured import merge_models, stage_model
+from src.workflow.checkpoint import CheckpointError, CheckpointStore, new_run_id
+from src.workflow.research_store import (
+    CategoryResearch,
+    ResearchStore,
+    ToolResultRecorder,
+)
+from src.workflow.routing import FallbackRunner, model_for
+from src.workflow.scheduler import DagScheduler
+from src.workflow.stage_cache import StageCache
+from src.workflow.streaming import StreamRecorder
+from src.workflow.tracing import RunTracer
 
 console = Console()
 
+# Guards output-name reservation when several campaigns finish together
+_output_lock = threading.Lock()
+
 
 class CampaignCrew:
     """High-level facade around a CrewAI crew."""
 
-    def __init__(self, request: CampaignRequest) -> None:
+    def __init__(
+        self,
+        request: CampaignRequest,
+        concurrent: bool = True,
+        run_id: str | None = None,
+        reuse_stages: bool = True,
+        stream: bool = False,
+        seed_research: bool = True,
+    ) -> None:
         self.request = request
-        self._factory = CampaignTaskFactory(request)
-
-        # Build agents
+        self.concurrent = concurrent
+        self.run_id = run_id or new_run_id(request)
+        self.reuse_stages = reuse_stages
+        self.stream = stream
+        self.output_base: Path | None = None
+        self.trace: RunTracer | None = None
+        self.router = FallbackRunner()
+        self._tool_recorder: ToolResultRecorder | None = None
+        self._checkpoints: CheckpointStore | None = None
+
+        # Category research shared with earlier campaigns in the same market
+        self.research_store = ResearchStore() if request.category else None
+        self.category_research: CategoryResearch | None = None
+
+        # Build agents, each on the model its stage is routed to
+        researcher = RESEARCH_AGENT_SPEC.name
         console.print("  [dim]Creating Research Agent...[/dim]")
-        self.researcher = create_research_agent()
+        self.researcher = agent_pool.acquire(
+            create_research_agent,
+            model_for(researcher, TaskType.MARKET_RESEARCH.value),
+        )
+
+        # Concurrent tasks must not share an agent executor
+        self.competitor_analyst = None
+        if concurrent:
+            console.print("  [dim]Creating Competitor Research Agent...[/dim]")
+            self.competitor_analyst = agent_pool.acquire(
+                create_research_agent,
+                model_for(researcher, TaskType.COMPETITOR_ANALYSIS.value),
+            )
 
+        copywriter = COPYWRITER_AGENT_SPEC.name
         console.print("  [dim]Creating Copywriter Agent...[/dim]")
-        self.copywriter = create_copywriter_agent()
+        self.copywriter = agent_pool.acquire(
+            create_copywriter_agent,
+            model_for(
+                copywriter,
+                f"{TaskType.COPYWRITING.value}_core"
+                if concurrent
+                else TaskType.COPYWRITING.value,
+            ),
+        )
+
+        self.channel_copywriters = []
+        if concurrent:
+            console.print(
+                f"  [dim]Creating {len(request.channels)} Channel "
+                "Copywriter Agents...[/dim]"
+            )
+            self.channel_copywriters = [
+                agent_pool.acquire(
+                    create_copywriter_agent,
+                    model_for(copywriter, channel_copy_task_name(channel)),
+                )
+                for channel in request.channels
+            ]
 
         console.print("  [dim]Creating Art Director Agent...[/dim]")
-        self.art_director = create_art_director_agent()
+        self.art_director = agent_pool.acquire(
+            create_art_director_agent,
+            model_for(
+                ART_DIRECTOR_AGENT_SPEC.name, TaskType.VISUAL_DIRECTION.value
+            ),
+        )
 
         console.print("  [dim]Creating Manager Agent...[/dim]")
-        self.manager = create_manager_agent()
+        self.manager = agent_pool.acquire(
+            create_manager_agent,
+            model_for(MANAGER_AGENT_SPEC.name, TaskType.CAMPAIGN_STRATEGY.value),
+        )
+
+        # Claimed once the agents are built, so a failed build never holds it
+        if self.research_store and seed_research:
+            self.category_research = self.research_store.claim(request.category)
+            if self.category_research:
+                console.print(
+                    f"  [dim]↺ Seeding research with stored "
+                    f"'{request.category}' findings from "
+                    f"{self.category_research.product_name}[/dim]"
+                )
+        self._factory = CampaignTaskFactory(request, self.category_research)
 
         # Build tasks (order matters)
-        self.research_task = self._factory.research_task(self.researcher)
-        self.copy_task = self._factory.copywriting_task(
-            self.copywriter, self.research_task
-        )
-        self.art_task = self._factory.art_direction_task(
-            self.art_director, self.research_task, self.copy_task
-        )
-        self.manager_task = self._factory.manager_task(
-            self.manager, self.research_task, self.copy_task, self.art_task
+        graph = self._factory.build_graph(
+            concurrent,
+            agents={
+                "researcher": self.researcher,
+                "competitor_analyst": self.competitor_analyst,
+                "copywriter": self.copywriter,
+                "channel_copywriters": self.channel_copywriters,
+                "art_director": self.art_director,
+                "manager": self.manager,
+            },
+            context_budgets=(
+                settings.context_budgets if settings.compact_context else None
+            ),
         )
-
-        # Assemble the crew
-        self.crew = Crew(
-            agents=[
+        self.research_task = graph.research_task
+        self.competitor_task = graph.competitor_task
+        self.copy_core_task = graph.copy_core_task
+        self.channel_copy_tasks = graph.channel_copy_tasks
+        self.copy_task = graph.copy_task
+        self.art_task = graph.art_task
+        self.digest_task = graph.digest_task
+        self.manager_task = graph.manager_task
+        self.tasks = graph.tasks
+
+        self.agents = [
+            agent
+            for agent in (
                 self.researcher,
+                self.competitor_analyst,
                 self.copywriter,
+                *self.channel_copywriters,
                 self.art_director,
                 self.manager,
-            ],
-            tasks=[
-                self.research_task,
-                self.copy_task,
-                self.art_task,
-                self.manager_task,
-            ],
+            )
+            if agent is not None
+        ]
+        if stream:
+            for agent in self.agents:
+                agent.llm.stream = True
+
+        # Assemble the crew (still usable directly via ``self.crew.kickoff()``)
+        self.crew = Crew(
+            agents=self.agents,
+            tasks=self.tasks,
             process=Process.sequential,
             verbose=True,
         )
 
+    @property
+    def live_path(self) -> Path:
+        """In-progress Markdown that streamed tokens are appended to."""
+        return settings.output_dir / f"{self.run_id}.live.md"
+
     def run(self) -> CampaignBrief:
         """Execute the full workflow and return a structured brief."""
         console.print(
             "\n[bold cyan]═══ AGENT WORKFLOW STARTING ═══[/bold cyan]\n"
         )
 
-        # Kick off CrewAI execution
-        result = self.crew.kickoff()
-
-        # Get the raw output string
-        raw_output = str(result)
+        # Kick off execution — the manager's brief is the final output
+        scheduler = self._scheduler()
+        self.trace = RunTracer(self.run_id, scheduler, self.router.fallbacks)
+        try:
+            with self.trace, self._streaming(), self._recording_tools():
+                with rate_limit_owner(self.run_id):
+                    outputs = scheduler.run()
+        except BaseException:
+            self._release_research()
+            self._save_failed_trace()
+            raise
+        finally:
+            self.release_agents(scheduler.abandoned)
+        raw_output = outputs[-1].raw
+        self._report_reuse(scheduler)
+        self._report_compaction()
+        self._share_research()
 
         console.print(
             "\n[bold cyan]═══ AGENT WORKFLOW COMPLETE ═══[/bold cyan]\n"
@@ -103,36 +280,232 @@ class CampaignCrew:
 
         # Save to disk
         self._save_outputs(brief, raw_output)
+        self.live_path.unlink(missing_ok=True)
+        self._checkpoints.delete()  # nothing left to resume
 
         return brief
 
+    async def run_async(self) -> CampaignBrief:
+        """Execute the workflow on the running event loop.
+
+        Uses CrewAI's native async execution, so many campaigns can share
+        one loop while they wait on the LLM. Cancelling the awaiting task
+        cancels every in-flight stage.
+        """
+        console.print(
+            "\n[bold cyan]═══ AGENT WORKFLOW STARTING ═══[/bold cyan]\n"
+        )
+
+        scheduler = await asyncio.to_thread(self._scheduler)
+        self.trace = RunTracer(self.run_id, scheduler, self.router.fallbacks)
+        try:
+            with self.trace, self._streaming(), self._recording_tools():
+                with rate_limit_owner(self.run_id):
+                    outputs = await scheduler.run_async()
+        except BaseException:
+            self._release_research()
+            await asyncio.to_thread(self._save_failed_trace)
+            raise
+        finally:
+            self.release_agents(scheduler.abandoned)
+        raw_output = outputs[-1].raw
+        self._report_reuse(scheduler)
+        self._report_compaction()
+        await asyncio.to_thread(self._share_research)
+
+        console.print(
+            "\n[bold cyan]═══ AGENT WORKFLOW COMPLETE ═══[/bold cyan]\n"
+        )
+
+        brief = self._build_brief(raw_output)
+
+        # File I/O off the loop so other campaigns keep progressing
+        await asyncio.to_thread(self._save_outputs, brief, raw_output)
+        self.live_path.unlink(missing_ok=True)
+        await asyncio.to_thread(self._checkpoints.delete)
+
+        return brief
+
+    @classmethod
+    def resume(cls, run_id: str) -> CampaignCrew:
+        """Rebuild a checkpointed run; ``run()`` skips finished stages."""
+        request, concurrent = CheckpointStore.open(run_id).load_run()
+        return cls(request, concurrent=concurrent, run_id=run_id)
+
+    def release_agents(self, abandoned: Sequence[Task] = ()) -> None:
+        """Hand this crew's agents back to the pool for the next campaign.
+
+        Agents of ``abandoned`` stages are dropped instead: their timed-out
+        threads may still be running on them.
+        """
+        busy = {id(task.agent) for task in abandoned}
+        for agent in self.agents:
+            if id(agent) not in busy:
+                agent_pool.release(agent)
+        if busy:
+            console.print(
+                f"  [dim]Dropped {len(busy)} agent(s) of timed-out stages "
+                "instead of pooling them[/dim]"
+            )
+
+    def compaction_stats(self) -> dict[str, int] | None:
+        """Estimated upstream vs. digest tokens handed to the manager."""
+        output = self.digest_task.output if self.digest_task else None
+        if output is None or not output.json_dict:
+            return None
+        stages = output.json_dict.get("compaction", {}).values()
+        return {
+            "source_tokens": sum(s["source_tokens"] for s in stages),
+            "digest_tokens": sum(s["digest_tokens"] for s in stages),
+        }
+
+    def _scheduler(self) -> DagScheduler:
+        """Schedule the remaining stages, checkpointing each as it lands."""
+        try:
+            store = CheckpointStore.open(self.run_id)
+        except CheckpointError:
+            store = CheckpointStore.create(
+                self.request, self.concurrent, run_id=self.run_id
+            )
+        self._checkpoints = store
+
+        completed = {}
+        for task in self.tasks:
+            output = store.load(task.name)
+            if output is not None:
+                completed[task] = output
+                console.print(
+                    f"  [dim]↺ Restored {task.name} from checkpoint[/dim]"
+                )
+
+        return DagScheduler(
+            self.tasks,
+            max_workers=None if self.concurrent else 1,
+            runner=self.router,
+            async_runner=self.router.arun,
+            completed=completed,
+            on_complete=lambda task, output: store.save(task.name, output),
+            cache=StageCache() if self.reuse_stages else None,
+            stage_timeout=settings.stage_timeout,
+            # The fingerprint names the routed model, not the fallback's
+            should_cache=lambda task, output: task not in self.router.fallbacks,
+        )
+
+    def _streaming(self) -> contextlib.AbstractContextManager:
+        """Echo streamed tokens live while stages run, if enabled."""
+        if not self.stream:
+            return contextlib.nullcontext()
+        console.print(f"  [dim]Streaming live output to {self.live_path}[/dim]")
+        return StreamRecorder(self.tasks, self.live_path, console)
+
+    def _recording_tools(self) -> contextlib.AbstractContextManager:
+        """Capture research-tool results if they may be shared later."""
+        if self.research_store is None:
+            return contextlib.nullcontext()
+        research = [t for t in (self.research_task, self.competitor_task) if t]
+        self._tool_recorder = ToolResultRecorder(research)
+        return self._tool_recorder
+
+    def _release_research(self) -> None:
+        """Let a campaign waiting on our category research do it instead."""
+        if self.research_store is not None:
+            self.research_store.release(self.request.category)
+
+    def _share_research(self) -> None:
+        """Store research done from scratch for later campaigns to build on."""
+        if self.research_store is None or self.category_research is not None:
+            return  # no category, or our research is a product-specific delta
+        research = [t for t in (self.research_task, self.competitor_task) if t]
+        self.research_store.put(
+            CategoryResearch(
+                category=self.request.category,
+                product_name=self.request.product_name,
+                stages={t.name: t.output.raw for t in research},
+                tool_results=(
+                    self._tool_recorder.results if self._tool_recorder else []
+                ),
+            )
+        )
+        console.print(
+            f"  [dim]Stored '{self.request.category}' research for "
+            "later campaigns[/dim]"
+        )
+
+    def _report_reuse(self, scheduler: DagScheduler) -> None:
+        if scheduler.reused:
+            names = ", ".join(task.name for task in scheduler.reused)
+            console.print(
+                f"  [dim]↺ Reused unchanged stages: {names}[/dim]"
+            )
+
+    def _report_compaction(self) -> None:
+        stats = self.compaction_stats()
+        if stats:
+            saved = 1 - stats["digest_tokens"] / max(stats["source_tokens"], 1)
+            console.print(
+                f"  [dim]Manager context compacted: "
+                f"{stats['source_tokens']:,} → {stats['digest_tokens']:,} "
+                f"tokens (-{saved:.0%})[/dim]"
+            )
+
     def _build_brief(self, raw_output: str) -> CampaignBrief:
-        """Wrap raw crew output into a typed CampaignBrief."""
+        """Typed CampaignBrief from the stages' models and the manager's brief."""
+        summary = section(raw_output, "executive summary", "summary")
+        if not summary:
+            summary = next(
+                (
+                    block.strip()
+                    for block in raw_output.split("\n\n")
+                    if block.strip() and not block.lstrip().startswith("#")
+                ),
+                "",
+            )
         return CampaignBrief(
             client_name=self.request.product_name,
             campaign_name=f"{self.request.product_name} Campaign",
             objective=self.request.campaign_goals,
             target_audience=self.request.target_audience,
             request=self.request,
-            research=MarketResearch(
-                market_summary="See full Markdown brief for detailed research."
+            research=merge_models(
+                MarketResearch,
+                [
+                    stage_model(task.output, MarketResearch)
+                    for task in (self.research_task, self.competitor_task)
+                    if task is not None
+                ],
             ),
-            copy_package=CopyPackage(
-                campaign_tagline="See full Markdown brief for tagline.",
-                elevator_pitch="See full Markdown brief for pitch.",
+            copy_package=stage_model(self.copy_task.output, CopyPackage)
+            or CopyPackage(),
+            visuals=stage_model(self.art_task.output, VisualDirection)
+            or VisualDirection(),
+            executive_summary=summary,
+            implementation_timeline=list_items(
+                section(raw_output, "timeline", "implementation")
             ),
-            visuals=VisualDirection(
-                brand_visual_identity="See full Markdown brief for visuals."
+            success_metrics=list_items(
+                section(raw_output, "kpi", "metric")
             ),
-            executive_summary=raw_output[:3000],
+            risk_factors=list_items(section(raw_output, "risk")),
             final_recommendations=raw_output,
         )
 
-    def _save_outputs(self, brief: CampaignBrief, raw_output: str) -> None:
-        """Save the campaign brief as Markdown and JSON."""
+    def _reserve_output_base(self) -> Path:
+        """Pick a ``{slug}_{timestamp}`` base name no other run has taken."""
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         slug = self.request.product_name.lower().replace(" ", "_")[:30]
-        base = settings.output_dir / f"{slug}_{ts}"
+        with _output_lock:
+            base = settings.output_dir / f"{slug}_{ts}"
+            suffix = 1
+            while base.with_suffix(".md").exists():
+                suffix += 1
+                base = settings.output_dir / f"{slug}_{ts}_{suffix}"
+            base.with_suffix(".md").touch()
+        return base
+
+    def _save_outputs(self, brief: CampaignBrief, raw_output: str) -> None:
+        """Save the campaign brief as Markdown and JSON."""
+        base = self._reserve_output_base()
+        self.output_base = base
 
         # Save Markdown
         md_path = base.with_suffix(".md")
@@ -147,6 +520,18 @@ class CampaignCrew:
         )
         console.print(f"[green]✓ Saved JSON:[/green]     {json_path}")
 
+        # Save trace
+        if self.trace is not None:
+            trace_path = base.with_name(f"{base.name}_trace.json")
+            self.trace.save(trace_path)
+            console.print(f"[green]✓ Saved trace:[/green]    {trace_path}")
+
+    def _save_failed_trace(self) -> None:
+        """Keep the metrics of a failed run next to where outputs would go."""
+        path = settings.output_dir / f"{self.run_id}_trace.json"
+        self.trace.save(path)
+        console.print(f"[dim]Trace of the failed run saved to {path}[/dim]")
+
     def _format_markdown(
         self, brief: CampaignBrief, raw_output: str
     ) -> str:
@@ -169,6 +554,7 @@ class CampaignCrew:
 | **Budget** | {self.request.budget_range or "Not specified"} |
 | **Channels** | {channels} |
 | **Brand Voice** | {self.request.brand_voice.value} |
+| **Category** | {self.request.category or "Not specified"} |
 
 ---
 
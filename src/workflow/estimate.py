@@ -0,0 +1,423 @@
+"""
+Dry-run cost and latency estimates for campaign requests.
+
+    estimate = estimate_campaign(request)
+    print(estimate.cost_usd, estimate.wall_seconds)
+
+    batch = estimate_batch(requests, workers=4)
+
+Every task prompt is rendered by ``CampaignTaskFactory`` exactly as a
+real run would build it and sized at ~4 characters per token. Upstream
+outputs, the number of ReAct iterations and stage latency come from the
+``*_trace.json`` files of earlier runs when there are any, and from
+built-in defaults otherwise. Agents are described by their
+``AgentSpec`` rather than built, so no LLM client is created and nothing
+is sent anywhere; an estimate takes a few milliseconds.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from crewai import Task
+
+from src.agents import (
+    ART_DIRECTOR_AGENT_SPEC,
+    COPYWRITER_AGENT_SPEC,
+    MANAGER_AGENT_SPEC,
+    RESEARCH_AGENT_SPEC,
+    AgentSpec,
+)
+from src.agents.fake_llm import FAKE_PROVIDER
+from src.agents.rate_limiter import estimate_tokens
+from src.config import settings
+from src.models.campaign_models import CampaignRequest
+from src.tasks.campaign_tasks import (
+    DEFAULT_DIGEST_BUDGET,
+    CampaignTaskFactory,
+    ContextDigestTask,
+    CopyMergeTask,
+)
+from src.workflow.routing import model_for
+from src.workflow.tracing import estimate_cost
+
+# CrewAI's ReAct instructions and answer format, on top of the agent's
+# role / goal / backstory and tool schemas
+REACT_PROMPT_TOKENS = 450
+# Tokens a tool result adds to the conversation of the following call
+TOOL_RESULT_TOKENS = 400
+# A tool-calling step's own completion (thought + action JSON)
+TOOL_CALL_TOKENS = 80
+# Service time model used when a stage has no history
+CALL_LATENCY_SECONDS = 0.8
+TOKENS_PER_SECOND = 250.0
+# Only the most recent traces describe the current prompts
+MAX_TRACES = 50
+
+
+@dataclass(frozen=True)
+class StageProfile:
+    """Typical LLM behaviour of one stage."""
+
+    llm_calls: float
+    completion_tokens: float
+    seconds: float | None = None  # derived from the token count if unknown
+    samples: int = 0  # runs the profile was averaged over
+
+
+# Used for stages that have not run on this machine yet
+DEFAULT_PROFILES: dict[str, StageProfile] = {
+    "market_research": StageProfile(llm_calls=3, completion_tokens=1400),
+    "competitor_analysis": StageProfile(llm_calls=2, completion_tokens=900),
+    "copywriting": StageProfile(llm_calls=2, completion_tokens=1300),
+    "copywriting_core": StageProfile(llm_calls=2, completion_tokens=600),
+    "copywriting_channel": StageProfile(llm_calls=1, completion_tokens=250),
+    "visual_direction": StageProfile(llm_calls=3, completion_tokens=1100),
+    "campaign_strategy": StageProfile(llm_calls=1, completion_tokens=1600),
+}
+_FALLBACK_PROFILE = StageProfile(llm_calls=2, completion_tokens=800)
+
+# Which agent serves each stage (see ``CampaignCrew``)
+STAGE_AGENTS: dict[str, AgentSpec] = {
+    "market_research": RESEARCH_AGENT_SPEC,
+    "competitor_analysis": RESEARCH_AGENT_SPEC,
+    "copywriting": COPYWRITER_AGENT_SPEC,
+    "copywriting_core": COPYWRITER_AGENT_SPEC,
+    "copywriting_channel": COPYWRITER_AGENT_SPEC,
+    "visual_direction": ART_DIRECTOR_AGENT_SPEC,
+    "campaign_strategy": MANAGER_AGENT_SPEC,
+}
+
+
+@dataclass
+class StageEstimate:
+    """Projected usage of one stage."""
+
+    name: str
+    model: str
+    llm_calls: float
+    max_iter: int
+    prompt_tokens: int
+    completion_tokens: int
+    max_prompt_tokens: int
+    max_completion_tokens: int
+    seconds: float
+    cost_usd: float | None
+    max_cost_usd: float | None
+    source: str  # history | default | local
+
+
+@dataclass
+class CampaignEstimate:
+    """Projected tokens, cost and wall time of one campaign."""
+
+    product_name: str
+    concurrent: bool
+    stages: list[StageEstimate] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+    wall_seconds: float = 0.0  # critical path, or the rate-limit floor
+
+    @property
+    def llm_calls(self) -> float:
+        return sum(s.llm_calls for s in self.stages)
+
+    @property
+    def max_llm_calls(self) -> int:
+        return sum(s.max_iter for s in self.stages)
+
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(s.prompt_tokens for s in self.stages)
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(s.completion_tokens for s in self.stages)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def cost_usd(self) -> float | None:
+        return _sum_costs(s.cost_usd for s in self.stages)
+
+    @property
+    def max_cost_usd(self) -> float | None:
+        return _sum_costs(s.max_cost_usd for s in self.stages)
+
+    @property
+    def partial_cost_usd(self) -> float | None:
+        """Cost of the priced stages alone; only for display."""
+        return _sum_known(s.cost_usd for s in self.stages)
+
+    @property
+    def unpriced_stages(self) -> list[str]:
+        return [s.name for s in self.stages if s.cost_usd is None]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "product_name": self.product_name,
+            "concurrent": self.concurrent,
+            "llm_calls": round(self.llm_calls, 1),
+            "max_llm_calls": self.max_llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": self.cost_usd,
+            "max_cost_usd": self.max_cost_usd,
+            "unpriced_stages": self.unpriced_stages,
+            "critical_path_seconds": round(self.critical_path_seconds, 1),
+            "wall_seconds": round(self.wall_seconds, 1),
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+
+@dataclass
+class BatchEstimate:
+    """Projected totals for running many campaigns ``workers`` at a time."""
+
+    campaigns: list[CampaignEstimate]
+    workers: int
+    wall_seconds: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(c.total_tokens for c in self.campaigns)
+
+    @property
+    def cost_usd(self) -> float | None:
+        return _sum_costs(c.cost_usd for c in self.campaigns)
+
+    @property
+    def max_cost_usd(self) -> float | None:
+        return _sum_costs(c.max_cost_usd for c in self.campaigns)
+
+    @property
+    def partial_cost_usd(self) -> float | None:
+        """Cost of the priced stages alone; only for display."""
+        return _sum_known(c.partial_cost_usd for c in self.campaigns)
+
+
+def load_history(root: Path | None = None) -> dict[str, StageProfile]:
+    """Average per-stage behaviour over the most recent run traces."""
+    root = root or settings.output_dir
+    traces = sorted(
+        root.glob("*_trace.json"), key=lambda p: p.stat().st_mtime, reverse=True
+    )[:MAX_TRACES]
+    runs: dict[str, list[dict[str, Any]]] = {}
+    for path in traces:
+        try:
+            stages = json.loads(path.read_text(encoding="utf-8"))["stages"]
+        except (OSError, ValueError, KeyError):
+            continue  # a trace being written, or from an older format
+        for stage in stages:
+            # Reused, restored, local, re-run and offline (fake LLM) stages
+            # say nothing about the configured model
+            if (
+                stage.get("status") == "ran"
+                and stage.get("llm_calls")
+                and not stage.get("fallback")
+                and not stage.get("model", "").startswith(f"{FAKE_PROVIDER}/")
+            ):
+                runs.setdefault(profile_key(stage["name"]), []).append(stage)
+
+    return {
+        key: StageProfile(
+            llm_calls=_mean(s["llm_calls"] for s in stages),
+            completion_tokens=_mean(s["completion_tokens"] for s in stages),
+            seconds=_mean(
+                s["seconds"] - s.get("rate_limit_wait", 0.0) for s in stages
+            ),
+            samples=len(stages),
+        )
+        for key, stages in runs.items()
+    }
+
+
+def profile_key(stage_name: str) -> str:
+    """History key of a stage; every channel's copy shares one profile."""
+    if stage_name.startswith("copywriting_") and stage_name != "copywriting_core":
+        return "copywriting_channel"
+    return stage_name
+
+
+def estimate_campaign(
+    request: CampaignRequest,
+    concurrent: bool = True,
+    history: Mapping[str, StageProfile] | None = None,
+) -> CampaignEstimate:
+    """Project one campaign's tokens, cost and wall time without running it."""
+    if history is None:
+        history = load_history()
+    graph = CampaignTaskFactory(request).build_graph(
+        concurrent,
+        context_budgets=(
+            settings.context_budgets if settings.compact_context else None
+        ),
+    )
+    estimate = CampaignEstimate(request.product_name, concurrent)
+    outputs: dict[Task, int] = {}
+    finished: dict[Task, float] = {}
+    for task in graph.tasks:
+        stage = _estimate_stage(task, outputs, history)
+        estimate.stages.append(stage)
+        upstream = task.context if isinstance(task.context, list) else []
+        if concurrent:
+            start = max((finished[dep] for dep in upstream), default=0.0)
+        else:
+            start = max(finished.values(), default=0.0)
+        finished[task] = start + stage.seconds
+
+    estimate.critical_path_seconds = max(finished.values(), default=0.0)
+    estimate.wall_seconds = max(
+        estimate.critical_path_seconds,
+        _rate_limit_floor(estimate.total_tokens, estimate.llm_calls),
+    )
+    return estimate
+
+
+def estimate_batch(
+    requests: Sequence[CampaignRequest],
+    workers: int = 4,
+    concurrent: bool = True,
+) -> BatchEstimate:
+    """Project a batch, including the shared rate limits across campaigns."""
+    history = load_history()
+    campaigns = [estimate_campaign(r, concurrent, history) for r in requests]
+    workers = max(1, min(workers, len(campaigns) or 1))
+    longest = max((c.critical_path_seconds for c in campaigns), default=0.0)
+    busy = sum(c.critical_path_seconds for c in campaigns) / workers
+    floor = _rate_limit_floor(
+        sum(c.total_tokens for c in campaigns),
+        sum(c.llm_calls for c in campaigns),
+    )
+    return BatchEstimate(campaigns, workers, max(longest, busy, floor))
+
+
+# ── Private helpers ──────────────────────────────────────────────────
+
+
+def _estimate_stage(
+    task: Task,
+    outputs: dict[Task, int],
+    history: Mapping[str, StageProfile],
+) -> StageEstimate:
+    """Project ``task`` and record the size of the output it hands on."""
+    upstream = task.context if isinstance(task.context, list) else []
+    key = profile_key(task.name)
+    spec = STAGE_AGENTS.get(key, MANAGER_AGENT_SPEC)
+    model = f"groq/{model_for(spec.name, task.name)}"
+
+    if isinstance(task, (CopyMergeTask, ContextDigestTask)):
+        if isinstance(task, ContextDigestTask):
+            outputs[task] = sum(
+                min(outputs[dep], task.budgets.get(dep.name, DEFAULT_DIGEST_BUDGET))
+                for dep in upstream
+            )
+        else:
+            outputs[task] = sum(outputs[dep] for dep in upstream)
+        return StageEstimate(
+            name=task.name,
+            model=model,
+            llm_calls=0,
+            max_iter=0,
+            prompt_tokens=0,
+            completion_tokens=0,
+            max_prompt_tokens=0,
+            max_completion_tokens=0,
+            seconds=0.0,
+            cost_usd=0.0,
+            max_cost_usd=0.0,
+            source="local",
+        )
+
+    profile = history.get(key)
+    source = "history"
+    if profile is None:
+        profile = DEFAULT_PROFILES.get(key, _FALLBACK_PROFILE)
+        source = "default"
+
+    max_iter = spec.max_iter
+    calls = min(max(1.0, profile.llm_calls), float(max_iter))
+
+    # Every call resends the prompt plus the conversation so far
+    base = (
+        _agent_prompt_tokens(spec)
+        + estimate_tokens(task.prompt())
+        + sum(outputs[dep] for dep in upstream)
+    )
+    step = TOOL_CALL_TOKENS + (TOOL_RESULT_TOKENS if spec.tools else 0)
+
+    def prompt_for(n: float) -> int:
+        return int(n * base + step * n * (n - 1) / 2)
+
+    completion = int(profile.completion_tokens)
+    # The final answer is what downstream stages receive as context
+    outputs[task] = max(
+        int(completion - (calls - 1) * TOOL_CALL_TOKENS), completion // 2
+    )
+    # Worst case: the agent burns every iteration ``max_iter`` allows
+    prompt, max_prompt = prompt_for(calls), prompt_for(max_iter)
+    max_completion = int(completion + (max_iter - calls) * TOOL_CALL_TOKENS)
+    seconds = profile.seconds
+    if seconds is None:
+        seconds = calls * CALL_LATENCY_SECONDS + completion / TOKENS_PER_SECOND
+
+    return StageEstimate(
+        name=task.name,
+        model=model,
+        llm_calls=round(calls, 1),
+        max_iter=max_iter,
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        max_prompt_tokens=max_prompt,
+        max_completion_tokens=max_completion,
+        seconds=seconds,
+        cost_usd=estimate_cost(model, prompt, completion),
+        max_cost_usd=estimate_cost(model, max_prompt, max_completion),
+        source=source,
+    )
+
+
+def _agent_prompt_tokens(spec: AgentSpec) -> int:
+    """Role, goal, backstory and tool schemas of an agent's system prompt."""
+    text = " ".join((spec.role, spec.goal, spec.backstory))
+    for tool in _tool_descriptions(spec.tools):
+        text += f" {tool}"
+    return REACT_PROMPT_TOKENS + estimate_tokens(text)
+
+
+@lru_cache(maxsize=None)
+def _tool_descriptions(tools: tuple[type, ...]) -> tuple[str, ...]:
+    return tuple(f"{tool().name} {tool().description}" for tool in tools)
+
+
+def _rate_limit_floor(tokens: float, calls: float) -> float:
+    """Least wall time the shared RPM / TPM limits allow for the work."""
+    floors = [0.0]
+    if settings.groq_tpm > 0:
+        floors.append(tokens / settings.groq_tpm * 60)
+    if settings.groq_rpm > 0:
+        floors.append(calls / settings.groq_rpm * 60)
+    return max(floors)
+
+
+def _mean(values) -> float:
+    values = list(values)
+    return sum(values) / len(values)
+
+
+def _sum_costs(costs) -> float | None:
+    """Total cost, or ``None`` when any part of it has no known price."""
+    costs = list(costs)
+    if not costs or None in costs:
+        return None
+    return round(sum(costs), 6)
+
+
+def _sum_known(costs) -> float | None:
+    known = [c for c in costs if c is not None]
+    return round(sum(known), 6) if known else None
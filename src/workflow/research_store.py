@@ -0,0 +1,181 @@
+"""
+Category-level research shared across campaigns in the same market.
+
+Trend and competitor research for "air purifiers" is largely the same
+whichever air purifier is being launched. After a campaign with a
+``category`` finishes its research from scratch, the research outputs and
+the raw research-tool results are stored under the normalized category:
+
+    store = ResearchStore()
+    store.put(CategoryResearch(category="Air Purifiers", ...))
+    seed = store.get("air-purifier")   # same entry, if still fresh
+
+Later campaigns in that category seed their research prompts with the
+stored findings and tool results, and only research the product-specific
+delta.
+
+Campaigns of one category that start together (batch mode with several
+workers) would all miss the store. ``claim`` lets the first one research
+while the others wait for its ``put`` (or ``release`` if it fails):
+
+    seed = store.claim("air purifiers")   # None: we research, then put
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Sequence
+
+from crewai import Task
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.tool_usage_events import ToolUsageFinishedEvent
+
+from src.config import settings
+
+# Tools whose output is about the category rather than the product
+RESEARCH_TOOLS = ("trend_research", "competitor_analysis")
+
+
+def normalize_category(category: str) -> str:
+    """Canonical store key: 'Air-Purifiers ' and 'air purifier' match."""
+    words = re.sub(r"[^a-z0-9]+", " ", category.lower()).split()
+    singular = [
+        w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w
+        for w in words
+    ]
+    return "_".join(singular)
+
+
+@dataclass
+class CategoryResearch:
+    """Research gathered for one category, and where it came from."""
+
+    category: str
+    product_name: str
+    stages: dict[str, str] = field(default_factory=dict)
+    tool_results: list[dict[str, Any]] = field(default_factory=list)
+    saved_at: str = field(
+        default_factory=lambda: datetime.now().isoformat(timespec="seconds")
+    )
+
+    @property
+    def age(self) -> timedelta:
+        return datetime.now() - datetime.fromisoformat(self.saved_at)
+
+
+class ResearchStore:
+    """One JSON file per normalized category, honoured while fresh."""
+
+    def __init__(
+        self, root: Path | None = None, max_age: timedelta | None = None
+    ) -> None:
+        self.root = root or settings.research_store_dir
+        self.max_age = max_age or timedelta(days=settings.research_max_age_days)
+        self._claims: set[str] = set()
+
+    def get(self, category: str) -> CategoryResearch | None:
+        """Stored research for ``category``, unless missing or stale."""
+        path = self._path(category)
+        if not path.is_file():
+            return None
+        entry = CategoryResearch(**json.loads(path.read_text(encoding="utf-8")))
+        if entry.age > self.max_age:
+            return None
+        return entry
+
+    def claim(
+        self, category: str, timeout: float | None = None
+    ) -> CategoryResearch | None:
+        """Stored research, waiting for a campaign already researching it.
+
+        ``None`` makes the caller the category's writer: it must ``put``
+        its research or ``release`` the claim. Waiters give up after
+        ``timeout`` seconds (default ``STAGE_TIMEOUT``) and research too.
+        """
+        key = self._writer_key(category)
+        timeout = settings.stage_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        while True:
+            entry = self.get(category)
+            if entry is not None:
+                return entry
+            with _writers_lock:
+                writer = _writers.get(key)
+                if writer is None:
+                    _writers[key] = threading.Event()
+                    self._claims.add(key)
+                    return None
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            # Re-check once the writer stores (or gives up on) its research
+            writer.wait(remaining)
+
+    def release(self, category: str) -> None:
+        """Give up this store's ``claim``, letting one waiter research."""
+        key = self._writer_key(category)
+        with _writers_lock:
+            if key not in self._claims:
+                return
+            self._claims.discard(key)
+            writer = _writers.pop(key)
+        writer.set()
+
+    def put(self, entry: CategoryResearch) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(entry.category)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(entry), indent=2), encoding="utf-8")
+        tmp.replace(path)
+        self.release(entry.category)
+
+    def _path(self, category: str) -> Path:
+        return self.root / f"{normalize_category(category)}.json"
+
+    def _writer_key(self, category: str) -> str:
+        return str(self._path(category))
+
+
+# Categories being researched in this process → set once the writer is done
+_writers: dict[str, threading.Event] = {}
+_writers_lock = threading.Lock()
+
+
+class ToolResultRecorder:
+    """Collect research-tool outputs emitted by a set of tasks."""
+
+    def __init__(
+        self, tasks: Sequence[Task], tool_names: Sequence[str] = RESEARCH_TOOLS
+    ) -> None:
+        self.results: list[dict[str, Any]] = []
+        self._task_ids = {str(task.id) for task in tasks}
+        self._tool_names = set(tool_names)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> ToolResultRecorder:
+        crewai_event_bus.register_handler(ToolUsageFinishedEvent, self._on_tool)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        crewai_event_bus.flush()
+        crewai_event_bus.off(ToolUsageFinishedEvent, self._on_tool)
+
+    def _on_tool(self, source, event: ToolUsageFinishedEvent) -> None:
+        if event.task_id not in self._task_ids or event.from_cache:
+            return
+        if event.tool_name not in self._tool_names:
+            return
+        with self._lock:
+            self.results.append(
+                {
+                    "tool": event.tool_name,
+                    "args": event.tool_args,
+                    "output": str(event.output),
+                }
+            )
@@ -0,0 +1,162 @@
+"""
+Per-agent and per-task model routing, with a fallback to a bigger model.
+
+Every agent runs on ``GROQ_MODEL`` unless routed elsewhere.
+``AGENT_MODELS`` moves a whole agent and ``TASK_MODELS`` single stages
+(``fnmatch`` patterns, checked first), so tool-calling and extraction
+stages can run on a small fast model while the manager keeps the big one:
+
+    AGENT_MODELS=researcher=llama-3.1-8b-instant,art_director=llama-3.1-8b-instant
+    TASK_MODELS=copywriting_*=llama-3.1-8b-instant
+
+``FallbackRunner`` wraps the scheduler's default runners. A stage that
+fails, or whose answer ``weak_output`` rejects (too short, not valid JSON
+for its model, ...), is run once more on
+``FALLBACK_MODEL`` (``GROQ_MODEL`` unless set), unless it already ran
+on that model. The reason is kept in ``fallbacks``; the run trace
+records which model served each stage.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import re
+from fnmatch import fnmatchcase
+from typing import Iterator
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+from rich.console import Console
+
+from src.agents.base_agent import get_llm, llm_model
+from src.config import settings
+from src.tasks.campaign_tasks import (
+    ContextDigestTask,
+    CopyMergeTask,
+    TaskType,
+    parse_channel_copy,
+)
+from src.tasks.structured import StructuredTask
+from src.workflow import scheduler
+
+console = Console()
+
+# A tool call the model wrote into its answer instead of making it
+_LEAKED_TOOL_CALL = re.compile(
+    r"<function=|^\s*Action(?: Input)?:", re.IGNORECASE | re.MULTILINE
+)
+_CHANNEL_PREFIX = f"{TaskType.COPYWRITING.value}_"
+
+
+def model_for(agent: str, task: str | None = None) -> str:
+    """Model for ``agent`` on ``task``: task route, agent route, default."""
+    if task:
+        for pattern, model in settings.task_models.items():
+            if fnmatchcase(task, pattern):
+                return model
+    return settings.agent_models.get(agent) or settings.groq_model
+
+
+def fallback_model() -> str | None:
+    """Model weak stages are re-run on, or ``None`` when disabled."""
+    model = settings.fallback_model
+    if model.lower() == "off":
+        return None
+    return model or settings.groq_model
+
+
+def weak_output(task: Task, output: TaskOutput) -> str | None:
+    """Why ``output`` is not good enough to keep, or ``None`` if it is."""
+    raw = (output.raw or "").strip()
+    if not raw:
+        return "empty answer"
+    if _LEAKED_TOOL_CALL.search(raw):
+        return "tool call left in the answer"
+    if len(raw) < settings.fallback_min_chars:
+        return f"short answer ({len(raw)} chars)"
+    if isinstance(task, StructuredTask) and not output.json_dict:
+        return f"answer is not {task.output_schema.__name__} JSON"
+    name = task.name or ""
+    if name.startswith(_CHANNEL_PREFIX) and name != f"{_CHANNEL_PREFIX}core":
+        fields = output.json_dict or parse_channel_copy(raw)
+        if not fields.get("headline"):
+            return "channel copy without a headline"
+    return None
+
+
+class FallbackRunner:
+    """Scheduler runner that retries failed or weak stages on a bigger model.
+
+        router = FallbackRunner()
+        DagScheduler(tasks, runner=router, async_runner=router.arun)
+
+    The scheduler module's runners are looked up on every call, so
+    patching ``src.workflow.scheduler._execute_task`` still applies.
+    """
+
+    def __init__(self) -> None:
+        # Why each stage was re-run on the fallback model
+        self.fallbacks: dict[Task, str] = {}
+
+    def __call__(self, task: Task, context: str) -> TaskOutput:
+        model = self._fallback_for(task)
+        if model is None:
+            return scheduler._execute_task(task, context)
+        try:
+            output = scheduler._execute_task(task, context)
+        except Exception as exc:
+            reason = f"failed with {type(exc).__name__}"
+        else:
+            reason = weak_output(task, output)
+            if reason is None:
+                return output
+        with self._on_fallback(task, model, reason):
+            return scheduler._execute_task(task, context)
+
+    async def arun(self, task: Task, context: str) -> TaskOutput:
+        """Async twin of calling the runner."""
+        model = self._fallback_for(task)
+        if model is None:
+            return await scheduler._aexecute_task(task, context)
+        try:
+            output = await scheduler._aexecute_task(task, context)
+        except Exception as exc:
+            reason = f"failed with {type(exc).__name__}"
+        else:
+            reason = weak_output(task, output)
+            if reason is None:
+                return output
+        with self._on_fallback(task, model, reason):
+            return await scheduler._aexecute_task(task, context)
+
+    # ── Private helpers ──────────────────────────────────────────────
+
+    def _fallback_for(self, task: Task) -> str | None:
+        """Fallback model for ``task``, if it makes LLM calls on another."""
+        if isinstance(task, (CopyMergeTask, ContextDigestTask)):
+            return None  # local steps, no model involved
+        model = fallback_model()
+        llm = getattr(task.agent, "llm", None)
+        if model is None or llm is None:
+            return None
+        if str(getattr(llm, "model", "")) == llm_model(model):
+            return None
+        return model
+
+    @contextlib.contextmanager
+    def _on_fallback(self, task: Task, model: str, reason: str) -> Iterator[None]:
+        """Put ``task``'s agent on ``model`` for one attempt, then restore it."""
+        agent = task.agent
+        original = agent.llm
+        self.fallbacks[task] = reason
+        console.print(
+            f"  [dim]↻ {task.name}: {reason} from {original.model}; "
+            f"retrying on {model}[/dim]"
+        )
+        llm = get_llm(model, temperature=original.temperature)
+        llm.stream = original.stream
+        agent.llm = llm
+        try:
+            yield
+        finally:
+            agent.llm = original
@@ -0,0 +1,297 @@
+"""
+DagScheduler — runs CrewAI tasks as soon as their inputs are ready.
+
+The dependency graph is read from each task's ``context`` list, so the
+wiring done by ``CampaignTaskFactory`` is the single source of truth:
+
+    scheduler = DagScheduler([research, competitors, copy, art, brief])
+    outputs = scheduler.run()
+
+Tasks whose context is fully available run concurrently on a thread
+pool (``run``) or as asyncio tasks on the caller's loop (``run_async``);
+everything else waits for its upstream outputs. With a ``StageCache``
+attached, a task whose fingerprint matches an earlier run is served from
+disk instead of calling its agent; ``should_cache`` can keep an output
+out of the cache (e.g. one produced by another model than the stage's).
+
+With ``stage_timeout`` set, a stage still running after that many seconds
+fails the run with ``StageTimeoutError`` instead of hanging it. A thread
+cannot be killed, so a timed-out sync stage is abandoned, not stopped;
+``abandoned`` lists the stages whose threads may still be using their
+agents.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Awaitable, Callable, Mapping, Sequence
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+from crewai.utilities.formatter import aggregate_raw_outputs_from_task_outputs
+
+if TYPE_CHECKING:
+    from src.workflow.stage_cache import StageCache
+
+TaskRunner = Callable[[Task, str], TaskOutput]
+AsyncTaskRunner = Callable[[Task, str], Awaitable[TaskOutput]]
+CompletionHook = Callable[[Task, TaskOutput], None]
+CachePolicy = Callable[[Task, TaskOutput], bool]
+
+
+# Longest the sync scheduler sleeps while a queued stage has no deadline yet
+_DEADLINE_POLL = 1.0
+
+
+class TaskGraphError(ValueError):
+    """Raised when the task context wiring is not a valid DAG."""
+
+
+class StageTimeoutError(TimeoutError):
+    """Raised when a stage runs past the scheduler's ``stage_timeout``."""
+
+    def __init__(self, task: Task, timeout: float) -> None:
+        self.task = task
+        self.timeout = timeout
+        super().__init__(
+            f"Stage '{task.name or task.description[:40]}' did not finish "
+            f"within its {timeout:g}s deadline."
+        )
+
+
+def _execute_task(task: Task, context: str) -> TaskOutput:
+    """Default runner — execute the task with its own agent."""
+    return task.execute_sync(agent=task.agent, context=context)
+
+
+async def _aexecute_task(task: Task, context: str) -> TaskOutput:
+    """Default async runner — CrewAI's native async task execution."""
+    return await task.aexecute_sync(agent=task.agent, context=context)
+
+
+class DagScheduler:
+    """Execute a task graph with maximal concurrency between stages."""
+
+    def __init__(
+        self,
+        tasks: Sequence[Task],
+        max_workers: int | None = None,
+        runner: TaskRunner | None = None,
+        async_runner: AsyncTaskRunner | None = None,
+        completed: Mapping[Task, TaskOutput] | None = None,
+        on_complete: CompletionHook | None = None,
+        cache: StageCache | None = None,
+        stage_timeout: float | None = None,
+        should_cache: CachePolicy | None = None,
+    ) -> None:
+        self.tasks = list(tasks)
+        self.max_workers = max_workers or max(1, len(self.tasks))
+        self._runner = runner or _execute_task
+        self._async_runner = async_runner or _aexecute_task
+        # Outputs restored from an earlier run are treated as already done
+        self._completed = dict(completed or {})
+        for task, output in self._completed.items():
+            task.output = output
+        self._on_complete = on_complete
+        self._cache = cache
+        self._should_cache = should_cache
+        self.stage_timeout = stage_timeout or None
+        self._contexts: dict[Task, str] = {}
+        # Tasks restored from checkpoints / matched in the stage cache
+        self.restored: list[Task] = list(self._completed)
+        self.reused: list[Task] = []
+        # Wall-clock seconds each executed task spent in its runner
+        self.timings: dict[Task, float] = {}
+        self._started: dict[Task, float] = {}
+        # Stages left running in their threads when ``run`` timed out
+        self.abandoned: list[Task] = []
+        self.dependencies = self._build_dependencies()
+        self.levels = self._build_levels()
+
+    def run(self) -> list[TaskOutput]:
+        """Run every task and return outputs in the original task order."""
+        outputs = dict(self._completed)
+        running: dict[Future[TaskOutput], Task] = {}
+        pending = [t for t in self.tasks if t not in outputs]
+
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="campaign-task",
+        )
+        abandon = False
+        try:
+            while pending or running:
+                for task in [t for t in pending if self._is_ready(t, outputs)]:
+                    pending.remove(task)
+                    context = self._context_for(task, outputs)
+                    if self._reuse(task, context, outputs):
+                        continue
+                    # Stage threads see the caller's context (rate-limit owner)
+                    ctx = contextvars.copy_context()
+                    running[pool.submit(ctx.run, self._timed, task, context)] = task
+
+                if not running:
+                    continue  # cache hits may have unblocked more tasks
+                done, _ = wait(
+                    running,
+                    timeout=self._next_deadline(running.values()),
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:
+                    self._check_deadlines(running.values())
+                for future in done:
+                    task = running.pop(future)
+                    outputs[task] = future.result()
+                    self._notify(task, outputs[task])
+        except StageTimeoutError:
+            abandon = True  # joining a hung stage would hang the run
+            self.abandoned = [
+                task for future, task in running.items() if not future.done()
+            ]
+            raise
+        finally:
+            pool.shutdown(wait=not abandon, cancel_futures=True)
+
+        return [outputs[task] for task in self.tasks]
+
+    async def run_async(self) -> list[TaskOutput]:
+        """Async twin of :meth:`run`; cancelling it cancels every stage."""
+        outputs = dict(self._completed)
+        running: dict[asyncio.Task[TaskOutput], Task] = {}
+        pending = [t for t in self.tasks if t not in outputs]
+        limit = asyncio.Semaphore(self.max_workers)
+
+        async def bounded(task: Task, context: str) -> TaskOutput:
+            async with limit:
+                start = time.perf_counter()
+                deadline = asyncio.timeout(self.stage_timeout)
+                try:
+                    async with deadline:
+                        return await self._async_runner(task, context)
+                except TimeoutError:
+                    if deadline.expired():
+                        raise StageTimeoutError(task, self.stage_timeout) from None
+                    raise
+                finally:
+                    self.timings[task] = time.perf_counter() - start
+
+        try:
+            while pending or running:
+                for task in [t for t in pending if self._is_ready(t, outputs)]:
+                    pending.remove(task)
+                    context = self._context_for(task, outputs)
+                    if self._reuse(task, context, outputs):
+                        continue
+                    running[asyncio.create_task(bounded(task, context))] = task
+
+                if not running:
+                    continue  # cache hits may have unblocked more tasks
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    task = running.pop(future)
+                    outputs[task] = future.result()
+                    self._notify(task, outputs[task])
+        finally:
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return [outputs[task] for task in self.tasks]
+
+    # ── Private helpers ──────────────────────────────────────────────
+
+    def _build_dependencies(self) -> dict[Task, list[Task]]:
+        known = set(self.tasks)
+        dependencies: dict[Task, list[Task]] = {}
+        for task in self.tasks:
+            upstream = task.context if isinstance(task.context, list) else []
+            for dep in upstream:
+                if dep not in known:
+                    raise TaskGraphError(
+                        f"Task '{task.name or task.description[:40]}' depends "
+                        "on a task that is not part of the schedule."
+                    )
+            dependencies[task] = list(upstream)
+        return dependencies
+
+    def _build_levels(self) -> list[list[Task]]:
+        """Group tasks into waves that can run side by side."""
+        levels: list[list[Task]] = []
+        placed: set[Task] = set()
+        remaining = list(self.tasks)
+        while remaining:
+            wave = [
+                t
+                for t in remaining
+                if all(dep in placed for dep in self.dependencies[t])
+            ]
+            if not wave:
+                raise TaskGraphError("Task context wiring contains a cycle.")
+            levels.append(wave)
+            placed.update(wave)
+            remaining = [t for t in remaining if t not in placed]
+        return levels
+
+    def _timed(self, task: Task, context: str) -> TaskOutput:
+        start = self._started[task] = time.perf_counter()
+        try:
+            return self._runner(task, context)
+        finally:
+            self.timings[task] = time.perf_counter() - start
+
+    def _next_deadline(self, tasks) -> float | None:
+        """Seconds until the earliest running stage's deadline, if any."""
+        if self.stage_timeout is None:
+            return None
+        now = time.perf_counter()
+        wait_for = _DEADLINE_POLL
+        for task in tasks:
+            start = self._started.get(task)
+            if start is not None:
+                wait_for = min(wait_for, start + self.stage_timeout - now)
+        return max(0.0, wait_for)
+
+    def _check_deadlines(self, tasks) -> None:
+        now = time.perf_counter()
+        for task in tasks:
+            start = self._started.get(task)
+            if start is not None and now - start >= self.stage_timeout:
+                self.timings[task] = now - start
+                raise StageTimeoutError(task, self.stage_timeout)
+
+    def _reuse(
+        self, task: Task, context: str, outputs: dict[Task, TaskOutput]
+    ) -> bool:
+        """Serve ``task`` from the stage cache when its inputs are unchanged."""
+        self._contexts[task] = context
+        cached = self._cache.get(task, context) if self._cache else None
+        if cached is None:
+            return False
+        outputs[task] = task.output = cached
+        self.reused.append(task)
+        if self._on_complete:
+            self._on_complete(task, cached)
+        return True
+
+    def _notify(self, task: Task, output: TaskOutput) -> None:
+        task.output = output
+        if self._cache and (
+            self._should_cache is None or self._should_cache(task, output)
+        ):
+            self._cache.put(task, self._contexts[task], output)
+        if self._on_complete:
+            self._on_complete(task, output)
+
+    def _is_ready(self, task: Task, outputs: dict[Task, TaskOutput]) -> bool:
+        return all(dep in outputs for dep in self.dependencies[task])
+
+    def _context_for(self, task: Task, outputs: dict[Task, TaskOutput]) -> str:
+        return aggregate_raw_outputs_from_task_outputs(
+            [outputs[dep] for dep in self.dependencies[task]]
+        )
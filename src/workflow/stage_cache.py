@@ -0,0 +1,102 @@
+"""
+Fingerprinted stage cache for incremental re-generation.
+
+A stage's fingerprint covers everything that can change its output:
+
+* the rendered task description and expected output — i.e. exactly the
+  ``CampaignRequest`` fields that stage's prompt uses,
+* the serving model and temperature,
+* a hash of its upstream context (the raw outputs it builds on).
+
+Flipping ``brand_voice`` therefore leaves market research untouched,
+while copywriting and everything downstream of it are recomputed.
+
+Entries expire after ``STAGE_CACHE_MAX_AGE_DAYS`` (research built on live
+searches goes stale like the searches themselves), and beyond
+``STAGE_CACHE_MAX_ENTRIES`` the oldest ones are evicted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+
+from src.config import settings
+from src.workflow.checkpoint import PERSISTED_OUTPUT_FIELDS
+
+# Bump when prompt plumbing changes in a way descriptions don't capture
+CACHE_VERSION = "2"
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def fingerprint(task: Task, context: str) -> str:
+    """Hash of every input that determines a stage's output."""
+    llm = getattr(task.agent, "llm", None)
+    parts = [
+        CACHE_VERSION,
+        task.name or "",
+        str(getattr(llm, "model", "")),
+        str(getattr(llm, "temperature", "")),
+        task.description,
+        task.expected_output,
+        _sha256(context),
+    ]
+    return _sha256("\x1f".join(parts))
+
+
+class StageCache:
+    """On-disk store of stage outputs keyed by input fingerprint."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_age: timedelta | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self.root = root or settings.stage_cache_dir
+        self.max_age = max_age or timedelta(days=settings.stage_cache_max_age_days)
+        self.max_entries = (
+            settings.stage_cache_max_entries if max_entries is None else max_entries
+        )
+
+    def get(self, task: Task, context: str) -> TaskOutput | None:
+        """Cached output for these inputs, unless missing or expired."""
+        path = self.root / f"{fingerprint(task, context)}.json"
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if age > self.max_age.total_seconds():
+            path.unlink(missing_ok=True)
+            return None
+        return TaskOutput.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def put(self, task: Task, context: str, output: TaskOutput) -> None:
+        """Store an output and evict the oldest entries past ``max_entries``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / f"{fingerprint(task, context)}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            output.model_dump_json(include=PERSISTED_OUTPUT_FIELDS), encoding="utf-8"
+        )
+        tmp.replace(path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue  # evicted by a concurrent run
+        entries.sort(reverse=True)
+        for _, path in entries[max(self.max_entries, 1):]:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,75 @@
+"""
+Live token streaming for campaign runs.
+
+While a ``StreamRecorder`` is active, every LLM token emitted by one of
+the crew's tasks is echoed to the console and appended to an in-progress
+Markdown file, so the first useful output shows up in seconds instead of
+after the final brief is saved:
+
+    with StreamRecorder(crew.tasks, path, console):
+        scheduler.run()
+
+Parallel stages interleave; each switch between tasks starts a new
+labelled section so the output stays readable.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Sequence
+
+from crewai import Task
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.llm_events import LLMCallType, LLMStreamChunkEvent
+from rich.console import Console
+
+
+class StreamRecorder:
+    """Forward streamed LLM chunks for a set of tasks to console and file."""
+
+    def __init__(
+        self,
+        tasks: Sequence[Task],
+        path: Path,
+        console: Console | None = None,
+    ) -> None:
+        self.path = path
+        self.console = console
+        self._task_ids = {str(task.id): task for task in tasks}
+        self._lock = threading.Lock()
+        self._current: str | None = None
+        self._file = None
+
+    def __enter__(self) -> StreamRecorder:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+        crewai_event_bus.register_handler(LLMStreamChunkEvent, self._on_chunk)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        crewai_event_bus.off(LLMStreamChunkEvent, self._on_chunk)
+        with self._lock:
+            self._file.close()
+            self._file = None
+
+    def _on_chunk(self, source, event: LLMStreamChunkEvent) -> None:
+        task = self._task_ids.get(event.task_id or "")
+        if task is None or event.call_type == LLMCallType.TOOL_CALL:
+            return  # another campaign's task, or a tool-call fragment
+
+        with self._lock:
+            if self._file is None:
+                return
+            label = task.name or task.description[:40]
+            if label != self._current:
+                self._current = label
+                self._file.write(f"\n\n## {label}\n\n")
+                if self.console:
+                    self.console.print(f"\n[bold magenta]▸ {label}[/bold magenta]")
+            self._file.write(event.chunk)
+            self._file.flush()
+            if self.console:
+                self.console.print(
+                    event.chunk, end="", markup=False, highlight=False
+                )
@@ -0,0 +1,268 @@
+"""
+Per-stage timing, token and cost tracing for campaign runs.
+
+While a ``RunTracer`` is active it listens on CrewAI's event bus for LLM
+and tool events emitted by the crew's tasks, and combines them with the
+scheduler's per-stage wall times once the run ends:
+
+    tracer = RunTracer(run_id, scheduler)
+    with tracer:
+        scheduler.run()
+    tracer.save(Path("output/aeroflow_trace.json"))
+
+Events carry the emitting task's id, so parallel stages are attributed
+correctly even when their LLM calls interleave. Each stage records the
+model that produced its final answer, and why it was re-run on the
+fallback model if it was (see ``src.workflow.routing``).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping
+
+from crewai import Task
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallFailedEvent,
+)
+from crewai.events.types.tool_usage_events import (
+    ToolUsageErrorEvent,
+    ToolUsageFinishedEvent,
+)
+
+from src.agents.fake_llm import FAKE_PROVIDER
+from src.agents.rate_limiter import rate_limiter
+
+if TYPE_CHECKING:
+    from src.workflow.scheduler import DagScheduler
+
+# USD per million (input, output) tokens on Groq's on-demand tier
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "gemma2-9b-it": (0.20, 0.20),
+    "mixtral-8x7b-32768": (0.24, 0.24),
+}
+
+
+def estimate_cost(
+    model: str, prompt_tokens: int, completion_tokens: int
+) -> float | None:
+    """Dollar cost of a call, or ``None`` for a model with no known price."""
+    provider, _, name = model.rpartition("/")
+    if provider == FAKE_PROVIDER:
+        return None  # offline runs cost nothing
+    prices = MODEL_PRICES.get(name)
+    if prices is None:
+        return None
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1e6
+
+
+@dataclass
+class StageTrace:
+    """Metrics for one stage of a campaign run."""
+
+    name: str
+    agent: str
+    model: str  # served the final answer
+    status: str  # ran | reused | restored | failed | skipped
+    seconds: float = 0.0
+    rate_limit_wait: float = 0.0  # part of ``seconds`` spent queued
+    llm_calls: int = 0
+    max_iter: int | None = None
+    failed_calls: int = 0
+    tool_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float | None = None
+    fallback: str | None = None  # why the stage was re-run on another model
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+class RunTracer:
+    """Collect LLM/tool metrics for the tasks of one scheduler."""
+
+    def __init__(
+        self,
+        run_id: str,
+        scheduler: DagScheduler,
+        fallbacks: Mapping[Task, str] | None = None,
+    ) -> None:
+        self.run_id = run_id
+        self.scheduler = scheduler
+        self.fallbacks = fallbacks if fallbacks is not None else {}
+        self.wall_seconds = 0.0
+        self._task_ids = {str(task.id): task for task in scheduler.tasks}
+        # Tool events are not always tagged with a task; fall back to agent
+        self._agent_ids: dict[str, Task] = {}
+        for task in scheduler.tasks:
+            if task.agent is not None:
+                self._agent_ids.setdefault(str(task.agent.id), task)
+        self._counters: dict[Task, dict[str, int]] = {
+            task: dict.fromkeys(
+                (
+                    "llm_calls",
+                    "failed_calls",
+                    "tool_calls",
+                    "prompt_tokens",
+                    "completion_tokens",
+                ),
+                0,
+            )
+            for task in scheduler.tasks
+        }
+        # (prompt, completion) tokens per model, in order of first use
+        self._model_tokens: dict[Task, dict[str, list[int]]] = {
+            task: {} for task in scheduler.tasks
+        }
+        self._lock = threading.Lock()
+        self._start = 0.0
+        # Rate-limit waits per task id, moved out of the limiter on exit
+        self._rate_waits: dict[str, float] | None = None
+        self._handlers = (
+            (LLMCallCompletedEvent, self._on_llm_completed),
+            (LLMCallFailedEvent, self._on_llm_failed),
+            (ToolUsageFinishedEvent, self._on_tool_used),
+            (ToolUsageErrorEvent, self._on_tool_used),
+        )
+
+    def __enter__(self) -> RunTracer:
+        for event_type, handler in self._handlers:
+            crewai_event_bus.register_handler(event_type, handler)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.wall_seconds = time.perf_counter() - self._start
+        # Non-streaming handlers run on the bus's pool; drain them first
+        crewai_event_bus.flush()
+        for event_type, handler in self._handlers:
+            crewai_event_bus.off(event_type, handler)
+        # The limiter would otherwise keep every task's total for good
+        self._rate_waits = {key: rate_limiter.wait_for(key) for key in self._task_ids}
+        rate_limiter.forget(self._task_ids)
+
+    @property
+    def stages(self) -> list[StageTrace]:
+        """One entry per task, in schedule order."""
+        return [self._stage(task) for task in self.scheduler.tasks]
+
+    def to_dict(self) -> dict[str, Any]:
+        stages = self.stages
+        costs = [s.cost_usd for s in stages if s.cost_usd is not None]
+        return {
+            "run_id": self.run_id,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "totals": {
+                "llm_calls": sum(s.llm_calls for s in stages),
+                "rate_limit_wait": round(
+                    sum(s.rate_limit_wait for s in stages), 3
+                ),
+                "tool_calls": sum(s.tool_calls for s in stages),
+                "prompt_tokens": sum(s.prompt_tokens for s in stages),
+                "completion_tokens": sum(s.completion_tokens for s in stages),
+                "cost_usd": round(sum(costs), 6) if costs else None,
+            },
+            "stages": [
+                {
+                    **asdict(s),
+                    "seconds": round(s.seconds, 3),
+                    "rate_limit_wait": round(s.rate_limit_wait, 3),
+                }
+                for s in stages
+            ],
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the trace as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    # ── Private helpers ──────────────────────────────────────────────
+
+    def _stage(self, task: Task) -> StageTrace:
+        scheduler = self.scheduler
+        if task in scheduler.restored:
+            status = "restored"
+        elif task in scheduler.reused:
+            status = "reused"
+        elif task in scheduler.timings:
+            status = "ran" if task.output is not None else "failed"
+        else:
+            status = "skipped"
+
+        with self._lock:
+            counters = dict(self._counters[task])
+            by_model = {m: tuple(t) for m, t in self._model_tokens[task].items()}
+        if by_model:
+            model = list(by_model)[-1]
+            costs = [estimate_cost(m, *tokens) for m, tokens in by_model.items()]
+            cost = None if None in costs else sum(costs)
+        else:
+            model = str(getattr(getattr(task.agent, "llm", None), "model", ""))
+            cost = estimate_cost(model, 0, 0)
+        return StageTrace(
+            name=task.name or task.description[:40],
+            agent=getattr(task.agent, "role", ""),
+            model=model,
+            status=status,
+            seconds=scheduler.timings.get(task, 0.0),
+            rate_limit_wait=self._rate_wait(str(task.id)),
+            max_iter=getattr(task.agent, "max_iter", None),
+            cost_usd=cost,
+            fallback=self.fallbacks.get(task),
+            **counters,
+        )
+
+    def _rate_wait(self, task_id: str) -> float:
+        if self._rate_waits is not None:
+            return self._rate_waits[task_id]
+        return rate_limiter.wait_for(task_id)
+
+    def _task_for(self, event: Any) -> Task | None:
+        task = self._task_ids.get(event.task_id or "")
+        if task is None and event.agent_id:
+            task = self._agent_ids.get(event.agent_id)
+        return task
+
+    def _bump(self, event: Any, model: str | None = None, **deltas: int) -> None:
+        task = self._task_for(event)
+        if task is None:
+            return  # another campaign's task
+        with self._lock:
+            counters = self._counters[task]
+            for key, delta in deltas.items():
+                counters[key] += delta
+            if model:
+                tokens = self._model_tokens[task].setdefault(model, [0, 0])
+                tokens[0] += deltas.get("prompt_tokens", 0)
+                tokens[1] += deltas.get("completion_tokens", 0)
+
+    def _on_llm_completed(self, source, event: LLMCallCompletedEvent) -> None:
+        usage = event.usage or {}
+        self._bump(
+            event,
+            model=event.model,
+            llm_calls=1,
+            prompt_tokens=int(
+                usage.get("prompt_tokens") or usage.get("input_tokens") or 0
+            ),
+            completion_tokens=int(
+                usage.get("completion_tokens") or usage.get("output_tokens") or 0
+            ),
+        )
+
+    def _on_llm_failed(self, source, event: LLMCallFailedEvent) -> None:
+        self._bump(event, llm_calls=1, failed_calls=1)
+
+    def _on_tool_used(self, source, event: Any) -> None:
+        self._bump(event, tool_calls=1)
@@ -1,5 +1,7 @@
 """Pytest configuration and shared fixtures"""
 
+from dataclasses import replace
+
 import pytest
 from src.agents import ResearchAgent, CopywriterAgent, ArtDirectorAgent, ManagerAgent
 from src.models import CampaignBrief, CampaignRequest, CampaignChannel, CopyTone
@@ -62,3 +64,34 @@ def sample_request() -> CampaignRequest:
         brand_voice=CopyTone.PROFESSIONAL,
     )
 
+
+@pytest.fixture
+def isolated_settings(tmp_path, monkeypatch):
+    """Point every module's settings at a throwaway output directory"""
+    from src.config import get_settings
+
+    isolated = replace(get_settings(), output_dir=tmp_path / "output")
+    for module in (
+        "src.agents.llm_cache",
+        "src.workflow.checkpoint",
+        "src.workflow.crew_workflow",
+        "src.workflow.estimate",
+        "src.workflow.research_store",
+        "src.workflow.routing",
+        "src.workflow.stage_cache",
+        "src.tools.search_cache",
+    ):
+        monkeypatch.setattr(f"{module}.settings", isolated)
+    return isolated
+
+
+@pytest.fixture
+def fake_llm(isolated_settings, monkeypatch):
+    """Build agents on the offline FakeLLM from a fresh agent pool"""
+    from src.agents import AgentPool
+
+    fake = replace(isolated_settings, llm_backend="fake")
+    for module in ("src.agents.base_agent", "src.agents.fake_llm"):
+        monkeypatch.setattr(f"{module}.settings", fake)
+    monkeypatch.setattr("src.workflow.crew_workflow.agent_pool", AgentPool())
+    return fake
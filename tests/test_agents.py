@@ -1,7 +1,29 @@
 """Tests for agent functionality"""
 
+import asyncio
+import json
+import threading
+import time
+from dataclasses import replace
+
 import pytest
+from crewai import Task
+from crewai.llm import LLM
 from src.agents import ResearchAgent, CopywriterAgent, ArtDirectorAgent, ManagerAgent
+from src.agents import AgentPool, create_copywriter_agent, create_research_agent
+from src.agents.base_agent import get_llm
+from src.agents.fake_llm import FakeLLM, FakeScriptError
+from src.agents.llm_cache import LLMCacheMiss, LLMResponseCache, cache_key
+from src.agents.pool import pool_key
+from src.agents.rate_limiter import RateLimiter, estimate_tokens
+from src.agents.resilience import (
+    LatencyTracker,
+    backoff_delay,
+    is_transient,
+    stats as resilience_stats,
+)
+from src.config import get_settings
+from src.models import MarketResearch
 
 
 class TestResearchAgent:
@@ -63,3 +85,482 @@ class TestManagerAgent:
         result = manager_agent.execute("test task")
         assert "Campaign managed" in result
 
+
+
+class TestAgentPool:
+    """Test the process-wide agent pool"""
+
+    def test_release_then_acquire_reuses_agent(self):
+        pool = AgentPool()
+        first = pool.acquire(create_research_agent)
+        pool.release(first)
+
+        assert pool.acquire(create_research_agent) is first
+        assert (pool.hits, pool.misses) == (1, 1)
+
+    def test_borrowed_agents_are_never_shared(self):
+        pool = AgentPool()
+        a = pool.acquire(create_research_agent)
+        b = pool.acquire(create_research_agent)
+        assert a is not b
+        assert pool.idle_count() == 0
+
+    def test_roles_are_pooled_separately(self):
+        pool = AgentPool()
+        pool.release(pool.acquire(create_research_agent))
+        copywriter = pool.acquire(create_copywriter_agent)
+        assert copywriter.role != "Senior Market Research Analyst"
+        assert pool_key(copywriter)[0] == copywriter.role
+
+    def test_release_clears_per_run_state(self):
+        pool = AgentPool()
+        agent = pool.acquire(create_research_agent)
+        agent.llm.stream = True
+        agent.tools_results = [{"tool": "trend"}]
+
+        pool.release(agent)
+
+        assert agent.llm.stream is False
+        assert agent.tools_results == []
+        assert agent.crew is None
+        assert agent.agent_executor is None
+
+    def test_warm_acquire_is_cheaper_than_building(self):
+        pool = AgentPool()
+        start = time.perf_counter()
+        agent = pool.acquire(create_research_agent)
+        cold = time.perf_counter() - start
+        pool.release(agent)
+
+        start = time.perf_counter()
+        pool.acquire(create_research_agent)
+        warm = time.perf_counter() - start
+
+        assert warm < cold
+
+
+class TestLLMResponseCache:
+    """Test the on-disk LLM response cache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        cache = LLMResponseCache(root=tmp_path / "llm_cache", mode="on")
+        monkeypatch.setattr("src.agents.llm_cache.response_cache", cache)
+        return cache
+
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        """Stand-in for the network call behind every CachedLLM."""
+        calls = []
+
+        def fake_call(self, messages, tools=None, *args, **kwargs):
+            calls.append(messages)
+            return f"reply #{len(calls)}"
+
+        monkeypatch.setattr(LLM, "call", fake_call)
+        return calls
+
+    def test_identical_call_is_served_from_disk(self, cache, provider):
+        llm = get_llm(temperature=0.3)
+        assert llm.call("Write a tagline") == "reply #1"
+        assert llm.call("Write a tagline") == "reply #1"
+
+        assert len(provider) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_key_covers_temperature_and_tools(self, cache, provider):
+        get_llm(temperature=0.3).call("Write a tagline")
+        get_llm(temperature=0.9).call("Write a tagline")
+        get_llm(temperature=0.3).call("Write a tagline", tools=[{"name": "x"}])
+        assert len(provider) == 3
+
+    def test_off_mode_bypasses_cache(self, cache, provider):
+        cache.mode = "off"
+        llm = get_llm()
+        llm.call("Write a tagline")
+        llm.call("Write a tagline")
+        assert len(provider) == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_replay_mode_fails_on_miss(self, cache, provider):
+        llm = get_llm()
+        llm.call("recorded")
+        cache.mode = "replay"
+
+        assert llm.call("recorded") == "reply #1"
+        with pytest.raises(LLMCacheMiss):
+            llm.call("never recorded")
+        assert len(provider) == 1
+
+    def test_tool_calls_round_trip(self, cache, monkeypatch):
+        tool_calls = [
+            {"id": "1", "type": "function",
+             "function": {"name": "trend_research", "arguments": "{}"}}
+        ]
+        monkeypatch.setattr(LLM, "call", lambda self, *a, **k: tool_calls)
+        get_llm().call("research")
+        monkeypatch.setattr(LLM, "call", lambda self, *a, **k: "fresh")
+        assert get_llm().call("research") == tool_calls
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        cache = LLMResponseCache(root=tmp_path, max_bytes=100, mode="on")
+        for key in ("a", "b", "c"):
+            cache.put(key, {"text": "x" * 20})
+        cache.get("a")
+        cache.put("d", {"text": "x" * 20})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["bytes"] <= 100
+
+    def test_cache_key_is_order_insensitive_for_dicts(self):
+        one = cache_key("m", 0.1, [{"role": "user", "content": "hi"}])
+        two = cache_key("m", 0.1, [{"content": "hi", "role": "user"}])
+        assert one == two
+        assert one != cache_key("m", 0.2, [{"role": "user", "content": "hi"}])
+
+
+class TestRateLimiter:
+    """Test the shared RPM/TPM limiter"""
+
+    def test_requests_beyond_rpm_wait_for_refill(self):
+        limiter = RateLimiter(rpm=2, tpm=0, window=0.5)
+        assert limiter.acquire() < 0.05
+        assert limiter.acquire() < 0.05
+        assert limiter.acquire() >= 0.2  # refills at 4 requests/s
+        assert limiter.stats()["throttled_calls"] == 1
+
+    def test_token_budget_and_settlement(self):
+        limiter = RateLimiter(rpm=0, tpm=100, window=0.5)
+        limiter.acquire(tokens=80)
+        limiter.settle(estimated=80, actual=10)  # refund unused estimate
+        start = time.perf_counter()
+        limiter.acquire(tokens=80)
+        assert time.perf_counter() - start < 0.1
+
+        assert limiter.acquire(tokens=80) >= 0.2
+
+    def test_unknown_usage_keeps_the_estimate_charged(self):
+        limiter = RateLimiter(rpm=0, tpm=100, window=0.5)
+        limiter.acquire(tokens=80)
+        limiter.settle(estimated=80, actual=0)  # provider reported no usage
+
+        assert limiter.acquire(tokens=80) >= 0.2
+
+    def test_forget_drops_wait_totals(self):
+        limiter = RateLimiter(rpm=1, tpm=0, window=0.1)
+        limiter.acquire(key="task-1")
+        limiter.acquire(key="task-1")
+        assert limiter.wait_for("task-1") > 0
+
+        limiter.forget(["task-1"])
+
+        assert limiter.wait_for("task-1") == 0.0
+        assert limiter._waits == {}
+
+    def test_disabled_limits_never_block(self):
+        limiter = RateLimiter(rpm=0, tpm=0)
+        assert all(limiter.acquire(tokens=10**6) == 0.0 for _ in range(100))
+
+    def test_owners_are_served_round_robin(self):
+        limiter = RateLimiter(rpm=1, tpm=0, window=0.2)
+        limiter.acquire()  # drain the bucket
+        granted = []
+
+        def call(owner: str) -> None:
+            limiter.acquire(owner=owner)
+            granted.append(owner)
+
+        threads = []
+        for owner in ("a1", "a2", "a3", "b1"):
+            thread = threading.Thread(target=call, args=(owner[0],))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.02)  # enqueue in this order
+        for thread in threads:
+            thread.join()
+
+        assert granted == ["a", "b", "a", "a"]
+
+    def test_llm_calls_go_through_limiter(self, monkeypatch):
+        limiter = RateLimiter(rpm=100, tpm=10_000)
+        monkeypatch.setattr("src.agents.rate_limiter.rate_limiter", limiter)
+        monkeypatch.setattr(LLM, "call", lambda self, *a, **k: "ok")
+
+        assert get_llm().call("Write a tagline") == "ok"
+        assert limiter.stats()["calls"] == 1
+
+    def test_estimate_tokens(self):
+        messages = [{"role": "user", "content": "x" * 400}]
+        assert estimate_tokens(messages) == 100
+        assert estimate_tokens("x" * 40) == 10
+
+
+class _ServiceUnavailable(Exception):
+    status_code = 503
+
+
+class TestResilience:
+    """Test retries and hedged requests around LLM calls"""
+
+    @pytest.fixture
+    def policy(self, monkeypatch):
+        def apply(**overrides):
+            values = dict(
+                llm_max_retries=2,
+                llm_backoff_base=0.001,
+                llm_backoff_max=0.001,
+                llm_hedge_percentile=0,
+            )
+            values.update(overrides)
+            monkeypatch.setattr(
+                "src.agents.resilience.settings",
+                replace(get_settings(), **values),
+            )
+
+        monkeypatch.setattr(
+            "src.agents.rate_limiter.rate_limiter", RateLimiter(rpm=0, tpm=0)
+        )
+        monkeypatch.setattr(
+            "src.agents.resilience.latency_tracker", LatencyTracker()
+        )
+        return apply
+
+    def test_transient_errors_are_retried(self, policy, monkeypatch):
+        policy()
+        attempts = []
+
+        def flaky(self, *args, **kwargs):
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise _ServiceUnavailable("503")
+            return "ok"
+
+        monkeypatch.setattr(LLM, "call", flaky)
+        before = resilience_stats["retries"]
+
+        assert get_llm().call("Write a tagline") == "ok"
+        assert len(attempts) == 3
+        assert resilience_stats["retries"] - before == 2
+
+    def test_retries_are_bounded(self, policy, monkeypatch):
+        policy(llm_max_retries=1)
+        attempts = []
+
+        def down(self, *args, **kwargs):
+            attempts.append(1)
+            raise TimeoutError("read timed out")
+
+        monkeypatch.setattr(LLM, "call", down)
+
+        with pytest.raises(TimeoutError):
+            get_llm().call("Write a tagline")
+        assert len(attempts) == 2
+
+    def test_permanent_errors_fail_immediately(self, policy, monkeypatch):
+        policy()
+        attempts = []
+
+        def bad_request(self, *args, **kwargs):
+            attempts.append(1)
+            raise ValueError("invalid model")
+
+        monkeypatch.setattr(LLM, "call", bad_request)
+
+        with pytest.raises(ValueError):
+            get_llm().call("Write a tagline")
+        assert len(attempts) == 1
+
+    def test_slow_call_is_hedged(self, policy, monkeypatch):
+        policy(llm_hedge_percentile=95)
+        llm = get_llm()
+        from src.agents import resilience
+
+        for _ in range(30):
+            resilience.latency_tracker.record(llm.model, 0.01)
+        calls = iter(["slow", "fast"])
+        lock = threading.Lock()
+
+        def answer(self, *args, **kwargs):
+            with lock:
+                which = next(calls)
+            if which == "slow":
+                time.sleep(1)
+            return which
+
+        monkeypatch.setattr(LLM, "call", answer)
+        before = resilience_stats["hedge_wins"]
+
+        start = time.perf_counter()
+        assert llm.call("Write a tagline") == "fast"
+        assert time.perf_counter() - start < 0.5
+        assert resilience_stats["hedge_wins"] - before == 1
+
+    def test_calls_that_run_tools_are_not_hedged(self, policy, monkeypatch):
+        policy(llm_hedge_percentile=95)
+        llm = get_llm()
+        from src.agents import resilience
+
+        for _ in range(30):
+            resilience.latency_tracker.record(llm.model, 0.01)
+        runs = []
+
+        def answer(self, *args, available_functions=None, **kwargs):
+            time.sleep(0.1)
+            runs.append(available_functions["search"]())
+            return "done"
+
+        monkeypatch.setattr(LLM, "call", answer)
+        before = resilience_stats["hedges"]
+
+        tools = {"search": lambda: "searched"}
+        assert llm.call("Write a tagline", available_functions=tools) == "done"
+        assert runs == ["searched"]
+        assert resilience_stats["hedges"] == before
+
+    @pytest.mark.asyncio
+    async def test_async_calls_are_retried(self, policy, monkeypatch):
+        policy()
+        attempts = []
+
+        async def flaky(self, *args, **kwargs):
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise ConnectionError("reset by peer")
+            return "ok"
+
+        monkeypatch.setattr(LLM, "acall", flaky)
+
+        assert await get_llm().acall("Write a tagline") == "ok"
+        assert len(attempts) == 2
+
+    def test_no_hedging_without_latency_history(self):
+        tracker = LatencyTracker()
+        for _ in range(5):
+            tracker.record("groq/m", 1.0)
+        assert tracker.percentile("groq/m", 95) is None
+
+    def test_hedge_percentile_must_be_below_100(self):
+        with pytest.raises(EnvironmentError):
+            replace(get_settings(), llm_hedge_percentile=100)
+        with pytest.raises(EnvironmentError):
+            replace(get_settings(), llm_hedge_percentile=-1)
+
+    def test_percentile_index_is_clamped(self):
+        tracker = LatencyTracker()
+        for ms in range(1, 101):
+            tracker.record("groq/m", ms / 1000)
+
+        assert tracker.percentile("groq/m", 0.95) < 0.01  # not the 99th
+        assert tracker.percentile("groq/m", 99.5) > 0.09
+        assert tracker.percentile("groq/m", 100) == tracker.percentile("groq/m", 99)
+
+    def test_backoff_delay_is_jittered_and_capped(self):
+        assert backoff_delay(3, 1.0, 30.0, rng=lambda lo, hi: hi) == 8.0
+        assert backoff_delay(10, 1.0, 30.0, rng=lambda lo, hi: hi) == 30.0
+        assert all(0 <= backoff_delay(2, 1.0, 30.0) <= 4.0 for _ in range(50))
+
+    def test_is_transient(self):
+        assert is_transient(_ServiceUnavailable())
+        assert is_transient(TimeoutError())
+        assert not is_transient(ValueError("bad request"))
+
+
+class TestFakeLLM:
+    """Test the offline, deterministic stand-in model"""
+
+    TOOLS = [
+        {"type": "function", "function": {"name": "trend_research"}},
+        {"type": "function", "function": {"name": "competitor_analysis"}},
+    ]
+
+    @staticmethod
+    def _task(name):
+        return Task(name=name, description=name, expected_output=name)
+
+    def test_get_llm_honours_backend(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.agents.base_agent.settings",
+            replace(get_settings(), llm_backend="fake"),
+        )
+        llm = get_llm(temperature=0.3)
+
+        assert isinstance(llm, FakeLLM)
+        assert llm.model == f"fake/{get_settings().groq_model}"
+        assert llm.temperature == 0.3
+
+    def test_calls_a_tool_first_then_answers(self):
+        llm = FakeLLM(model="fake/m")
+        prompt = [{"role": "user", "content": "Research for: **AeroFlow Pro**"}]
+        task = self._task("market_research")
+
+        first = llm.call(prompt, tools=self.TOOLS, from_task=task)
+        assert first[0]["function"]["name"] == "trend_research"
+        arguments = json.loads(first[0]["function"]["arguments"])
+        assert "AeroFlow Pro" in arguments["query"]
+
+        history = [*prompt, {"role": "assistant", "content": ""}]
+        answer = llm.call(history, tools=self.TOOLS, from_task=task)
+        research = MarketResearch.model_validate_json(answer)
+        assert "AeroFlow Pro" in research.market_summary
+        assert research.trends
+        assert llm.call(history, tools=self.TOOLS, from_task=task) == answer
+
+    def test_copy_stages_use_the_copy_evaluator(self):
+        llm = FakeLLM(model="fake/m")
+        tools = [{"type": "function", "function": {"name": "copy_evaluator"}}]
+
+        call = llm.call(
+            "Write copy for **AeroFlow Pro**",
+            tools=tools,
+            from_task=self._task("copywriting_email"),
+        )
+
+        arguments = json.loads(call[0]["function"]["arguments"])
+        assert arguments["channel"] == "email"
+        assert "CTA:" in arguments["copy_text"]
+
+    def test_script_overrides_templates(self):
+        llm = FakeLLM(
+            model="fake/m",
+            script={
+                "market_research": [
+                    {"tool": "competitor_analysis", "arguments": {"query": "air"}}
+                ],
+                "*": ["scripted"],
+            },
+        )
+        call = llm.call(
+            "hi", tools=self.TOOLS, from_task=self._task("market_research")
+        )
+
+        assert call[0]["function"]["name"] == "competitor_analysis"
+        assert llm.call("hi", from_task=self._task("visual_direction")) == "scripted"
+
+    def test_script_cannot_call_unknown_tools(self):
+        llm = FakeLLM(
+            model="fake/m", script={"*": [{"tool": "send_email"}]}
+        )
+        with pytest.raises(FakeScriptError):
+            llm.call("hi", tools=self.TOOLS)
+
+    def test_latency_and_usage(self):
+        llm = FakeLLM(model="fake/m", latency=0.05, tokens_per_second=0)
+
+        start = time.perf_counter()
+        llm.call("Write a tagline", from_task=self._task("copywriting_core"))
+
+        assert time.perf_counter() - start >= 0.05
+        usage = llm.get_token_usage_summary()
+        assert usage.prompt_tokens == estimate_tokens("Write a tagline")
+        assert usage.completion_tokens > 0
+
+    @pytest.mark.asyncio
+    async def test_async_calls_sleep_without_blocking(self):
+        llm = FakeLLM(model="fake/m", latency=0.2, tokens_per_second=0)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(llm.acall("hi") for _ in range(5)))
+
+        assert time.perf_counter() - start < 0.6
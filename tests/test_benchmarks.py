@@ -0,0 +1,61 @@
+"""Tests for the benchmark suite's runner and regression check"""
+
+import json
+
+from benchmarks.suite import (
+    BENCHMARKS,
+    compare,
+    large_brief,
+    measure,
+    run,
+)
+
+
+def _results(**medians):
+    return {"benchmarks": {name: {"median": m} for name, m in medians.items()}}
+
+
+class TestBenchmarkSuite:
+    """Test timing, result files and comparisons"""
+
+    def test_covers_tools_models_rendering_and_workflow(self):
+        assert {
+            "tools.copy_evaluator",
+            "tools.copy_evaluator_batch",
+            "tools.image_prompt_generator",
+            "tools.competitor_analysis",
+            "tools.trend_research_simulated",
+            "tools.search_cache_hit",
+            "models.brief_dump_json",
+            "render.format_markdown",
+            "workflow.crew_construction",
+            "workflow.full_run_offline",
+        } <= set(BENCHMARKS)
+
+    def test_measure_reports_seconds_per_call(self):
+        calls = []
+        stats = measure(lambda: calls.append(1), repeat=3, min_time=0.001)
+
+        assert stats["repeat"] == 3
+        assert 0 <= stats["min"] <= stats["median"]
+        # warm-up + calibration + the remaining samples
+        assert len(calls) >= 1 + stats["loops"] * 3
+
+    def test_run_selects_by_prefix_and_is_json(self):
+        results = run(["tools.image"], repeat=1, min_time=0)
+
+        assert list(results["benchmarks"]) == ["tools.image_prompt_generator"]
+        assert json.loads(json.dumps(results)) == results
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        rows = compare(
+            _results(a=1.0, b=1.0, c=1.0, gone=1.0),
+            _results(a=1.5, b=1.05, c=0.5, added=1.0),
+            threshold=0.15,
+        )
+
+        verdicts = {row["name"]: row["verdict"] for row in rows}
+        assert verdicts == {"a": "regression", "b": "ok", "c": "improvement"}
+
+    def test_large_brief_is_large(self):
+        assert len(large_brief().model_dump_json()) > 100_000
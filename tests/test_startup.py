@@ -0,0 +1,68 @@
+"""Tests for CLI start-up cost and side-effect-free configuration"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Generous ceiling; a warm import of the CLI takes ~0.2s without CrewAI
+CLI_IMPORT_BUDGET_US = 1_000_000
+HEAVY_PACKAGES = ("crewai", "litellm", "langchain")
+
+
+def _python(*args: str, env: dict[str, str] | None = None):
+    base = {k: v for k, v in os.environ.items() if k != "GROQ_API_KEY"}
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env={**base, **(env or {})},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def _import_times(stderr: str) -> dict[str, int]:
+    """Parse ``-X importtime`` output into {module: cumulative µs}."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup:
+    """Benchmark what ``python -m src.main`` pays before doing any work"""
+
+    def test_cli_import_skips_heavy_dependencies(self):
+        result = _python("-X", "importtime", "-c", "import src.main")
+        assert result.returncode == 0, result.stderr
+
+        times = _import_times(result.stderr)
+        heavy = [m for m in times if m.split(".")[0] in HEAVY_PACKAGES]
+        assert heavy == []
+        assert times["src.main"] < CLI_IMPORT_BUDGET_US
+
+    def test_batch_validation_does_not_import_crewai(self):
+        result = _python(
+            "-X", "importtime", "-c", "from src.workflow import load_requests"
+        )
+        assert result.returncode == 0, result.stderr
+        assert "crewai" not in _import_times(result.stderr)
+
+    def test_help_works_without_api_key(self):
+        result = _python("-m", "src.main", "--help")
+        assert result.returncode == 0, result.stderr
+        assert "--batch" in result.stdout
+
+    def test_importing_config_has_no_side_effects(self, tmp_path):
+        output_dir = tmp_path / "output"
+        result = _python(
+            "-c", "import src.config", env={"OUTPUT_DIR": str(output_dir)}
+        )
+        assert result.returncode == 0, result.stderr
+        assert not output_dir.exists()
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
+from dataclasses import replace
 
+import httpx
 import pytest
 
 from src.tools import (
@@ -12,6 +16,10 @@ from src.tools import (
     ImagePromptGeneratorTool,
     TrendResearchTool,
 )
+from src.tools.http import close_http_client, http_client
+from src.tools.lexicon import LexiconError, lexicon_matcher
+from src.tools.search_cache import SearchCache, search_key
+from src.tools.trend_research_tool import MAX_SEARCHES
 
 
 class TestTrendResearchTool:
@@ -35,6 +43,196 @@ class TestTrendResearchTool:
         assert len(data["consumer_insights"]) >= 1
 
 
+class TestMultiQueryTrendResearch:
+    @pytest.fixture
+    def serper(self, isolated_settings, monkeypatch):
+        """Live search against a handler; returns the queries it saw"""
+        monkeypatch.setattr(
+            "src.tools.trend_research_tool.settings",
+            replace(isolated_settings, serper_api_key="test-key"),
+        )
+        seen = []
+        # Every search must be in flight at once for all to get through
+        barrier = threading.Barrier(3, timeout=5)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            query = json.loads(request.content)["q"]
+            seen.append(query)
+            if "broken" in query:
+                return httpx.Response(500)
+            barrier.wait()
+            word = query.split()[0]
+            return httpx.Response(
+                200,
+                json={
+                    "organic": [
+                        {"title": f"{word} top", "link": f"https://{word}.test/"},
+                        {"title": "Shared", "link": "https://shared.test"},
+                    ]
+                },
+            )
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(
+            "src.tools.trend_research_tool.http_client", lambda: client
+        )
+        return seen
+
+    def test_queries_run_concurrently_and_merge_by_link(self, serper):
+        report = TrendResearchTool()._run(
+            query="purifiers", industry="home", queries=["filters", "sensors"]
+        )
+
+        assert len(serper) == 3
+        assert report.index("purifiers top") < report.index("Shared")
+        assert report.count("Shared") == 1  # same link from every search
+        assert "filters top" in report and "sensors top" in report
+        assert "purifiers; filters; sensors (home)" in report
+
+    def test_failed_searches_are_noted_next_to_the_rest(self, serper):
+        report = TrendResearchTool()._run(
+            query="purifiers", queries=["broken", "filters", "sensors"]
+        )
+
+        assert "purifiers top" in report
+        assert "Search for 'broken' (general) failed" in report
+
+    def test_searches_are_distinct_and_capped(self):
+        tool = TrendResearchTool()
+        queries = [f"q{i}" for i in range(10)]
+
+        report = json.loads(
+            tool._run(query="q0", queries=queries, industries=["home", "home"])
+        )
+
+        assert report["query"] == "; ".join(queries[: MAX_SEARCHES // 2])
+        assert report["industry"] == "general, home"
+
+
+class TestSharedHttpClient:
+    def teardown_method(self):
+        close_http_client()
+
+    def test_one_client_for_all_threads_until_closed(self):
+        clients = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(http_client()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(client) for client in clients}) == 1
+        close_http_client()
+        assert clients[0].is_closed
+        assert http_client() is not clients[0]
+
+    def test_live_search_reuses_the_shared_client(self, isolated_settings, monkeypatch):
+        seen = []
+
+        def serper(request: httpx.Request) -> httpx.Response:
+            seen.append(json.loads(request.content)["q"])
+            return httpx.Response(
+                200, json={"organic": [{"title": "Clean air is booming"}]}
+            )
+
+        client = httpx.Client(transport=httpx.MockTransport(serper))
+        monkeypatch.setattr(
+            "src.tools.trend_research_tool.http_client", lambda: client
+        )
+        tool = TrendResearchTool(search_url="https://serper.test/search")
+
+        first = tool._live_search("air purifiers", "home")
+        second = TrendResearchTool()._live_search("air filters", "home")
+
+        repeat = tool._live_search("Air Purifiers", "home")
+
+        assert "Clean air is booming" in first and "Clean air is booming" in second
+        assert "Clean air is booming" in repeat  # from the search cache
+        assert seen == ["air purifiers home trends 2025", "air filters home trends 2025"]
+
+
+class TestSearchCache:
+    def setup_method(self):
+        self.now = 1_000_000.0
+        self.calls = 0
+
+    def _cache(self, tmp_path, **kwargs) -> SearchCache:
+        kwargs = {"ttl": 100, "stale": 50, **kwargs}
+        return SearchCache(
+            tmp_path / "search.sqlite3", clock=lambda: self.now, **kwargs
+        )
+
+    def _load(self) -> dict:
+        self.calls += 1
+        return {"organic": [{"title": f"Result {self.calls}"}]}
+
+    def test_repeat_queries_are_served_locally(self, tmp_path):
+        cache = self._cache(tmp_path)
+
+        first = cache.fetch(search_key("Air  Purifiers", num=10), self._load)
+        again = cache.fetch(search_key("air purifiers", num=10), self._load)
+        other = cache.fetch(search_key("air purifiers", num=5), self._load)
+
+        assert first == again != other
+        assert self.calls == 2
+        assert cache.stats() == {
+            "hits": 1, "stale_hits": 0, "misses": 2, "hit_rate": 1 / 3, "entries": 2
+        }
+
+    def test_entries_survive_a_restart(self, tmp_path):
+        self._cache(tmp_path).fetch("k", self._load)
+
+        assert self._cache(tmp_path).fetch("k", self._load)["organic"][0] == {
+            "title": "Result 1"
+        }
+        assert self.calls == 1
+
+    def test_stale_entry_is_served_while_it_refreshes(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.fetch("k", self._load)
+        self.now += 120  # past the TTL, inside the stale window
+
+        stale = cache.fetch("k", self._load)
+        deadline = time.monotonic() + 5
+        while cache._refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert stale["organic"][0]["title"] == "Result 1"
+        assert cache.fetch("k", self._load)["organic"][0]["title"] == "Result 2"
+        assert cache.stale_hits == 1 and self.calls == 2
+
+    def test_expired_entry_is_fetched_again(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.fetch("k", self._load)
+        self.now += 200  # past TTL and stale window
+
+        assert cache.fetch("k", self._load)["organic"][0]["title"] == "Result 2"
+        assert cache.misses == 2
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = self._cache(tmp_path, max_entries=2)
+        for key in ("a", "b"):
+            cache.fetch(key, self._load)
+            self.now += 1
+        cache.fetch("a", self._load)  # "b" is now the oldest
+        self.now += 1
+        cache.fetch("c", self._load)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+    def test_zero_ttl_disables_the_cache(self, tmp_path):
+        cache = self._cache(tmp_path, ttl=0)
+        cache.fetch("k", self._load)
+        cache.fetch("k", self._load)
+
+        assert self.calls == 2
+        assert not (tmp_path / "search.sqlite3").exists()
+
+
 class TestCompetitorAnalysisTool:
     def setup_method(self):
         self.tool = CompetitorAnalysisTool()
@@ -79,6 +277,197 @@ class TestCopyEvaluationTool:
         assert "suggestions" in data
         assert isinstance(data["suggestions"], list)
 
+    def test_words_match_on_boundaries_only(self):
+        data = json.loads(self.tool._run("Everything, every day, nowhere else."))
+        assert data["metrics"]["weak_words_found"] == 0  # not "very" in "every"
+        assert data["metrics"]["power_words_found"] == 0  # not "now" in "nowhere"
+        assert data["scores"]["cta_strength"] == 0.5
+
+        data = json.loads(self.tool._run("Very nice. Sign\n up and save NOW."))
+        assert data["metrics"]["weak_words_found"] == 2
+        assert data["metrics"]["power_words_found"] == 2
+        assert data["scores"]["cta_strength"] == 1.0
+
+    def test_batch_matches_single_item_path(self):
+        fragments = [
+            "Breathe smarter with AeroFlow Pro.",
+            "Exclusive launch pricing — save 20% now!",
+            "It is very nice and maybe quite good",
+            "Sign up free. Try it. Buy it?",
+            "Pre-order today",
+            "every nowhere forget",
+            "",
+            "   padded copy   ",
+        ]
+        texts = [
+            " ".join(fragments[j % len(fragments)] for j in range(i % 5 + 1)) * (i % 7 + 1)
+            for i in range(120)
+        ]
+        channels = [
+            ("social_media", "search_ads", "email", "general", "other")[i % 5]
+            for i in range(len(texts))
+        ]
+
+        batch = self.tool.evaluate_batch(texts, channels)
+
+        assert batch == [
+            json.loads(self.tool._run(text, channel))
+            for text, channel in zip(texts, channels)
+        ]
+
+    def test_batch_without_numpy_gives_the_same_results(self, monkeypatch):
+        texts = ["Buy now, it is very nice!", "Exclusive. Proven. Free."]
+        expected = self.tool.evaluate_batch(texts, "email")
+        monkeypatch.setattr(
+            "src.tools.copy_evaluation_tool.importlib.util.find_spec",
+            lambda name: None,
+        )
+
+        assert self.tool.evaluate_batch(texts, "email") == expected
+
+    def test_batch_shares_a_single_channel(self):
+        batch = self.tool.evaluate_batch(["Buy now!", "Hello."], "search_ads")
+
+        assert [r["metrics"]["channel_char_limit"] for r in batch] == [90, 90]
+        with pytest.raises(ValueError):
+            self.tool.evaluate_batch(["a", "b"], ["email"])
+
+
+class TestCopyLexicon:
+    @staticmethod
+    def write(directory, **lists):
+        directory.mkdir(exist_ok=True)
+        for category, terms in lists.items():
+            (directory / f"{category}.txt").write_text(
+                "# test list\n" + "\n".join(terms) + "\n", encoding="utf-8"
+            )
+        return directory
+
+    def test_bundled_lexicon_is_the_default(self):
+        matcher = lexicon_matcher()
+
+        assert set(matcher.categories) >= {"weak", "power", "cta"}
+        assert lexicon_matcher() is matcher
+
+    def test_custom_lists_are_reported(self, tmp_path):
+        lexicon = self.write(
+            tmp_path / "brand",
+            weak=["kinda"],
+            power=["free"],
+            cta=["start now"],
+            banned=["guaranteed results", "cure"],
+        )
+        tool = CopyEvaluationTool(lexicon=str(lexicon))
+
+        data = json.loads(
+            tool._run("Guaranteed   results, kinda free. Start now!", "email")
+        )
+
+        assert data["lexicon"]["hits"] == {
+            "weak": ["kinda"],
+            "power": ["free"],
+            "cta": ["start now"],
+            "banned": ["guaranteed results"],
+        }
+        assert data["metrics"]["weak_words_found"] == 1
+        assert data["scores"]["cta_strength"] == 1.0
+        assert "Review banned terms: guaranteed results." in data["suggestions"]
+        assert tool.evaluate_batch(["Cure it. Start now!"])[0]["lexicon"]["hits"] == {
+            "cta": ["start now"],
+            "banned": ["cure"],
+        }
+
+    def test_setting_selects_the_lexicon(self, tmp_path, monkeypatch):
+        from src.config import get_settings
+
+        lexicon = self.write(tmp_path / "de", power=["kostenlos"])
+        monkeypatch.setattr(
+            "src.tools.copy_evaluation_tool.settings",
+            replace(get_settings(), copy_lexicon=str(lexicon)),
+        )
+
+        data = json.loads(CopyEvaluationTool()._run("Jetzt kostenlos testen"))
+
+        assert data["lexicon"]["hits"] == {"power": ["kostenlos"]}
+
+    def test_longest_term_wins(self, tmp_path):
+        lexicon = self.write(tmp_path / "lex", power=["free", "free trial", "save"])
+        matcher = lexicon_matcher(lexicon)
+
+        assert matcher.terms_in("Start a free trial") == {"free trial"}
+        assert matcher.terms_in("Free, and save. Saver? free trials") == {
+            "free",
+            "save",
+        }
+
+    def test_categories_match_independently(self, tmp_path):
+        lexicon = self.write(
+            tmp_path / "lex", banned=["free trial"], power=["free", "now"]
+        )
+        tool = CopyEvaluationTool(lexicon=str(lexicon))
+
+        data = json.loads(tool._run("Start your free trial today", "email"))
+
+        assert data["lexicon"]["hits"] == {
+            "banned": ["free trial"],
+            "power": ["free"],
+        }
+        assert data["metrics"]["power_words_found"] == 1
+        assert tool.evaluate_batch(["Start your free trial today"], "email") == [data]
+
+    def test_find_all_keeps_texts_apart(self, tmp_path):
+        lexicon = self.write(
+            tmp_path / "lex", banned=["free trial"], power=["free", "trial", "now"]
+        )
+        matcher = lexicon_matcher(lexicon)
+        # "İ" lowercases to two characters, shifting the later offsets
+        texts = ["İ now", "Try it free", "Trial now", "", "A FREE\ttrial"]
+
+        found = matcher.find_all(texts)
+
+        assert found == [matcher.find(text) for text in texts]
+        assert found[1] == {"power": ["free"]}  # not "free trial" across texts
+        assert found[2] == {"power": ["trial", "now"]}
+
+    def test_files_are_rechecked_after_an_interval(self, tmp_path, monkeypatch):
+        lexicon = self.write(tmp_path / "lex", weak=["meh"])
+        first = lexicon_matcher(lexicon)
+        self.write(lexicon, weak=["meh", "blah"])
+
+        assert lexicon_matcher(lexicon) is first  # within RECHECK_SECONDS
+
+        monkeypatch.setattr("src.tools.lexicon.RECHECK_SECONDS", 0)
+        assert lexicon_matcher(lexicon).find("blah") == {"weak": ["blah"]}
+
+    def test_matchers_are_cached_per_version(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.tools.lexicon.RECHECK_SECONDS", 0)
+        lexicon = self.write(tmp_path / "lex", weak=["meh"])
+        first = lexicon_matcher(lexicon)
+        copy = self.write(tmp_path / "copy", weak=["meh"])
+
+        assert lexicon_matcher(lexicon) is first
+        assert lexicon_matcher(copy) is first  # same contents, same version
+
+        self.write(lexicon, weak=["meh", "okay-ish"])
+        edited = lexicon_matcher(lexicon)
+
+        assert edited.version != first.version
+        assert edited.find("okay-ish, meh") == {"weak": ["meh", "okay-ish"]}
+
+    def test_large_lexicon(self, tmp_path):
+        banned = [f"claim{i} word{i % 97}" for i in range(5000)]
+        lexicon = self.write(tmp_path / "big", banned=banned, power=["free"])
+        matcher = lexicon_matcher(lexicon)
+
+        found = matcher.find("We say CLAIM4321 word53 and claim7 word7, free!")
+
+        # In lexicon order, not order of appearance
+        assert found == {"banned": ["claim7 word7", "claim4321 word53"], "power": ["free"]}
+
+    def test_missing_lexicon_raises(self, tmp_path):
+        with pytest.raises(LexiconError):
+            lexicon_matcher(tmp_path / "nowhere")
+
 
 class TestImagePromptGeneratorTool:
     def setup_method(self):
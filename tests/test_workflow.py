@@ -1,8 +1,80 @@
 """Tests for workflow orchestration"""
 
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+
 import pytest
-from src.workflow import CampaignCrew
-from src.models import CampaignRequest, CampaignChannel, CopyTone
+from crewai import Task
+from crewai.llm import LLM
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallType,
+    LLMStreamChunkEvent,
+)
+from crewai.events.types.tool_usage_events import ToolUsageFinishedEvent
+from crewai.tasks.task_output import TaskOutput
+
+from src.agents import AgentPool, create_research_agent
+from src.agents.rate_limiter import RateLimiter
+from src.config import DEFAULT_CONTEXT_BUDGETS, _context_budgets, _model_map
+from src.workflow import (
+    CampaignCrew,
+    DagScheduler,
+    StageTimeoutError,
+    TaskGraphError,
+    estimate_batch,
+    estimate_campaign,
+    load_requests,
+    run_batch,
+)
+from src.tasks.digest import (
+    key_points,
+    labelled_value,
+    list_items,
+    section,
+    select_points,
+)
+from src.tasks.structured import (
+    StructuredTask,
+    answer_format,
+    merge_models,
+    parse_answer,
+    stage_model,
+)
+from src.workflow.batch import BatchItem, percentile
+from src.workflow.checkpoint import CheckpointError, CheckpointStore
+from src.workflow.estimate import load_history
+from src.workflow.routing import FallbackRunner, model_for, weak_output
+from src.workflow.research_store import (
+    CategoryResearch,
+    ResearchStore,
+    ToolResultRecorder,
+    normalize_category,
+)
+from src.workflow.stage_cache import StageCache, fingerprint
+from src.workflow.streaming import StreamRecorder
+from src.workflow.tracing import RunTracer, estimate_cost
+from src.tasks.campaign_tasks import (
+    CampaignTaskFactory,
+    ContextDigestTask,
+    CopyMergeTask,
+    parse_channel_copy,
+)
+from src.models import (
+    CampaignRequest,
+    CampaignChannel,
+    ChannelCopy,
+    CopyPackage,
+    CopyTone,
+    MarketResearch,
+    VisualDirection,
+)
 
 
 class TestCampaignCrew:
@@ -59,3 +131,1407 @@ class TestCampaignCrew:
         assert crew.art_task is not None
         assert crew.manager_task is not None
 
+
+    def test_concurrent_crew_splits_research(self, sample_request):
+        """Trend and competitor research are independent upstream tasks"""
+        crew = CampaignCrew(sample_request)
+
+        assert crew.competitor_task is not None
+        assert crew.copy_core_task.context == [
+            crew.research_task,
+            crew.competitor_task,
+        ]
+        assert crew.digest_task.context[-2:] == [crew.copy_task, crew.art_task]
+        assert crew.manager_task.context == [crew.digest_task]
+
+    def test_concurrent_crew_fans_copy_out_per_channel(self, sample_request):
+        """Each channel gets its own copy sub-task and agent"""
+        crew = CampaignCrew(sample_request)
+
+        assert [t.name for t in crew.channel_copy_tasks] == [
+            f"copywriting_{c.value}" for c in sample_request.channels
+        ]
+        agents = {id(t.agent) for t in crew.channel_copy_tasks}
+        assert len(agents) == len(sample_request.channels)
+        assert crew.copy_task.context == [
+            crew.copy_core_task,
+            *crew.channel_copy_tasks,
+        ]
+        levels = DagScheduler(crew.tasks).levels
+        assert set(crew.channel_copy_tasks) <= set(levels[1])
+
+    def test_sequential_crew_keeps_single_research_task(self, sample_request):
+        """Sequential mode keeps the original pipeline, plus the digest"""
+        crew = CampaignCrew(sample_request, concurrent=False)
+
+        assert crew.competitor_task is None
+        assert [t.name for t in crew.tasks] == [
+            "market_research",
+            "copywriting",
+            "visual_direction",
+            "context_digest",
+            "campaign_strategy",
+        ]
+        assert crew.copy_task.context == [crew.research_task]
+
+
+def _task(name: str, context: list[Task] | None = None) -> Task:
+    kwargs = {"context": context} if context is not None else {}
+    return Task(name=name, description=name, expected_output="text", **kwargs)
+
+
+def _echo_runner(task: Task, context: str) -> TaskOutput:
+    return TaskOutput(
+        description=task.description,
+        name=task.name,
+        raw=f"{task.name}<{context}>",
+        agent="stub",
+    )
+
+
+class TestDagScheduler:
+    """Test dependency-driven task scheduling"""
+
+    def test_levels_group_independent_tasks(self):
+        trend, rivals = _task("trend"), _task("rivals")
+        copy = _task("copy", [trend, rivals])
+        brief = _task("brief", [trend, rivals, copy])
+
+        scheduler = DagScheduler([trend, rivals, copy, brief], runner=_echo_runner)
+
+        assert scheduler.levels == [[trend, rivals], [copy], [brief]]
+
+    def test_independent_tasks_run_concurrently(self):
+        trend, rivals = _task("trend"), _task("rivals")
+        barrier = threading.Barrier(2, timeout=5)
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            barrier.wait()  # deadlocks unless both tasks are in flight
+            return _echo_runner(task, context)
+
+        outputs = DagScheduler([trend, rivals], runner=runner).run()
+
+        assert [o.name for o in outputs] == ["trend", "rivals"]
+
+    def test_context_is_built_from_upstream_outputs(self):
+        trend, rivals = _task("trend"), _task("rivals")
+        copy = _task("copy", [trend, rivals])
+
+        outputs = DagScheduler([trend, rivals, copy], runner=_echo_runner).run()
+
+        assert "trend<>" in outputs[-1].raw
+        assert "rivals<>" in outputs[-1].raw
+
+    def test_rejects_dependency_outside_schedule(self):
+        orphan = _task("orphan")
+        with pytest.raises(TaskGraphError):
+            DagScheduler([_task("copy", [orphan])], runner=_echo_runner)
+
+    def test_failure_propagates(self):
+        def runner(task: Task, context: str) -> TaskOutput:
+            raise RuntimeError("rate limited")
+
+        with pytest.raises(RuntimeError, match="rate limited"):
+            DagScheduler([_task("trend")], runner=runner).run()
+
+    def test_stage_deadline_fails_fast(self):
+        release = threading.Event()
+        trend, rivals = _task("trend"), _task("rivals")
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            if task is trend:
+                release.wait(10)  # hangs past the deadline
+            return _echo_runner(task, context)
+
+        scheduler = DagScheduler([trend, rivals], runner=runner, stage_timeout=0.2)
+        start = time.perf_counter()
+        try:
+            with pytest.raises(StageTimeoutError, match="trend") as info:
+                scheduler.run()
+        finally:
+            release.set()
+
+        assert time.perf_counter() - start < 2
+        assert info.value.task is trend
+        assert scheduler.timings[trend] >= 0.2
+
+    def test_queued_stages_get_their_own_deadline(self):
+        def runner(task: Task, context: str) -> TaskOutput:
+            time.sleep(0.15)
+            return _echo_runner(task, context)
+
+        tasks = [_task("trend"), _task("rivals"), _task("copy")]
+        outputs = DagScheduler(
+            tasks, max_workers=1, runner=runner, stage_timeout=0.4
+        ).run()
+
+        assert [o.name for o in outputs] == ["trend", "rivals", "copy"]
+
+
+async def _async_echo_runner(task: Task, context: str) -> TaskOutput:
+    await asyncio.sleep(0)
+    return _echo_runner(task, context)
+
+
+class TestAsyncScheduling:
+    """Test the asyncio-native execution path"""
+
+    @pytest.mark.asyncio
+    async def test_run_async_overlaps_independent_tasks(self):
+        trend, rivals = _task("trend"), _task("rivals")
+        copy = _task("copy", [trend, rivals])
+        barrier = asyncio.Barrier(2)
+
+        async def runner(task: Task, context: str) -> TaskOutput:
+            if task is not copy:
+                await asyncio.wait_for(barrier.wait(), timeout=5)
+            return await _async_echo_runner(task, context)
+
+        outputs = await DagScheduler(
+            [trend, rivals, copy], async_runner=runner
+        ).run_async()
+
+        assert outputs[-1].raw.startswith("copy<trend<>")
+
+    @pytest.mark.asyncio
+    async def test_stage_deadline_cancels_the_stage(self):
+        cancelled = []
+
+        async def runner(task: Task, context: str) -> TaskOutput:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(task.name)
+                raise
+
+        scheduler = DagScheduler(
+            [_task("trend")], async_runner=runner, stage_timeout=0.1
+        )
+
+        with pytest.raises(StageTimeoutError, match="trend"):
+            await scheduler.run_async()
+        assert cancelled == ["trend"]
+
+    @pytest.mark.asyncio
+    async def test_runner_timeouts_are_not_stage_timeouts(self):
+        async def runner(task: Task, context: str) -> TaskOutput:
+            raise TimeoutError("provider timed out")
+
+        scheduler = DagScheduler(
+            [_task("trend")], async_runner=runner, stage_timeout=30
+        )
+
+        with pytest.raises(TimeoutError, match="provider") as info:
+            await scheduler.run_async()
+        assert not isinstance(info.value, StageTimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_cancellation_reaches_in_flight_stages(self):
+        started = asyncio.Event()
+        cancelled = []
+
+        async def runner(task: Task, context: str) -> TaskOutput:
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(task.name)
+                raise
+
+        tasks = [_task("trend"), _task("rivals")]
+        run = asyncio.create_task(
+            DagScheduler(tasks, async_runner=runner).run_async()
+        )
+        await started.wait()
+        run.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        assert sorted(cancelled) == ["rivals", "trend"]
+
+    @pytest.mark.asyncio
+    async def test_crew_run_async_builds_and_saves_brief(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        crew = CampaignCrew(sample_request)
+        saved = []
+
+        async def fake_run_async(scheduler):
+            return [_echo_runner(t, "") for t in scheduler.tasks]
+
+        monkeypatch.setattr(DagScheduler, "run_async", fake_run_async)
+        monkeypatch.setattr(
+            crew, "_save_outputs", lambda brief, raw: saved.append(raw)
+        )
+
+        brief = await crew.run_async()
+
+        assert brief.final_recommendations == "campaign_strategy<>"
+        assert saved == ["campaign_strategy<>"]
+
+
+class TestChannelCopyFanOut:
+    """Test the per-channel copy merge step"""
+
+    def test_parse_channel_copy_fields(self):
+        raw = (
+            "**Headline:** Breathe smarter\n"
+            "Sub-headline: Air that learns you\n"
+            "Body: Line one.\n"
+            "Line two.\n"
+            "- CTA: Pre-order now"
+        )
+        assert parse_channel_copy(raw) == {
+            "headline": "Breathe smarter",
+            "sub_headline": "Air that learns you",
+            "body": "Line one.\nLine two.",
+            "cta": "Pre-order now",
+        }
+
+    def test_parse_unlabelled_copy_keeps_body(self):
+        assert parse_channel_copy("  just prose  ") == {"body": "just prose"}
+
+    def test_merge_fills_channel_copy(self, isolated_settings, sample_request, monkeypatch):
+        crew = CampaignCrew(sample_request)
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            if isinstance(task, CopyMergeTask):
+                return task.execute_sync()
+            label = task.name.removeprefix("copywriting_")
+            return TaskOutput(
+                description=task.description,
+                name=task.name,
+                raw=f"Headline: {label} headline\nCTA: Buy",
+                agent="stub",
+            )
+
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", runner)
+        monkeypatch.setattr(crew, "_save_outputs", lambda brief, raw: None)
+        brief = crew.run()
+
+        channel_copy = brief.copy_package.channel_copy
+        assert set(channel_copy) == {c.value for c in sample_request.channels}
+        assert channel_copy["email"] == {"headline": "email headline", "cta": "Buy"}
+        # Downstream stages read the merged package as compact JSON
+        merged = CopyPackage.model_validate_json(crew.copy_task.output.raw)
+        assert merged.channel_copy == channel_copy
+
+
+def _done(name: str, raw: str, json_dict: dict | None = None) -> Task:
+    task = _task(name)
+    task.output = TaskOutput(
+        description=name, name=name, raw=raw, json_dict=json_dict, agent="stub"
+    )
+    return task
+
+
+_RESEARCH = "\n".join(
+    ["## Trends"]
+    + [f"- **Trend {i}:** Detail {i}. Supporting detail." for i in range(40)]
+    + ["## Personas", "- Busy parents who track air quality."]
+)
+
+
+class TestContextCompaction:
+    """Test the digest stage in front of the manager"""
+
+    def test_key_points_group_bullets_by_heading(self):
+        points = key_points(_RESEARCH)
+        assert list(points) == ["Trends", "Personas"]
+        assert points["Trends"][0] == "Trend 0: Detail 0."
+        assert key_points("First idea. More.\n\nSecond idea.") == {
+            "": ["First idea.", "Second idea."]
+        }
+
+    def test_labelled_value_reads_same_or_next_line(self):
+        assert labelled_value("**Tagline:** Breathe smarter", "tagline") == (
+            "Breathe smarter"
+        )
+        assert labelled_value('## Campaign Tagline\n\n"Air, upgraded"', "tagline") == (
+            "Air, upgraded"
+        )
+
+    def test_select_points_covers_every_section_first(self):
+        chosen = select_points(key_points(_RESEARCH), budget=20)
+        assert chosen["Personas"] == ["Busy parents who track air quality."]
+        assert len(chosen["Trends"]) < 40
+
+    def test_digest_respects_budgets_and_keeps_essentials(self):
+        research = _done("market_research", _RESEARCH)
+        copy = _done(
+            "copywriting",
+            "Tagline: Breathe smarter\nElevator pitch: It learns. It cleans.",
+            {"channel_copy": {"email": {"headline": "Clean air", "cta": "Buy"}}},
+        )
+        art = _done(
+            "visual_direction",
+            "## Palette\n- Soft blues\n## Key visual concepts\n- Morning light",
+        )
+        digest = ContextDigestTask(
+            name="context_digest",
+            description="digest",
+            expected_output="digest",
+            context=[research, copy, art],
+            budgets={"market_research": 60},
+            channels=["email"],
+        ).execute_sync()
+
+        stats = digest.json_dict["compaction"]
+        assert stats["market_research"]["digest_tokens"] <= 60
+        assert stats["market_research"]["source_tokens"] > 200
+        assert "Tagline: Breathe smarter" in digest.raw
+        assert "email — Headline: Clean air | CTA: Buy" in digest.raw
+        assert "Morning light" in digest.raw
+        assert "Soft blues" not in digest.raw
+
+    def test_sequential_copy_is_split_by_channel_heading(self):
+        copy = _done(
+            "copywriting",
+            "## Tagline\nAir, upgraded\n### Social Media\nHeadline: Hi\n"
+            "### Email\nHeadline: Inbox\nCTA: Open",
+        )
+        digest = ContextDigestTask(
+            name="context_digest",
+            description="digest",
+            expected_output="digest",
+            context=[copy],
+            channels=["social_media", "email"],
+        ).execute_sync()
+
+        assert "social_media — Headline: Hi" in digest.raw
+        assert "email — Headline: Inbox | CTA: Open" in digest.raw
+
+    def test_manager_reads_digest_not_raw_outputs(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        crew = CampaignCrew(sample_request)
+        contexts = {}
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            contexts[task.name] = context
+            if isinstance(task, (CopyMergeTask, ContextDigestTask)):
+                return task.execute_sync()
+            return _echo_runner(task, _RESEARCH)
+
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", runner)
+        monkeypatch.setattr(crew, "_save_outputs", lambda brief, raw: None)
+        crew.run()
+
+        stats = crew.compaction_stats()
+        assert stats["digest_tokens"] < stats["source_tokens"] / 2
+        assert contexts["campaign_strategy"] == crew.digest_task.output.raw
+        assert "digest" in crew.manager_task.description
+
+    def test_compaction_can_be_disabled(self, isolated_settings, sample_request, monkeypatch):
+        monkeypatch.setattr(
+            "src.workflow.crew_workflow.settings",
+            replace(isolated_settings, compact_context=False),
+        )
+        crew = CampaignCrew(sample_request)
+
+        assert crew.digest_task is None
+        assert crew.manager_task.context[-2:] == [crew.copy_task, crew.art_task]
+
+    def test_context_budgets_from_env(self, monkeypatch):
+        monkeypatch.setenv("CONTEXT_BUDGETS", "copywriting=900, visual_direction=200")
+        budgets = _context_budgets()
+        assert budgets["copywriting"] == 900
+        assert budgets["visual_direction"] == 200
+        assert budgets["market_research"] == DEFAULT_CONTEXT_BUDGETS["market_research"]
+
+        monkeypatch.setenv("CONTEXT_BUDGETS", "copywriting=lots")
+        with pytest.raises(EnvironmentError):
+            _context_budgets()
+
+
+class TestStructuredAnswers:
+    """Test JSON stage answers and the brief built from them"""
+
+    def test_answer_format_lists_requested_keys(self):
+        prompt = answer_format(MarketResearch, ("trends", "opportunities"))
+
+        assert '- "trends" (list of strings):' in prompt
+        assert '"opportunities"' in prompt
+        assert "market_summary" not in prompt
+
+    def test_parse_answer_ignores_fences_and_chatter(self):
+        raw = 'Here you go:\n```json\n{"headline": "Breathe",\n"cta": "Buy"}\n```'
+
+        assert parse_answer(raw, ChannelCopy) == ChannelCopy(
+            headline="Breathe", cta="Buy"
+        )
+
+    def test_parse_answer_rejects_invalid_or_empty_answers(self):
+        assert parse_answer("Headline: Breathe", ChannelCopy) is None
+        assert parse_answer('{"headline": ["a", "b"]}', ChannelCopy) is None
+        assert parse_answer('{"unrelated": 1}', ChannelCopy) is None
+
+    def test_structured_task_keeps_compact_json(self):
+        task = StructuredTask(
+            name="copywriting_email",
+            description="d",
+            expected_output="e",
+            output_schema=ChannelCopy,
+        )
+        raw = '```json\n{\n  "headline": "Breathe",\n  "body": ""\n}\n```'
+
+        output = task._structure(TaskOutput(description="d", raw=raw, agent="a"))
+
+        assert output.raw == '{"headline":"Breathe"}'
+        assert stage_model(output, ChannelCopy).headline == "Breathe"
+        assert stage_model(output, VisualDirection) is None
+
+    def test_merge_models_combines_split_research(self):
+        trends = MarketResearch(market_summary="Growing", trends=["a"])
+        rivals = MarketResearch(
+            market_summary="Crowded", trends=["b"], competitive_landscape={"X": "y"}
+        )
+
+        merged = merge_models(MarketResearch, [trends, None, rivals])
+
+        assert merged.market_summary == "Growing"
+        assert merged.trends == ["a", "b"]
+        assert merged.competitive_landscape == {"X": "y"}
+
+    def test_section_and_list_items(self):
+        raw = (
+            "# Brief\n## Timeline\n- **Week 1:** Teasers\n- Week 2: Launch\n"
+            "### Notes\n- Keep it light\n## KPIs\n1. CTR above 2%\n"
+        )
+
+        assert list_items(section(raw, "timeline")) == [
+            "Week 1: Teasers",
+            "Week 2: Launch",
+            "Keep it light",
+        ]
+        assert list_items(section(raw, "kpi", "metric")) == ["CTR above 2%"]
+        assert section(raw, "risk") == ""
+
+
+class TestEstimate:
+    """Test the dry-run cost and latency estimator"""
+
+    def test_estimate_covers_every_stage(self, isolated_settings, sample_request):
+        estimate = estimate_campaign(sample_request)
+        graph = CampaignTaskFactory(sample_request).build_graph(
+            context_budgets=isolated_settings.context_budgets
+        )
+
+        assert [s.name for s in estimate.stages] == [t.name for t in graph.tasks]
+        local = {s.name for s in estimate.stages if s.source == "local"}
+        assert local == {"copywriting", "context_digest"}
+        assert {s.source for s in estimate.stages} == {"local", "default"}
+        assert 0 < estimate.cost_usd <= estimate.max_cost_usd
+        assert estimate.llm_calls <= estimate.max_llm_calls
+        assert estimate.wall_seconds >= estimate.critical_path_seconds > 0
+
+    def test_more_channels_cost_more(self, isolated_settings, sample_request):
+        one = sample_request.model_copy(update={"channels": [CampaignChannel.EMAIL]})
+        assert (
+            estimate_campaign(one).total_tokens
+            < estimate_campaign(sample_request).total_tokens
+        )
+
+    def test_history_overrides_defaults(self, isolated_settings, sample_request):
+        trace = {
+            "stages": [
+                {"name": "market_research", "status": "ran", "llm_calls": 9,
+                 "completion_tokens": 3000, "seconds": 25.0,
+                 "rate_limit_wait": 5.0},
+                {"name": "competitor_analysis", "status": "reused",
+                 "llm_calls": 0, "completion_tokens": 0, "seconds": 0.0},
+            ]
+        }
+        (isolated_settings.output_dir / "x_trace.json").write_text(
+            json.dumps(trace), encoding="utf-8"
+        )
+
+        stages = {s.name: s for s in estimate_campaign(sample_request).stages}
+
+        research = stages["market_research"]
+        assert research.source == "history"
+        assert research.llm_calls == research.max_iter == 5  # capped
+        assert research.seconds == 20.0
+        assert stages["competitor_analysis"].source == "default"
+
+    def test_estimate_is_fast(self, isolated_settings, sample_request):
+        estimate_campaign(sample_request)  # warm up
+        start = time.perf_counter()
+        estimate_campaign(sample_request)
+        assert time.perf_counter() - start < 0.1
+
+    def test_batch_respects_rate_limits(self, isolated_settings, sample_request, monkeypatch):
+        monkeypatch.setattr(
+            "src.workflow.estimate.settings",
+            replace(isolated_settings, groq_tpm=1000, groq_rpm=0),
+        )
+        batch = estimate_batch([sample_request] * 3, workers=8)
+
+        assert batch.workers == 3
+        assert batch.wall_seconds == pytest.approx(batch.total_tokens / 1000 * 60)
+        assert batch.cost_usd == pytest.approx(3 * batch.campaigns[0].cost_usd)
+
+
+def _chunk(task: Task, text: str) -> LLMStreamChunkEvent:
+    return LLMStreamChunkEvent(chunk=text, from_task=task, call_id="call")
+
+
+class TestStreaming:
+    """Test live token forwarding to the in-progress Markdown file"""
+
+    def test_recorder_appends_labelled_chunks(self, tmp_path):
+        trend, rivals = _task("trend"), _task("rivals")
+        path = tmp_path / "run.live.md"
+
+        with StreamRecorder([trend, rivals], path):
+            crewai_event_bus.emit(trend, _chunk(trend, "Smart "))
+            crewai_event_bus.emit(trend, _chunk(trend, "homes"))
+            crewai_event_bus.emit(rivals, _chunk(rivals, "Dyson"))
+            crewai_event_bus.emit(trend, _chunk(trend, " rise"))
+
+        assert path.read_text(encoding="utf-8") == (
+            "\n\n## trend\n\nSmart homes"
+            "\n\n## rivals\n\nDyson"
+            "\n\n## trend\n\n rise"
+        )
+
+    def test_recorder_ignores_other_campaigns_and_detaches(self, tmp_path):
+        mine, theirs = _task("mine"), _task("theirs")
+        path = tmp_path / "run.live.md"
+
+        with StreamRecorder([mine], path):
+            crewai_event_bus.emit(theirs, _chunk(theirs, "not mine"))
+        crewai_event_bus.emit(mine, _chunk(mine, "after exit"))
+
+        assert path.read_text(encoding="utf-8") == ""
+
+    def test_stream_flag_enables_llm_streaming(self, sample_request):
+        crew = CampaignCrew(sample_request, stream=True)
+        assert all(agent.llm.stream for agent in crew.agents)
+        assert crew.live_path.name == f"{crew.run_id}.live.md"
+
+
+class TestCheckpointing:
+    """Test stage checkpoints and resuming failed runs"""
+
+    def test_store_round_trips_request_and_stage(
+        self, isolated_settings, sample_request
+    ):
+        store = CheckpointStore.create(sample_request, concurrent=False)
+        store.save("copywriting", _echo_runner(_task("copywriting"), "ctx"))
+
+        reopened = CheckpointStore.open(store.run_id)
+        request, concurrent = reopened.load_run()
+
+        assert request == sample_request
+        assert concurrent is False
+        assert reopened.load("copywriting").raw == "copywriting<ctx>"
+        assert reopened.load("visual_direction") is None
+
+    def test_open_unknown_run_raises(self, isolated_settings):
+        with pytest.raises(CheckpointError):
+            CheckpointStore.open("no_such_run")
+
+    def test_scheduler_skips_completed_tasks(self):
+        trend, copy = _task("trend"), _task("copy")
+        copy.context = [trend]
+        restored = _echo_runner(trend, "from disk")
+        ran, finished = [], []
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            ran.append(task.name)
+            return _echo_runner(task, context)
+
+        outputs = DagScheduler(
+            [trend, copy],
+            runner=runner,
+            completed={trend: restored},
+            on_complete=lambda task, output: finished.append(task.name),
+        ).run()
+
+        assert ran == finished == ["copy"]
+        assert outputs[-1].raw == "copy<trend<from disk>>"
+
+    def test_resume_reruns_only_incomplete_stages(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        crew = CampaignCrew(sample_request)
+        store = CheckpointStore.create(
+            sample_request, concurrent=True, run_id=crew.run_id
+        )
+        store.save("market_research", _echo_runner(crew.research_task, ""))
+        store.save("competitor_analysis", _echo_runner(crew.competitor_task, ""))
+
+        ran = []
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            ran.append(task.name)
+            return _echo_runner(task, context)
+
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", runner)
+        resumed = CampaignCrew.resume(crew.run_id)
+        monkeypatch.setattr(resumed, "_save_outputs", lambda brief, raw: None)
+        resumed.run()
+
+        assert "market_research" not in ran
+        assert "competitor_analysis" not in ran
+        assert ran[-3:] == [
+            "visual_direction",
+            "context_digest",
+            "campaign_strategy",
+        ]
+        assert not store.path.exists()  # a finished run needs no resume
+
+
+class TestIncrementalRegeneration:
+    """Test fingerprint-based reuse of unchanged stages"""
+
+    def test_fingerprint_tracks_fields_each_stage_reads(self, sample_request):
+        playful = sample_request.model_copy(update={"brand_voice": CopyTone.PLAYFUL})
+        before, after = CampaignTaskFactory(sample_request), CampaignTaskFactory(playful)
+        research = _task("research")
+
+        assert fingerprint(before.trend_research_task(None), "") == fingerprint(
+            after.trend_research_task(None), ""
+        )
+        assert fingerprint(
+            before.copywriting_task(None, research), "r"
+        ) != fingerprint(after.copywriting_task(None, research), "r")
+
+    def test_fingerprint_includes_upstream_context(self):
+        task = _task("copy")
+        assert fingerprint(task, "trends v1") != fingerprint(task, "trends v2")
+
+    def test_rerun_recomputes_only_affected_stages(self, tmp_path):
+        cache = StageCache(tmp_path)
+        ran = []
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            ran.append(task.name)
+            return _echo_runner(task, task.description + context)
+
+        def build(copy_prompt: str) -> list[Task]:
+            trend = _task("trend")
+            copy = Task(
+                name="copy",
+                description=copy_prompt,
+                expected_output="text",
+                context=[trend],
+            )
+            return [trend, copy, _task("brief", [trend, copy])]
+
+        first = DagScheduler(build("professional"), runner=runner, cache=cache)
+        first.run()
+        assert first.reused == []
+
+        ran.clear()
+        second = DagScheduler(build("playful"), runner=runner, cache=cache)
+        second.run()
+        assert [t.name for t in second.reused] == ["trend"]
+        assert ran == ["copy", "brief"]
+
+        ran.clear()
+        third = DagScheduler(build("playful"), runner=runner, cache=cache)
+        third.run()
+        assert [t.name for t in third.reused] == ["trend", "copy", "brief"]
+        assert ran == []
+
+    def test_identical_upstream_output_keeps_downstream_cached(self, tmp_path):
+        cache = StageCache(tmp_path)
+
+        def build(copy_prompt: str) -> list[Task]:
+            trend = _task("trend")
+            copy = Task(
+                name="copy",
+                description=copy_prompt,
+                expected_output="text",
+                context=[trend],
+            )
+            return [trend, copy, _task("brief", [trend, copy])]
+
+        DagScheduler(build("v1"), runner=_echo_runner, cache=cache).run()
+        rerun = DagScheduler(build("v2"), runner=_echo_runner, cache=cache)
+        rerun.run()
+
+        # copy reran but produced the same text, so brief is still valid
+        assert [t.name for t in rerun.reused] == ["trend", "brief"]
+
+    def test_expired_entries_are_not_reused(self, tmp_path):
+        cache = StageCache(tmp_path, max_age=timedelta(hours=1))
+        trend = _task("trend")
+        cache.put(trend, "", _echo_runner(trend, ""))
+        assert cache.get(trend, "") is not None
+
+        (entry,) = tmp_path.glob("*.json")
+        two_hours_ago = time.time() - 7200
+        os.utime(entry, (two_hours_ago, two_hours_ago))
+
+        assert cache.get(trend, "") is None
+        assert not entry.exists()
+
+    def test_oldest_entries_are_evicted(self, tmp_path):
+        cache = StageCache(tmp_path, max_entries=2)
+        tasks = [_task(f"stage{i}") for i in range(3)]
+        for age, task in zip((30, 20), tasks):
+            cache.put(task, "", _echo_runner(task, ""))
+            written = time.time() - age
+            os.utime(tmp_path / f"{fingerprint(task, '')}.json", (written, written))
+
+        cache.put(tasks[2], "", _echo_runner(tasks[2], ""))
+
+        assert len(list(tmp_path.glob("*.json"))) == 2
+        assert cache.get(tasks[0], "") is None
+        assert cache.get(tasks[1], "") is not None
+
+
+class TestBatchMode:
+    """Test JSONL batch loading and the bounded worker pool"""
+
+    def test_load_requests_skips_invalid_lines(self, tmp_path, sample_request):
+        path = tmp_path / "requests.jsonl"
+        path.write_text(
+            sample_request.model_dump_json() + "\n"
+            "\n"
+            '{"product_name": "X", "channels": ["carrier_pigeon"]}\n'
+            "not json\n",
+            encoding="utf-8",
+        )
+
+        items, errors = load_requests(path)
+
+        assert [item.line for item in items] == [1]
+        assert items[0].request == sample_request
+        assert len(errors) == 2
+        assert errors[0].startswith("line 3")
+
+    def test_run_batch_bounds_concurrency_and_records_failures(
+        self, tmp_path, sample_request
+    ):
+        path = tmp_path / "requests.jsonl"
+        lines = [
+            sample_request.model_copy(update={"product_name": f"SKU {i}"})
+            for i in range(6)
+        ]
+        path.write_text(
+            "\n".join(r.model_dump_json() for r in lines), encoding="utf-8"
+        )
+        items, _ = load_requests(path)
+
+        lock = threading.Lock()
+        in_flight, peak = 0, 0
+
+        def runner(request):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            if request.product_name == "SKU 3":
+                raise RuntimeError("429 Too Many Requests")
+
+        seen = []
+        report = run_batch(items, workers=2, runner=runner, on_result=seen.append)
+
+        assert peak == 2
+        assert len(seen) == 6
+        assert len(report.succeeded) == 5
+        assert report.failed[0].error == "429 Too Many Requests"
+        assert report.campaigns_per_minute > 0
+        assert report.p50_seconds <= report.p95_seconds
+
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 21)]
+        assert percentile(values, 50) == 10.0
+        assert percentile(values, 95) == 19.0
+        assert percentile([], 95) == 0.0
+
+
+def _llm_call(task: Task, prompt: int, completion: int) -> LLMCallCompletedEvent:
+    return LLMCallCompletedEvent(
+        from_task=task,
+        call_id="call",
+        response="ok",
+        call_type=LLMCallType.LLM_CALL,
+        usage={"prompt_tokens": prompt, "completion_tokens": completion},
+    )
+
+
+class TestTracing:
+    """Test per-stage timing, token and cost traces"""
+
+    def test_tracer_attributes_calls_to_their_stage(self):
+        trend = _task("trend")
+        copy = _task("copy", [trend])
+        other = _task("other")
+        scheduler = DagScheduler([trend, copy], runner=_echo_runner)
+
+        with RunTracer("run", scheduler) as tracer:
+            crewai_event_bus.emit(trend, _llm_call(trend, 100, 20))
+            crewai_event_bus.emit(trend, _llm_call(trend, 150, 30))
+            crewai_event_bus.emit(copy, _llm_call(copy, 50, 10))
+            crewai_event_bus.emit(other, _llm_call(other, 999, 999))
+            scheduler.run()
+
+        stages = {s.name: s for s in tracer.stages}
+        assert stages["trend"].llm_calls == 2
+        assert stages["trend"].prompt_tokens == 250
+        assert stages["trend"].completion_tokens == 50
+        assert stages["copy"].total_tokens == 60
+        assert tracer.to_dict()["totals"]["prompt_tokens"] == 300
+
+    def test_stage_status_and_timing(self):
+        trend = _task("trend")
+        copy = _task("copy", [trend])
+        restored = _echo_runner(trend, "")
+
+        def slow_runner(task: Task, context: str) -> TaskOutput:
+            time.sleep(0.05)
+            return _echo_runner(task, context)
+
+        scheduler = DagScheduler(
+            [trend, copy], runner=slow_runner, completed={trend: restored}
+        )
+        with RunTracer("run", scheduler) as tracer:
+            scheduler.run()
+
+        trend_trace, copy_trace = tracer.stages
+        assert trend_trace.status == "restored"
+        assert trend_trace.seconds == 0.0
+        assert copy_trace.status == "ran"
+        assert copy_trace.seconds >= 0.05
+
+    def test_estimate_cost_uses_model_prices(self):
+        cost = estimate_cost("groq/llama-3.3-70b-versatile", 1_000_000, 1_000_000)
+        assert cost == pytest.approx(0.59 + 0.79)
+        assert estimate_cost("unknown-model", 10, 10) is None
+
+    def test_crew_run_writes_trace_next_to_outputs(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", _echo_runner)
+        crew = CampaignCrew(sample_request, concurrent=False)
+        crew.run()
+
+        trace_path = crew.output_base.with_name(
+            f"{crew.output_base.name}_trace.json"
+        )
+        trace = json.loads(trace_path.read_text(encoding="utf-8"))
+        assert trace["run_id"] == crew.run_id
+        assert [s["name"] for s in trace["stages"]] == [
+            t.name for t in crew.tasks
+        ]
+        assert {s["status"] for s in trace["stages"]} == {"ran"}
+
+
+class TestOfflineRuns:
+    """Test complete workflow runs against the fake LLM"""
+
+    def test_concurrent_run_end_to_end(self, fake_llm, sample_request):
+        crew = CampaignCrew(sample_request)
+        brief = crew.run()
+
+        stages = {s.name: s for s in crew.trace.stages}
+        assert {s.status for s in stages.values()} == {"ran"}
+        assert stages["market_research"].tool_calls == 1
+        assert stages["copywriting_email"].tool_calls == 1
+        assert stages["campaign_strategy"].llm_calls == 1
+        assert all(s.cost_usd is None for s in stages.values())
+        assert brief.final_recommendations.startswith("# Campaign Brief: AeroFlow Pro")
+        assert set(brief.copy_package.channel_copy) == {
+            c.value for c in sample_request.channels
+        }
+        assert crew.compaction_stats()["digest_tokens"] > 0
+        # Every part of the brief comes from a parsed stage, none is a stub
+        assert brief.research.trends and brief.research.competitive_landscape
+        assert brief.copy_package.campaign_tagline.startswith("AeroFlow Pro")
+        assert brief.visuals.key_visuals
+        assert brief.executive_summary.startswith("AeroFlow Pro launches")
+        assert len(brief.implementation_timeline) == 3
+        assert len(brief.success_metrics) == 3
+        assert len(brief.risk_factors) == 2
+        assert "See full Markdown" not in brief.model_dump_json()
+        # Offline traces must not skew cost estimates for real runs
+        assert load_history(fake_llm.output_dir) == {}
+
+    def test_sequential_run_parses_channel_sections(
+        self, fake_llm, sample_request
+    ):
+        crew = CampaignCrew(sample_request, concurrent=False)
+        brief = crew.run()
+
+        assert [t.name for t in crew.tasks][-1] == "campaign_strategy"
+        digest = crew.digest_task.output.raw
+        assert all(c.value in digest for c in sample_request.channels)
+        assert brief.request == sample_request
+        assert set(brief.copy_package.channel_copy) == {
+            c.value for c in sample_request.channels
+        }
+        assert brief.research.market_summary
+
+    @pytest.mark.asyncio
+    async def test_async_run_end_to_end(self, fake_llm, sample_request):
+        brief = await CampaignCrew(sample_request).run_async()
+
+        assert "AeroFlow Pro" in brief.final_recommendations
+
+
+class TestModelRouting:
+    """Test per-agent / per-task models and the fallback to a bigger one"""
+
+    @pytest.fixture
+    def routed(self, fake_llm, monkeypatch):
+        routed = replace(
+            fake_llm,
+            agent_models={"researcher": "small", "art_director": "small"},
+            task_models={"copywriting_email": "tiny"},
+        )
+        for module in (
+            "src.agents.base_agent",
+            "src.agents.fake_llm",
+            "src.workflow.crew_workflow",
+            "src.workflow.estimate",
+            "src.workflow.routing",
+        ):
+            monkeypatch.setattr(f"{module}.settings", routed)
+        return routed
+
+    def test_model_map_from_env(self, monkeypatch):
+        monkeypatch.setenv("AGENT_MODELS", "researcher = small, manager=big")
+        assert _model_map("AGENT_MODELS") == {"researcher": "small", "manager": "big"}
+
+        monkeypatch.setenv("AGENT_MODELS", "researcher")
+        with pytest.raises(EnvironmentError):
+            _model_map("AGENT_MODELS")
+
+    def test_task_route_beats_agent_route_beats_default(self, routed, monkeypatch):
+        routed = replace(routed, task_models={"copywriting_*": "tiny"})
+        monkeypatch.setattr("src.workflow.routing.settings", routed)
+
+        assert model_for("copywriter", "copywriting_email") == "tiny"
+        assert model_for("researcher", "market_research") == "small"
+        assert model_for("manager", "campaign_strategy") == routed.groq_model
+
+    def test_weak_output_reasons(self, fake_llm):
+        task = Task(name="copywriting_email", description="d", expected_output="e")
+
+        def reason(raw: str) -> str | None:
+            return weak_output(task, TaskOutput(description="d", raw=raw, agent="a"))
+
+        assert reason("") == "empty answer"
+        assert reason("too short") == "short answer (9 chars)"
+        assert reason('<function=copy_evaluator>{"copy_text": "x"}' + "." * 80)
+        assert reason("Body: " + "words " * 30) == "channel copy without a headline"
+        assert reason("Headline: Hi\nBody: " + "words " * 30) is None
+
+    def test_weak_output_rejects_answers_that_are_not_json(self, fake_llm):
+        task = StructuredTask(
+            name="visual_direction",
+            description="d",
+            expected_output="e",
+            output_schema=VisualDirection,
+        )
+        raw = "## Visual identity\n" + "Calm whites and one accent. " * 5
+        output = task._structure(TaskOutput(description="d", raw=raw, agent="a"))
+
+        assert weak_output(task, output) == "answer is not VisualDirection JSON"
+
+    def test_agents_are_built_on_their_routed_model(self, routed, sample_request):
+        crew = CampaignCrew(sample_request)
+        crew.release_agents()
+
+        models = {t.name: t.agent.llm.model for t in crew.tasks}
+        assert models["market_research"] == "fake/small"
+        assert models["visual_direction"] == "fake/small"
+        assert models["copywriting_email"] == "fake/tiny"
+        assert models["copywriting_social_media"] == f"fake/{routed.groq_model}"
+        assert models["campaign_strategy"] == f"fake/{routed.groq_model}"
+
+    def test_pool_keeps_models_apart(self, fake_llm):
+        pool = AgentPool()
+        small = pool.acquire(create_research_agent, "small")
+        pool.release(small)
+
+        assert pool.acquire(create_research_agent) is not small
+        assert pool.acquire(create_research_agent, "small") is small
+
+    def test_runner_falls_back_on_failure_and_restores_the_agent(
+        self, fake_llm, monkeypatch
+    ):
+        agent = create_research_agent("small")
+        task = Task(
+            name="market_research", description="d", expected_output="e", agent=agent
+        )
+        served = []
+
+        def flaky(task: Task, context: str) -> TaskOutput:
+            served.append(task.agent.llm.model)
+            if task.agent.llm.model == "fake/small":
+                raise ValueError("tool call loop")
+            return TaskOutput(description="d", raw="A full answer. " * 10, agent="a")
+
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", flaky)
+        router = FallbackRunner()
+        router(task, "")
+
+        assert served == ["fake/small", f"fake/{fake_llm.groq_model}"]
+        assert router.fallbacks == {task: "failed with ValueError"}
+        assert agent.llm.model == "fake/small"
+
+    def test_weak_stage_is_rerun_and_traced(
+        self, routed, sample_request, tmp_path, monkeypatch
+    ):
+        script = tmp_path / "script.json"
+        script.write_text(json.dumps({"market_research": ["Trends: up."]}))
+        monkeypatch.setattr(
+            "src.agents.fake_llm.settings",
+            replace(routed, fake_llm_script=str(script)),
+        )
+
+        crew = CampaignCrew(sample_request)
+        crew.run()
+
+        stages = {s.name: s for s in crew.trace.stages}
+        research = stages["market_research"]
+        assert research.fallback == "short answer (11 chars)"
+        assert research.model == f"fake/{routed.groq_model}"
+        assert research.llm_calls == 2
+        assert stages["competitor_analysis"].model == "fake/small"
+        assert stages["competitor_analysis"].fallback is None
+        assert crew.researcher.llm.model == "fake/small"
+
+    def test_fallback_outputs_are_not_cached(
+        self, routed, sample_request, tmp_path, monkeypatch
+    ):
+        script = tmp_path / "script.json"
+        script.write_text(json.dumps({"market_research": ["Trends: up."]}))
+        monkeypatch.setattr(
+            "src.agents.fake_llm.settings",
+            replace(routed, fake_llm_script=str(script)),
+        )
+        CampaignCrew(sample_request).run()
+
+        rerun = CampaignCrew(sample_request)
+        rerun.run()
+
+        reused = {s.name for s in rerun.trace.stages if s.status == "reused"}
+        assert "market_research" not in reused  # retried on the routed model
+        assert "competitor_analysis" in reused
+
+    def test_estimate_prices_each_stage_on_its_model(
+        self, routed, sample_request
+    ):
+        estimate = estimate_campaign(sample_request, history={})
+        models = {s.name: s.model for s in estimate.stages}
+
+        assert models["market_research"] == "groq/small"
+        assert models["copywriting_email"] == "groq/tiny"
+        assert models["campaign_strategy"] == f"groq/{routed.groq_model}"
+
+    def test_max_cost_fails_when_some_stages_are_unpriced(
+        self, routed, sample_request
+    ):
+        from src.main import estimate_request
+
+        estimate = estimate_campaign(sample_request, history={})
+
+        assert "copywriting_email" in estimate.unpriced_stages
+        assert "campaign_strategy" not in estimate.unpriced_stages
+        assert estimate.cost_usd is None
+        assert estimate.partial_cost_usd > 0
+        with pytest.raises(SystemExit) as exit_info:
+            estimate_request(sample_request, concurrent=True, max_cost=1000)
+        assert exit_info.value.code == 2
+
+
+class TestAgentReuse:
+    """Test that campaigns borrow and return pooled agents"""
+
+    def test_back_to_back_campaigns_reuse_agents(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        monkeypatch.setattr("src.workflow.crew_workflow.agent_pool", AgentPool())
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", _echo_runner)
+
+        first = CampaignCrew(sample_request, concurrent=False)
+        first.run()
+        second = CampaignCrew(sample_request, concurrent=False)
+
+        assert [id(a) for a in second.agents] == [id(a) for a in first.agents]
+
+    def test_agents_of_timed_out_stages_are_not_pooled(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        pool = AgentPool()
+        monkeypatch.setattr("src.workflow.crew_workflow.agent_pool", pool)
+        monkeypatch.setattr(
+            "src.workflow.crew_workflow.settings",
+            replace(isolated_settings, stage_timeout=0.2),
+        )
+        release = threading.Event()
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            if task.name == "market_research":
+                release.wait(10)  # still running after the deadline
+            return _echo_runner(task, context)
+
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", runner)
+        crew = CampaignCrew(sample_request)
+        try:
+            with pytest.raises(StageTimeoutError):
+                crew.run()
+            idle = [agent for agents in pool._idle.values() for agent in agents]
+        finally:
+            release.set()
+
+        assert all(agent is not crew.researcher for agent in idle)
+        assert pool.idle_count() == len(crew.agents) - 1
+
+    def test_agents_are_returned_when_a_run_fails(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        pool = AgentPool()
+        monkeypatch.setattr("src.workflow.crew_workflow.agent_pool", pool)
+
+        def failing(task: Task, context: str) -> TaskOutput:
+            raise RuntimeError("rate limited")
+
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", failing)
+        crew = CampaignCrew(sample_request, concurrent=False)
+        with pytest.raises(RuntimeError):
+            crew.run()
+
+        assert pool.idle_count() == len(crew.agents)
+
+
+class TestRateLimitOwners:
+    """Test per-campaign fair queuing of LLM calls"""
+
+    def test_each_campaign_queues_under_its_run_id(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        limiter = RateLimiter(rpm=10_000, tpm=0)
+        monkeypatch.setattr("src.agents.rate_limiter.rate_limiter", limiter)
+        monkeypatch.setattr("src.workflow.tracing.rate_limiter", limiter)
+        monkeypatch.setattr("src.workflow.crew_workflow.agent_pool", AgentPool())
+        monkeypatch.setattr(LLM, "call", lambda self, *a, **k: "ok")
+        owners: dict[str, set[str]] = {}
+        acquire = limiter.acquire
+
+        def recording(tokens=0, owner="default", key=None):
+            owners.setdefault(owner, set()).add(key)
+            return acquire(tokens, owner, key)
+
+        monkeypatch.setattr(limiter, "acquire", recording)
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            if task.agent is not None:
+                task.agent.llm.call(task.description, from_task=task)
+            return _echo_runner(task, context)
+
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", runner)
+        crews = [
+            CampaignCrew(
+                sample_request.model_copy(update={"product_name": name})
+            )
+            for name in ("AeroFlow", "PureBreeze")
+        ]
+        for crew in crews:
+            monkeypatch.setattr(crew, "_save_outputs", lambda brief, raw: None)
+        threads = [threading.Thread(target=crew.run) for crew in crews]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        assert set(owners) == {crew.run_id for crew in crews}
+        for crew in crews:
+            assert owners[crew.run_id] == {
+                str(task.id) for task in crew.tasks if task.agent is not None
+            }
+        assert limiter._waits == {}  # dropped once each trace was taken
+
+
+class TestCategoryResearch:
+    """Test research sharing between campaigns in the same category"""
+
+    def test_normalize_category(self):
+        assert normalize_category("Air-Purifiers ") == "air_purifier"
+        assert normalize_category("air purifier") == "air_purifier"
+        assert normalize_category("Fitness & Wellness") == "fitness_wellness"
+
+    def test_store_honours_freshness_window(self, tmp_path):
+        store = ResearchStore(root=tmp_path, max_age=timedelta(days=7))
+        store.put(
+            CategoryResearch(
+                category="Air Purifiers",
+                product_name="AeroFlow",
+                stages={"market_research": "trends"},
+            )
+        )
+        assert store.get("air purifier").stages == {"market_research": "trends"}
+
+        stale = (datetime.now() - timedelta(days=8)).isoformat()
+        store.put(CategoryResearch("air purifiers", "Old", saved_at=stale))
+        assert store.get("air purifiers") is None
+
+    def test_first_campaign_stores_and_next_one_is_seeded(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", _echo_runner)
+        first = CampaignCrew(
+            sample_request.model_copy(update={"category": "Air Purifiers"})
+        )
+        assert first.category_research is None
+        first.run()
+
+        second = CampaignCrew(
+            sample_request.model_copy(
+                update={"product_name": "PureBreeze", "category": "air purifier"}
+            )
+        )
+        seed = second.category_research
+        assert seed.product_name == "AeroFlow Pro"
+        assert seed.stages["competitor_analysis"] == "competitor_analysis<>"
+        assert "Category research on file" in second.research_task.description
+        assert "competitor_analysis<>" in second.competitor_task.description
+        assert "specific to PureBreeze" in second.research_task.description
+
+    def test_uncategorised_or_fresh_runs_are_not_seeded(
+        self, isolated_settings, sample_request
+    ):
+        ResearchStore().put(
+            CategoryResearch("air purifiers", "AeroFlow", {"market_research": "x"})
+        )
+        plain = CampaignCrew(sample_request)
+        fresh = CampaignCrew(
+            sample_request.model_copy(update={"category": "air purifiers"}),
+            seed_research=False,
+        )
+        assert plain.research_store is None
+        assert fresh.category_research is None
+        assert "Category research" not in fresh.research_task.description
+
+    def test_seeded_prompts_carry_stored_tool_results(
+        self, isolated_settings, sample_request
+    ):
+        ResearchStore().put(
+            CategoryResearch(
+                "air purifiers",
+                "AeroFlow",
+                {"market_research": "trends"},
+                tool_results=[
+                    {
+                        "tool": "trend_research",
+                        "args": {"query": "air purifiers"},
+                        "output": "Stored trend report",
+                    },
+                    {
+                        "tool": "competitor_analysis",
+                        "args": {"product": "air purifiers"},
+                        "output": "Stored competitor report",
+                    },
+                ],
+            )
+        )
+
+        crew = CampaignCrew(
+            sample_request.model_copy(update={"category": "air purifiers"})
+        )
+
+        assert "Stored trend report" in crew.research_task.description
+        assert '{"query": "air purifiers"}' in crew.research_task.description
+        assert "Stored competitor report" not in crew.research_task.description
+        assert "Stored competitor report" in crew.competitor_task.description
+
+    def test_claim_waits_for_the_first_writer(self, tmp_path):
+        writer = ResearchStore(root=tmp_path)
+        assert writer.claim("air purifiers") is None
+
+        seeds = []
+        waiters = [
+            threading.Thread(
+                target=lambda: seeds.append(
+                    ResearchStore(root=tmp_path).claim("Air Purifier", timeout=5)
+                )
+            )
+            for _ in range(3)
+        ]
+        for thread in waiters:
+            thread.start()
+        time.sleep(0.05)
+        assert seeds == []  # still waiting on the writer
+
+        writer.put(CategoryResearch("air purifiers", "AeroFlow", {"x": "y"}))
+        for thread in waiters:
+            thread.join(5)
+
+        assert [seed.product_name for seed in seeds] == ["AeroFlow"] * 3
+
+    def test_released_claim_passes_to_one_waiter(self, tmp_path):
+        first = ResearchStore(root=tmp_path)
+        assert first.claim("air purifiers") is None
+        first.release("air purifiers")  # e.g. its research failed
+
+        second = ResearchStore(root=tmp_path)
+        assert second.claim("air purifiers") is None
+        first.release("air purifiers")  # not first's claim any more
+
+        assert ResearchStore(root=tmp_path).claim("air purifiers", timeout=0.05) is None
+        second.release("air purifiers")
+
+    def test_same_category_batch_researches_once(
+        self, isolated_settings, sample_request, monkeypatch
+    ):
+        monkeypatch.setattr("src.workflow.crew_workflow.agent_pool", AgentPool())
+        researched = []
+
+        def runner(task: Task, context: str) -> TaskOutput:
+            if task.name == "market_research":
+                researched.append("Category research" not in task.description)
+                time.sleep(0.05)
+            return _echo_runner(task, context)
+
+        monkeypatch.setattr("src.workflow.scheduler._execute_task", runner)
+        items = [
+            BatchItem(
+                line=i,
+                request=sample_request.model_copy(
+                    update={"product_name": f"SKU {i}", "category": "air purifiers"}
+                ),
+            )
+            for i in range(3)
+        ]
+
+        report = run_batch(items, workers=3)
+
+        assert len(report.succeeded) == 3
+        assert sorted(researched) == [False, False, True]  # one from scratch
+
+    def test_recorder_keeps_research_tool_results_of_its_tasks(self):
+        mine, other = _task("market_research"), _task("other")
+        now = datetime.now()
+
+        def finished(task: Task, tool: str) -> ToolUsageFinishedEvent:
+            return ToolUsageFinishedEvent(
+                from_task=task,
+                tool_name=tool,
+                tool_args={"query": "air purifiers"},
+                started_at=now,
+                finished_at=now,
+                output=f"{tool} output",
+            )
+
+        with ToolResultRecorder([mine]) as recorder:
+            crewai_event_bus.emit(mine, finished(mine, "trend_research"))
+            crewai_event_bus.emit(mine, finished(mine, "copy_evaluation"))
+            crewai_event_bus.emit(other, finished(other, "trend_research"))
+
+        assert recorder.results == [
+            {
+                "tool": "trend_research",
+                "args": {"query": "air purifiers"},
+                "output": "trend_research output",
+            }
+        ]